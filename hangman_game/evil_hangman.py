@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Evil Hangman - Hangman Game
+===========================
+
+A Hangman game that avoids committing to a word for as long as it can.
+
+Instead of one secret word, the game keeps every dictionary word of the chosen
+length that is still consistent with the guesses so far. On each new guess those
+candidates are split into families by where the guessed letter appears, and the
+game moves to the largest family, preferring to say the letter is absent. The
+player sees an ordinary game: make_guess and display_word behave as usual.
+
+Families are found with the bitmask index of the solver: the candidates are one
+integer bit set, and splitting them by the guessed letter takes one AND per
+unrevealed position and family, keyed by an integer whose bit p is set when the
+letter is at position p. Nothing is rescanned word by word, so even large
+dictionaries answer a guess in milliseconds.
+
+Author: CodeAlpha Intern
+Date: September 2025
+"""
+
+import random
+
+from hangman import DEFAULT_WORDS, LETTER_BITS, HangmanGame
+from hangman_solver import LETTER_SET, WordGroup, popcount
+
+
+class WordGroups:
+    """Words bucketed by length and indexed on first use, shared by any number of games."""
+    
+    def __init__(self, corpus=None, words=DEFAULT_WORDS, difficulty=None):
+        """Draw words from a WordCorpus (optionally of one difficulty), or from a plain list."""
+        self.corpus = corpus
+        self.words = words
+        self.difficulty = difficulty
+        self._groups = {}
+    
+    def lengths(self):
+        """Return the word lengths available, shortest first."""
+        if self.corpus is not None:
+            return [length for length in self.corpus.lengths()
+                    if self.corpus.count(length, self.difficulty)]
+        return sorted({len(word) for word in self.words})
+    
+    def group(self, length):
+        """Return the WordGroup of one length, or None if there are no such words."""
+        if length not in self._groups:
+            if self.corpus is not None:
+                source = self.corpus.words(length, self.difficulty)
+            else:
+                source = (word for word in self.words if len(word) == length)
+            words = sorted({word.upper() for word in source})
+            words = [word for word in words if LETTER_SET.issuperset(word)]
+            self._groups[length] = WordGroup(length, words) if words else None
+        return self._groups[length]
+
+
+def partition(group, candidates, letter, revealed=()):
+    """Split candidates by the positions of letter; return {position key: member bit set}.
+    
+    Bit p of a key is set when the family has the letter at position p, so key 0
+    is the family without the letter. Positions in revealed are skipped: they
+    already show another letter in every candidate.
+    """
+    families = {0: candidates}
+    masks = group.position_masks
+    for position in range(group.length):
+        if position in revealed:
+            continue
+        mask = masks[position][letter]
+        if not candidates & mask:
+            continue
+        bit = 1 << position
+        split = {}
+        for key, members in families.items():
+            inside = members & mask
+            if inside:
+                split[key | bit] = inside
+                members ^= inside
+            if members:
+                split[key] = members
+        families = split
+    return families
+
+
+def choose_family(families):
+    """Return (key, members) of the family to keep.
+    
+    That is the largest family; on a tie, the one without the letter, then the one
+    revealing it in the fewest positions.
+    """
+    return max(families.items(), key=lambda family: (popcount(family[1]), family[0] == 0,
+                                                     -popcount(family[0])))
+
+
+class EvilHangmanGame(HangmanGame):
+    """A HangmanGame whose word keeps changing to the largest family of candidates."""
+    
+    __slots__ = ('word_groups', 'candidates', '_group')
+    
+    def __init__(self, word_groups, word_length=None, quiet=False):
+        """Play with words from a shared WordGroups, optionally of one length only."""
+        self.word_groups = word_groups
+        self.candidates = 0
+        self._group = None
+        super().__init__(word_groups.corpus, word_length, word_groups.difficulty, quiet=quiet)
+    
+    def reset_game(self, word=None):
+        """Start a new game with every word of the length as a candidate.
+        
+        The length is that of word if given, else word_length, else random.
+        """
+        if word is not None:
+            length = len(word)
+        elif self.word_length is not None:
+            length = self.word_length
+        else:
+            lengths = self.word_groups.lengths()
+            if not lengths:
+                raise ValueError("No words match the requested length and difficulty")
+            length = random.choice(lengths)
+        
+        group = self.word_groups.group(length)
+        if group is None:
+            raise ValueError(f"No words of length {length}")
+        # The base game tracks the pattern, lives and result; its word is only a stand-in
+        super().reset_game(group.words[random.randrange(len(group.words))])
+        self._group = group
+        self.candidates = group.all_words
+    
+    def make_guess(self, letter):
+        """Process a letter guess, first moving to the largest family of candidates."""
+        bit = LETTER_BITS.get(letter.upper(), 0)
+        if bit and not self.guess_mask & bit and self._group is not None:
+            self._switch_family(letter.upper())
+        return super().make_guess(letter)
+    
+    def _switch_family(self, letter):
+        """Keep the best family for a new guess and take one of its words as the word."""
+        display = self.display_word()
+        revealed = {i for i in range(len(self.word)) if display[2 * i] != '_'}
+        _, self.candidates = choose_family(partition(self._group, self.candidates, letter,
+                                                     revealed))
+        
+        # Any member fits the pattern shown so far; the lowest is quickest to find
+        lowest = self.candidates & -self.candidates
+        self.word = self._group.words[lowest.bit_length() - 1]
+        word_mask = 0
+        for word_letter in self.word:
+            word_mask |= LETTER_BITS[word_letter]
+        self._word_mask = word_mask
+        self._letters_left = popcount(word_mask & ~self.guess_mask)
+    
+    def candidate_count(self):
+        """Return how many words the game could still be thinking of."""
+        return popcount(self.candidates)
\ No newline at end of file
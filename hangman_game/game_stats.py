@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Game Stats - Hangman Game
+=========================
+
+Keep the results of finished games in SQLite, with fast statistics queries.
+
+record() only puts a small record on a queue, so saving a result never makes the
+game wait. A background thread takes records off the queue in batches of up to
+batch_size (or whatever has arrived within flush_interval seconds) and writes each
+batch in one transaction: the game history, plus running totals per word, per
+player and overall. The totals are updated incrementally with upserts, so the
+statistics queries read a handful of rows however many games were recorded.
+
+The database uses write-ahead logging, so queries from the game's thread run
+alongside the writer without blocking it.
+
+Author: CodeAlpha Intern
+Date: September 2025
+"""
+
+import argparse
+import queue
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+
+from hangman_solver import popcount
+
+DEFAULT_BATCH_SIZE = 500
+
+# Longest wait (seconds) before a partial batch is written
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+GameRecord = namedtuple('GameRecord', ['player', 'word', 'won', 'incorrect_guesses',
+                                       'guesses', 'finished_at'])
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    word TEXT NOT NULL,
+    won INTEGER NOT NULL,
+    incorrect_guesses INTEGER NOT NULL,
+    guesses INTEGER NOT NULL,
+    finished_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS word_stats (
+    word TEXT PRIMARY KEY,
+    games INTEGER NOT NULL,
+    wins INTEGER NOT NULL,
+    incorrect_total INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS player_stats (
+    player TEXT PRIMARY KEY,
+    games INTEGER NOT NULL,
+    wins INTEGER NOT NULL,
+    incorrect_total INTEGER NOT NULL,
+    current_streak INTEGER NOT NULL,
+    best_streak INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS player_stats_by_wins ON player_stats (wins DESC);
+CREATE TABLE IF NOT EXISTS totals (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    games INTEGER NOT NULL,
+    wins INTEGER NOT NULL,
+    incorrect_total INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO totals VALUES (1, 0, 0, 0);
+"""
+
+UPSERT_WORD = """
+INSERT INTO word_stats (word, games, wins, incorrect_total) VALUES (?, ?, ?, ?)
+ON CONFLICT (word) DO UPDATE SET
+    games = games + excluded.games,
+    wins = wins + excluded.wins,
+    incorrect_total = incorrect_total + excluded.incorrect_total
+"""
+
+# Parameters come from _player_updates: the batch's games, wins and wrong guesses,
+# its wins before the first loss (leading), after the last loss (trailing), its
+# longest run of wins (best) and whether every game in it was won (all_won)
+UPSERT_PLAYER = """
+INSERT INTO player_stats (player, games, wins, incorrect_total, current_streak, best_streak)
+VALUES (:player, :games, :wins, :incorrect, :trailing, :best)
+ON CONFLICT (player) DO UPDATE SET
+    games = games + excluded.games,
+    wins = wins + excluded.wins,
+    incorrect_total = incorrect_total + excluded.incorrect_total,
+    best_streak = MAX(best_streak, current_streak + :leading, excluded.best_streak),
+    current_streak = CASE WHEN :all_won THEN current_streak + excluded.current_streak
+                          ELSE excluded.current_streak END
+"""
+
+# Stops the writer thread once everything queued before it is written
+_STOP = object()
+
+
+def game_record(game, player='player', finished_at=None):
+    """Return the GameRecord of a finished HangmanGame."""
+    return GameRecord(player, game.word, bool(game.won), game.incorrect_guesses,
+                      popcount(game.guess_mask),
+                      time.time() if finished_at is None else finished_at)
+
+
+def _player_updates(records):
+    """Summarize a batch per player, in order, for the player_stats upsert."""
+    updates = {}
+    for record in records:
+        update = updates.get(record.player)
+        if update is None:
+            update = updates[record.player] = {
+                'player': record.player, 'games': 0, 'wins': 0, 'incorrect': 0,
+                'leading': 0, 'trailing': 0, 'best': 0, 'all_won': True}
+        update['games'] += 1
+        update['incorrect'] += record.incorrect_guesses
+        if record.won:
+            update['wins'] += 1
+            update['trailing'] += 1
+            update['best'] = max(update['best'], update['trailing'])
+            if update['all_won']:
+                update['leading'] += 1
+        else:
+            update['trailing'] = 0
+            update['all_won'] = False
+    return list(updates.values())
+
+
+class GameStatsStore:
+    """Game results in SQLite, written in batches by a background thread."""
+    
+    def __init__(self, filename, batch_size=DEFAULT_BATCH_SIZE,
+                 flush_interval=DEFAULT_FLUSH_INTERVAL, keep_history=True):
+        """Open (or create) the database and start the writer thread.
+        
+        With keep_history=False only the running totals are kept, not every game.
+        """
+        self.filename = filename
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.keep_history = keep_history
+        self.recorded = 0
+        self.written = 0
+        self._queue = queue.Queue()
+        self._local = threading.local()
+        self._error = None
+        
+        connection = sqlite3.connect(filename)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(SCHEMA)
+        connection.close()
+        
+        self._writer = threading.Thread(target=self._write_batches, name="game-stats-writer",
+                                        daemon=True)
+        self._writer.start()
+    
+    def _connect(self):
+        """Open a connection with the settings used by both reader and writer."""
+        connection = sqlite3.connect(self.filename)
+        connection.execute("PRAGMA synchronous=NORMAL")  # Safe with WAL, and far fewer fsyncs
+        return connection
+    
+    def record(self, game, player='player'):
+        """Queue the result of a finished HangmanGame; never waits for the database."""
+        self.record_result(game_record(game, player))
+    
+    def record_result(self, record):
+        """Queue one GameRecord."""
+        if self._error is not None:
+            raise RuntimeError("Game stats writer stopped") from self._error
+        self.recorded += 1
+        self._queue.put_nowait(record)
+    
+    def _next_batch(self):
+        """Wait for records and return up to batch_size of them, plus whether to stop."""
+        batch = []
+        item = self._queue.get()
+        deadline = time.monotonic() + self.flush_interval
+        while item is not _STOP:
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                return batch, False
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    return batch, False
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    return batch, False
+        return batch, True
+    
+    def _write_batches(self):
+        """Writer thread: write queued records in batched transactions until stopped.
+        
+        Any error is kept for the game thread, and the thread keeps draining the
+        queue (dropping what it cannot write) so flush() and close() still return.
+        """
+        connection = None
+        try:
+            connection = self._connect()
+        except Exception as e:
+            self._error = e
+        try:
+            while True:
+                batch, stopping = self._next_batch()
+                if batch and self._error is None:
+                    try:
+                        self._write(connection, batch)
+                    except Exception as e:
+                        self._error = e  # Reported to the game thread; later batches are dropped
+                for _ in range(len(batch) + stopping):
+                    self._queue.task_done()
+                if stopping:
+                    break
+        finally:
+            if connection is not None:
+                connection.close()
+    
+    def _write(self, connection, batch):
+        """Write one batch of records and update the running totals in one transaction."""
+        words = {}
+        for record in batch:
+            stats = words.get(record.word)
+            if stats is None:
+                stats = words[record.word] = [record.word, 0, 0, 0]
+            stats[1] += 1
+            stats[2] += record.won
+            stats[3] += record.incorrect_guesses
+        players = _player_updates(batch)
+        
+        with connection:
+            if self.keep_history:
+                connection.executemany(
+                    "INSERT INTO games (player, word, won, incorrect_guesses, guesses, finished_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?)", batch)
+            connection.executemany(UPSERT_WORD, words.values())
+            connection.executemany(UPSERT_PLAYER, players)
+            connection.execute(
+                "UPDATE totals SET games = games + ?, wins = wins + ?,"
+                " incorrect_total = incorrect_total + ? WHERE id = 1",
+                (len(batch), sum(stats[2] for stats in words.values()),
+                 sum(stats[3] for stats in words.values())))
+        self.written += len(batch)
+    
+    def flush(self):
+        """Wait until every record queued so far has been written."""
+        self._queue.join()
+        if self._error is not None:
+            raise RuntimeError("Game stats writer stopped") from self._error
+    
+    def close(self):
+        """Write what is still queued, then stop the writer thread.
+        
+        Raises RuntimeError if the writer failed, since some records were not written.
+        """
+        if self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join()
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+        if self._error is not None:
+            raise RuntimeError("Game stats writer stopped") from self._error
+    
+    def __enter__(self):
+        """Support use as a context manager."""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the store on leaving the with block."""
+        self.close()
+    
+    def _query(self, sql, parameters=()):
+        """Run a read query on this thread's own connection."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = self._local.connection = self._connect()
+        return connection.execute(sql, parameters).fetchall()
+    
+    def totals(self):
+        """Return games, wins, win rate and average wrong guesses over all games."""
+        games, wins, incorrect = self._query(
+            "SELECT games, wins, incorrect_total FROM totals WHERE id = 1")[0]
+        return {
+            'games': games,
+            'wins': wins,
+            'win_rate': wins / games if games else 0.0,
+            'average_incorrect': incorrect / games if games else 0.0
+        }
+    
+    def word_stats(self, word):
+        """Return the statistics of one word, or None if it was never played."""
+        rows = self._query("SELECT games, wins, incorrect_total FROM word_stats WHERE word = ?",
+                           (word.upper(),))
+        if not rows:
+            return None
+        games, wins, incorrect = rows[0]
+        return {'word': word.upper(), 'games': games, 'wins': wins, 'win_rate': wins / games,
+                'average_incorrect': incorrect / games}
+    
+    def hardest_words(self, limit=10, min_games=1):
+        """Return the words with the lowest win rate, played at least min_games times."""
+        rows = self._query(
+            "SELECT word, games, wins, incorrect_total FROM word_stats WHERE games >= ?"
+            " ORDER BY CAST(wins AS REAL) / games, incorrect_total * 1.0 / games DESC"
+            " LIMIT ?", (min_games, limit))
+        return [{'word': word, 'games': games, 'wins': wins, 'win_rate': wins / games,
+                 'average_incorrect': incorrect / games}
+                for word, games, wins, incorrect in rows]
+    
+    def player_stats(self, player):
+        """Return the statistics of one player, or None if they never finished a game."""
+        rows = self._query(
+            "SELECT games, wins, incorrect_total, current_streak, best_streak"
+            " FROM player_stats WHERE player = ?", (player,))
+        if not rows:
+            return None
+        games, wins, incorrect, current_streak, best_streak = rows[0]
+        return {'player': player, 'games': games, 'wins': wins, 'win_rate': wins / games,
+                'average_incorrect': incorrect / games, 'current_streak': current_streak,
+                'best_streak': best_streak}
+    
+    def leaderboard(self, limit=10):
+        """Return the players with the most wins."""
+        rows = self._query(
+            "SELECT player, games, wins, best_streak FROM player_stats"
+            " ORDER BY wins DESC LIMIT ?", (limit,))
+        return [{'player': player, 'games': games, 'wins': wins, 'win_rate': wins / games,
+                 'best_streak': best_streak}
+                for player, games, wins, best_streak in rows]
+    
+    def history(self, player, limit=10):
+        """Return a player's most recent games, newest first."""
+        rows = self._query(
+            "SELECT word, won, incorrect_guesses, guesses, finished_at FROM games"
+            " WHERE player = ? ORDER BY id DESC LIMIT ?", (player, limit))
+        return [GameRecord(player, word, bool(won), incorrect, guesses, finished_at)
+                for word, won, incorrect, guesses, finished_at in rows]
+
+
+def main():
+    """Show the statistics kept in a stats database."""
+    parser = argparse.ArgumentParser(description="Show Hangman game statistics.")
+    parser.add_argument('database', help="stats database written by hangman.py --stats")
+    parser.add_argument('--limit', type=int, default=10, help="rows per table")
+    args = parser.parse_args()
+    
+    with GameStatsStore(args.database) as store:
+        totals = store.totals()
+        print(f"🎮 Games: {totals['games']:,}  Wins: {totals['wins']:,} "
+              f"({totals['win_rate']:.1%})  Average wrong guesses: "
+              f"{totals['average_incorrect']:.2f}")
+        
+        print("\n🏆 Leaderboard")
+        for rank, entry in enumerate(store.leaderboard(args.limit), 1):
+            print(f"{rank:>3}. {entry['player']:<20} {entry['wins']:>8,} wins "
+                  f"of {entry['games']:,}  best streak {entry['best_streak']}")
+        
+        print("\n💀 Hardest words")
+        for entry in store.hardest_words(args.limit):
+            print(f"     {entry['word']:<20} {entry['win_rate']:>6.1%} won of {entry['games']:,}"
+                  f"  {entry['average_incorrect']:.2f} wrong guesses on average")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -9,31 +9,22 @@ Author: CodeAlpha Intern
 Date: September 2025
 """
 
+import argparse
 import random
 import os
 
+from word_corpus import DIFFICULTIES, WordCorpus
 
-class HangmanGame:
-    """A class to represent the Hangman game."""
-    
-    def __init__(self):
-        """Initialize the game with predefined words and game settings."""
-        self.words = ["python", "programming", "computer", "algorithm", "codealpha"]
-        self.max_incorrect_guesses = 6
-        self.reset_game()
-    
-    def reset_game(self):
-        """Reset the game state for a new game."""
-        self.word = random.choice(self.words).upper()
-        self.guessed_letters = set()
-        self.incorrect_guesses = 0
-        self.game_over = False
-        self.won = False
-    
-    def display_hangman(self):
-        """Display the hangman figure based on incorrect guesses."""
-        hangman_figures = [
-            """
+DEFAULT_WORDS = ("python", "programming", "computer", "algorithm", "codealpha")
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# Bit of each letter in a guess mask: A is bit 0, Z is bit 25
+LETTER_BITS = {letter: 1 << i for i, letter in enumerate(ALPHABET)}
+
+# Drawn once and shared by every game
+HANGMAN_FIGURES = (
+    """
             ___
             |  |
             |
@@ -41,7 +32,7 @@ class HangmanGame:
             |
             |
             =========""",
-            """
+    """
             ___
             |  |
             |  O
@@ -49,7 +40,7 @@ class HangmanGame:
             |
             |
             =========""",
-            """
+    """
             ___
             |  |
             |  O
@@ -57,7 +48,7 @@ class HangmanGame:
             |
             |
             =========""",
-            """
+    """
             ___
             |  |
             |  O
@@ -65,7 +56,7 @@ class HangmanGame:
             |
             |
             =========""",
-            """
+    """
             ___
             |  |
             |  O
@@ -73,7 +64,7 @@ class HangmanGame:
             |
             |
             =========""",
-            """
+    """
             ___
             |  |
             |  O
@@ -81,7 +72,7 @@ class HangmanGame:
             | /
             |
             =========""",
-            """
+    """
             ___
             |  |
             |  O
@@ -89,20 +80,83 @@ class HangmanGame:
             | / \\
             |
             ========="""
-        ]
+)
+
+
+def letter_bit(letter):
+    """Return the guess-mask bit of an uppercase letter A-Z, or 0 for anything else."""
+    return LETTER_BITS.get(letter, 0)
+
+
+class HangmanGame:
+    """A class to represent the Hangman game.
+    
+    The state is kept compact so a server can hold a great many games: guesses are
+    a 26-bit mask, a counter of unrevealed letters makes win detection O(1), and
+    the revealed pattern is cached and only updated when a guess uncovers letters.
+    """
+    
+    __slots__ = ('words', 'corpus', 'word_length', 'difficulty', 'quiet', 'max_incorrect_guesses',
+                 'word', 'guess_mask', 'incorrect_guesses', 'game_over', 'won',
+                 '_word_mask', '_letters_left', '_display')
+    
+    def __init__(self, corpus=None, word_length=None, difficulty=None, quiet=False):
+        """Initialize the game with predefined words and game settings.
         
-        if self.incorrect_guesses < len(hangman_figures):
-            print(hangman_figures[self.incorrect_guesses])
+        If a WordCorpus is given, words are drawn from it instead, optionally
+        limited to one word length and/or difficulty. A quiet game prints nothing,
+        for headless play.
+        """
+        self.words = DEFAULT_WORDS
+        self.corpus = corpus
+        self.word_length = word_length
+        self.difficulty = difficulty
+        self.quiet = quiet
+        self.max_incorrect_guesses = 6
+        self.reset_game()
+    
+    def reset_game(self, word=None):
+        """Reset the game state for a new game, with the given word or a random one."""
+        if word is not None:
+            word = word.upper()
+        elif self.corpus is not None:
+            word = self.corpus.random_word(self.word_length, self.difficulty).upper()
+        else:
+            word = random.choice(self.words).upper()
+        
+        word_mask = 0
+        try:
+            for letter in word:
+                word_mask |= LETTER_BITS[letter]
+        except KeyError:
+            raise ValueError(f"Words may only contain the letters A-Z, not '{word}'") from None
+        
+        self.word = word
+        self.guess_mask = 0
+        self.incorrect_guesses = 0
+        self.game_over = False
+        self.won = False
+        self._word_mask = word_mask
+        self._letters_left = bin(word_mask).count('1')
+        self._display = ' '.join('_' * len(word))
+    
+    @property
+    def guessed_letters(self):
+        """Return the set of letters guessed so far."""
+        return {letter for letter, bit in LETTER_BITS.items() if self.guess_mask & bit}
+    
+    def has_guessed(self, letter):
+        """Check whether a letter has been guessed already."""
+        return bool(self.guess_mask & LETTER_BITS.get(letter.upper(), 0))
+    
+    def display_hangman(self):
+        """Display the hangman figure based on incorrect guesses."""
+        if self.incorrect_guesses < len(HANGMAN_FIGURES):
+            print(HANGMAN_FIGURES[self.incorrect_guesses])
     
     def display_word(self):
         """Display the word with guessed letters revealed and others as underscores."""
-        display = ""
-        for letter in self.word:
-            if letter in self.guessed_letters:
-                display += letter + " "
-            else:
-                display += "_ "
-        return display.strip()
+        return self._display
     
     def display_game_state(self):
         """Display the current game state."""
@@ -121,31 +175,52 @@ class HangmanGame:
     
     def is_word_guessed(self):
         """Check if the entire word has been guessed."""
-        return all(letter in self.guessed_letters for letter in self.word)
+        return self._letters_left == 0
+    
+    def message(self, text):
+        """Show a message to the player, unless the game is quiet."""
+        if not self.quiet:
+            print(text)
     
     def make_guess(self, letter):
         """Process a letter guess."""
         letter = letter.upper()
+        bit = LETTER_BITS.get(letter, 0)
         
-        if letter in self.guessed_letters:
-            print(f"You already guessed '{letter}'. Try a different letter!")
+        if not bit:
+            self.message("Please enter a letter from A to Z!")
             return False
         
-        self.guessed_letters.add(letter)
+        if self.guess_mask & bit:
+            self.message(f"You already guessed '{letter}'. Try a different letter!")
+            return False
         
-        if letter in self.word:
-            print(f"Good guess! '{letter}' is in the word.")
-            if self.is_word_guessed():
+        self.guess_mask |= bit
+        
+        if self._word_mask & bit:
+            self.message(f"Good guess! '{letter}' is in the word.")
+            self._reveal(letter)
+            self._letters_left -= 1
+            if self._letters_left == 0:
                 self.won = True
                 self.game_over = True
         else:
-            print(f"Sorry! '{letter}' is not in the word.")
+            self.message(f"Sorry! '{letter}' is not in the word.")
             self.incorrect_guesses += 1
             if self.incorrect_guesses >= self.max_incorrect_guesses:
                 self.game_over = True
         
         return True
     
+    def _reveal(self, letter):
+        """Uncover every occurrence of a correctly guessed letter in the cached pattern."""
+        display = self._display  # Letter i is shown at 2 * i in "P _ T"
+        position = self.word.find(letter)
+        while position != -1:
+            display = display[:2 * position] + letter + display[2 * position + 1:]
+            position = self.word.find(letter, position + 1)
+        self._display = display
+    
     def get_player_guess(self):
         """Get and validate player's letter guess."""
         while True:
@@ -159,7 +234,7 @@ class HangmanGame:
                     print("Please enter exactly one letter!")
                     continue
                 
-                if not guess.isalpha():
+                if not letter_bit(guess.upper()):
                     print("Please enter a valid letter!")
                     continue
                 
@@ -216,7 +291,30 @@ class HangmanGame:
 
 def main():
     """Main function to run the Hangman game."""
-    game = HangmanGame()
+    parser = argparse.ArgumentParser(description="Hangman Game - CodeAlpha")
+    parser.add_argument('--words', metavar='FILE',
+                        help="draw words from FILE (one word per line) instead of the built-in list")
+    parser.add_argument('--length', type=int, help="only use words of this length (with --words)")
+    parser.add_argument('--difficulty', choices=DIFFICULTIES,
+                        help="only use words of this difficulty (with --words)")
+    parser.add_argument('--evil', action='store_true',
+                        help="evil mode: the word keeps changing to dodge your guesses")
+    parser.add_argument('--stats', metavar='FILE',
+                        help="keep the results of finished games in this SQLite database")
+    parser.add_argument('--player', default='player', help="name to record results under")
+    args = parser.parse_args()
+    
+    corpus = WordCorpus(args.words) if args.words else None
+    if args.evil:
+        from evil_hangman import EvilHangmanGame, WordGroups
+        game = EvilHangmanGame(WordGroups(corpus, difficulty=args.difficulty), args.length)
+    else:
+        game = HangmanGame(corpus, args.length, args.difficulty)
+    
+    stats = None
+    if args.stats:
+        from game_stats import GameStatsStore
+        stats = GameStatsStore(args.stats)
     
     print("🎮 Welcome to CodeAlpha Hangman Game! 🎮")
     print("=" * 50)
@@ -224,11 +322,23 @@ def main():
     while True:
         game.reset_game()
         game.play_game()
+        if stats is not None and game.game_over:
+            stats.record(game, args.player)
         
         if not game.play_again():
             print("\nThank you for playing CodeAlpha Hangman Game!")
             print("Happy coding! 🐍")
             break
+    
+    if stats is not None:
+        stats.flush()
+        player = stats.player_stats(args.player)
+        if player is not None:
+            print(f"📊 {player['player']}: {player['wins']} wins in {player['games']} games, "
+                  f"best streak {player['best_streak']}")
+        stats.close()
+    if corpus is not None:
+        corpus.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Hangman Load Test - Hangman Game
+================================
+
+Drive the Hangman server with many concurrent players.
+
+Every simulated player opens its own connection and plays games back to back,
+guessing letters in a random order, and the time of each guess round trip is
+recorded. The run reports guesses and games per second and latency percentiles.
+Without --port an in-process server on a free local port is used.
+
+Author: CodeAlpha Intern
+Date: September 2025
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from hangman import ALPHABET
+from hangman_server import HangmanServer
+from word_corpus import WordCorpus
+
+
+class PlayerClient:
+    """One player's connection to the Hangman server."""
+    
+    def __init__(self, host, port):
+        """Remember the server address; connect() opens the connection."""
+        self.host = host
+        self.port = port
+        self._reader = None
+        self._writer = None
+    
+    async def connect(self):
+        """Open the connection."""
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+    
+    async def command(self, line):
+        """Send one command and return the reply split into words."""
+        self._writer.write(line.encode('ascii') + b'\n')
+        await self._writer.drain()
+        reply = await self._reader.readline()
+        if not reply:
+            raise ConnectionResetError("Hangman server closed the connection")
+        return reply.decode('ascii').split()
+    
+    async def close(self):
+        """Say goodbye and close the connection."""
+        if self._writer is not None:
+            try:
+                await self.command("QUIT")
+            except ConnectionError:
+                pass
+            self._writer.close()
+            await self._writer.wait_closed()
+
+
+def _percentile(sorted_values, fraction):
+    """Return the value at the given fraction of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+async def _player_loop(client, games, rng, latencies, counts):
+    """Play this player's games, recording the latency of every guess."""
+    for _ in range(games):
+        reply = await client.command("NEW")
+        if reply[0] != 'GAME':
+            counts['errors'] += 1
+            continue
+        
+        letters = list(ALPHABET)
+        rng.shuffle(letters)
+        for letter in letters:
+            start_time = time.perf_counter()
+            reply = await client.command(f"GUESS {letter}")
+            latencies.append(time.perf_counter() - start_time)
+            if reply[0] == 'ERROR':
+                counts['errors'] += 1
+                break
+            if reply[0] in ('WON', 'LOST'):
+                counts[reply[0].lower()] += 1
+                break
+
+
+async def run_load_test(host, port, args):
+    """Connect every player, play all games at once and return the run statistics."""
+    clients = [PlayerClient(host, port) for _ in range(args.players)]
+    await asyncio.gather(*(client.connect() for client in clients))
+    latencies = []
+    counts = {'won': 0, 'lost': 0, 'errors': 0}
+    start_time = time.perf_counter()
+    try:
+        await asyncio.gather(*(
+            _player_loop(client, args.games, random.Random(args.seed + i), latencies, counts)
+            for i, client in enumerate(clients)
+        ))
+    finally:
+        elapsed = time.perf_counter() - start_time
+        await asyncio.gather(*(client.close() for client in clients))
+    
+    latencies.sort()
+    games = counts['won'] + counts['lost']
+    return {
+        'guesses': len(latencies),
+        'games': games,
+        'won': counts['won'],
+        'errors': counts['errors'],
+        'seconds': elapsed,
+        'guesses_per_second': len(latencies) / elapsed if elapsed else 0.0,
+        'games_per_second': games / elapsed if elapsed else 0.0,
+        'p50_ms': _percentile(latencies, 0.50) * 1000,
+        'p99_ms': _percentile(latencies, 0.99) * 1000
+    }
+
+
+async def _main(args):
+    """Run against the given server, or an in-process one if no port was given."""
+    server = None
+    corpus = None
+    host, port = args.host, args.port
+    if port is None:
+        corpus = WordCorpus(args.words) if args.words else None
+        server = HangmanServer(corpus, host, 0)
+        await server.start()
+        port = server.port
+    
+    try:
+        stats = await run_load_test(host, port, args)
+    finally:
+        if server is not None:
+            await server.stop()
+        if corpus is not None:
+            corpus.close()
+    
+    print(f"✅ {stats['guesses']:,} guesses in {stats['games']:,} games from {args.players} "
+          f"players in {stats['seconds']:.2f}s")
+    print(f"{stats['guesses_per_second']:,.0f} guesses/sec, "
+          f"{stats['games_per_second']:,.0f} games/sec")
+    print(f"Latency p50: {stats['p50_ms']:.2f} ms  p99: {stats['p99_ms']:.2f} ms")
+    print(f"Won: {stats['won']:,}  errors: {stats['errors']}")
+
+
+def main():
+    """Load-test the Hangman server from the command line."""
+    parser = argparse.ArgumentParser(description="Load-test the Hangman server.")
+    parser.add_argument('--host', default='127.0.0.1', help="server address")
+    parser.add_argument('--port', type=int, default=None,
+                        help="server port (default: start an in-process server)")
+    parser.add_argument('--words', metavar='FILE',
+                        help="word file for the in-process server (default: built-in words)")
+    parser.add_argument('--players', type=int, default=200, help="concurrent connections")
+    parser.add_argument('--games', type=int, default=20, help="games per player")
+    parser.add_argument('--seed', type=int, default=0, help="random seed")
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
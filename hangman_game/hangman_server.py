@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Hangman Server - Hangman Game
+=============================
+
+An asyncio server hosting many Hangman games at once over a line protocol.
+
+Every connection is one player with a HangmanSession around a quiet HangmanGame.
+Commands are single text lines and every command gets exactly one reply line:
+
+    NEW [length]     start a new game          -> GAME <pattern> <lives left>
+    GUESS <letter>   guess a letter            -> HIT|MISS|REPEAT <pattern> <lives left>
+                                                  or WON|LOST <word> <lives left> at the end
+    STATE            show the current game     -> GAME <pattern> <lives left>
+    QUIT             close the connection      -> BYE
+
+Patterns show hidden letters as underscores, e.g. P_T_O_. Errors are answered with
+ERROR <message>. Clients may pipeline commands: everything that arrives in one
+read is handled together and the replies go out in a single write. Sessions that
+send nothing for the idle timeout are told BYE idle and closed by a periodic
+sweep, which costs one timer for the whole server instead of one per connection.
+
+Author: CodeAlpha Intern
+Date: September 2025
+"""
+
+import argparse
+import asyncio
+
+from hangman import HangmanGame
+from word_corpus import WordCorpus
+
+DEFAULT_PORT = 7777
+
+# Seconds without a command before a session is closed
+DEFAULT_IDLE_TIMEOUT = 300.0
+
+# Bytes read from a connection at a time, and the longest command line accepted
+READ_SIZE = 64 * 1024
+MAX_LINE_LENGTH = 1024
+
+# Pending connections the listening socket queues while players connect in bursts
+LISTEN_BACKLOG = 1024
+
+
+class HangmanSession:
+    """One player's connection state: a quiet HangmanGame plus a few counters."""
+    
+    __slots__ = ('game', 'playing', 'last_active', 'games', 'wins', 'guesses')
+    
+    def __init__(self, corpus, now):
+        """Create the player's game; nothing is played until the first NEW."""
+        self.game = HangmanGame(corpus, quiet=True)
+        self.playing = False
+        self.last_active = now
+        self.games = 0
+        self.wins = 0
+        self.guesses = 0
+    
+    def _state(self, status):
+        """Return a reply line with the pattern (or the word, once over) and lives left."""
+        game = self.game
+        shown = game.word if game.game_over else game.display_word()[::2]
+        return f"{status} {shown} {game.max_incorrect_guesses - game.incorrect_guesses}\n"
+    
+    def new_game(self, argument):
+        """Start a new game, optionally with a given word length."""
+        game = self.game
+        if argument:
+            if not argument.isdigit():
+                return "ERROR Word length must be a number\n"
+            if game.corpus is None:
+                return "ERROR Word length needs a server started with a word file\n"
+            game.word_length = int(argument)
+        else:
+            game.word_length = None
+        
+        try:
+            game.reset_game()
+        except ValueError as e:
+            return f"ERROR {e}\n"
+        self.playing = True
+        self.games += 1
+        return self._state("GAME")
+    
+    def guess(self, argument):
+        """Guess a letter in the current game."""
+        game = self.game
+        if not self.playing:
+            return "ERROR No game in progress; send NEW\n"
+        
+        letter = argument.upper()
+        if game.has_guessed(letter):
+            return self._state("REPEAT")
+        wrong_before = game.incorrect_guesses
+        if not game.make_guess(letter):
+            return "ERROR Guess one letter from A to Z\n"
+        
+        self.guesses += 1
+        if game.game_over:
+            self.playing = False
+            self.wins += game.won
+            return self._state("WON" if game.won else "LOST")
+        return self._state("MISS" if game.incorrect_guesses > wrong_before else "HIT")
+    
+    def handle(self, line):
+        """Answer one command line; return (reply, whether to keep the connection open)."""
+        command, _, argument = line.strip().partition(' ')
+        command = command.upper()
+        argument = argument.strip()
+        
+        if command == 'GUESS':
+            return self.guess(argument), True
+        if command == 'NEW':
+            return self.new_game(argument), True
+        if command == 'STATE':
+            if not self.playing:
+                return "ERROR No game in progress; send NEW\n", True
+            return self._state("GAME"), True
+        if command == 'QUIT':
+            return "BYE\n", False
+        return f"ERROR Unknown command '{command}'\n", True
+
+
+class HangmanServer:
+    """Serve Hangman sessions over TCP, one session per connection."""
+    
+    def __init__(self, corpus=None, host='127.0.0.1', port=DEFAULT_PORT,
+                 idle_timeout=DEFAULT_IDLE_TIMEOUT):
+        """Set up the server; a port of 0 picks a free port when started."""
+        self.corpus = corpus
+        self.host = host
+        self.port = port
+        self.idle_timeout = idle_timeout
+        self.commands = 0
+        self.evicted = 0
+        self._server = None
+        self._sweeper = None
+        self._sessions = {}  # Handler task -> (session, writer)
+    
+    def __len__(self):
+        """Return the number of connected sessions."""
+        return len(self._sessions)
+    
+    async def start(self):
+        """Start listening and sweeping idle sessions; the bound port is stored in self.port."""
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port,
+                                                  backlog=LISTEN_BACKLOG)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._sweeper = asyncio.ensure_future(self._evict_idle_sessions())
+    
+    async def stop(self):
+        """Stop accepting connections, close open ones and wait for their handlers."""
+        self._server.close()
+        await self._server.wait_closed()
+        self._sweeper.cancel()
+        for _, writer in self._sessions.values():
+            writer.close()
+        await asyncio.gather(self._sweeper, *self._sessions, return_exceptions=True)
+    
+    async def _evict_idle_sessions(self):
+        """Close sessions idle for longer than the timeout, checking a few times per timeout."""
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(max(0.1, self.idle_timeout / 4))
+            deadline = loop.time() - self.idle_timeout
+            for session, writer in list(self._sessions.values()):
+                if session.last_active < deadline and not writer.is_closing():
+                    writer.write(b"BYE idle\n")
+                    writer.close()  # The handler sees end of input and cleans up
+                    self.evicted += 1
+    
+    @staticmethod
+    def _answer(session, line):
+        """Answer one raw command line; an invalid line gets an ERROR reply, never a lost session.
+        
+        Only validation errors are answered; anything else is a bug and propagates.
+        """
+        try:
+            text = line.decode('ascii')
+        except UnicodeDecodeError:
+            return "ERROR Commands must be plain ASCII\n", True
+        try:
+            return session.handle(text)
+        except ValueError as e:
+            return f"ERROR {e}\n", True
+    
+    async def _handle_connection(self, reader, writer):
+        """Answer commands on one connection until the player quits or disconnects."""
+        loop = asyncio.get_running_loop()
+        session = HangmanSession(self.corpus, loop.time())
+        task = asyncio.current_task()
+        self._sessions[task] = (session, writer)
+        pending = b''
+        try:
+            keep_open = True
+            while keep_open:
+                data = await reader.read(READ_SIZE)
+                if not data:
+                    break
+                session.last_active = loop.time()
+                lines = (pending + data).split(b'\n')
+                pending = lines.pop()
+                if len(pending) > MAX_LINE_LENGTH:
+                    writer.write(b"ERROR Line too long\n")
+                    break
+                
+                # Answer everything that arrived together with one write
+                replies = []
+                for line in lines:
+                    reply, keep_open = self._answer(session, line)
+                    replies.append(reply)
+                    if not keep_open:
+                        break
+                self.commands += len(replies)
+                writer.write(''.join(replies).encode('ascii', 'replace'))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            del self._sessions[task]
+            writer.close()
+
+
+async def serve(host, port, words_file, idle_timeout):
+    """Run the server until interrupted."""
+    corpus = WordCorpus(words_file) if words_file else None
+    server = HangmanServer(corpus, host, port, idle_timeout)
+    await server.start()
+    print(f"🎮 Hangman server listening on {server.host}:{server.port}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+        if corpus is not None:
+            corpus.close()
+
+
+def main():
+    """Start the Hangman server from the command line."""
+    parser = argparse.ArgumentParser(description="Host many Hangman games over TCP.")
+    parser.add_argument('--host', default='127.0.0.1', help="address to listen on")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help="port to listen on")
+    parser.add_argument('--words', metavar='FILE',
+                        help="draw words from FILE (one word per line) "
+                             "instead of the built-in list")
+    parser.add_argument('--idle-timeout', type=float, default=DEFAULT_IDLE_TIMEOUT,
+                        help="seconds without a command before a session is closed")
+    args = parser.parse_args()
+    
+    try:
+        asyncio.run(serve(args.host, args.port, args.words, args.idle_timeout))
+    except KeyboardInterrupt:
+        print("\n👋 Hangman server stopped.")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Hangman Solver - Hangman Game
+=============================
+
+Pick the best next letter for a HangmanGame from a large dictionary.
+
+Words are grouped by length. For every length the solver precomputes, per letter,
+a bitmask of the words containing it and, per position and letter, a bitmask of
+the words with that letter in that position. Python integers serve as the bit
+sets, so the candidate set of a game is one integer too: each guess narrows it
+with a few AND / AND NOT operations instead of rescanning the word list, and
+letters are ranked by the population count of candidates & letter mask. A guess
+takes well under a millisecond even with hundreds of thousands of words.
+
+The candidates depend only on the revealed pattern and the letters guessed, so
+each word group also remembers the letter chosen for a state; the opening guesses
+that most games share are worked out once instead of once per game.
+
+Author: CodeAlpha Intern
+Date: September 2025
+"""
+
+import argparse
+import string
+
+LETTERS = string.ascii_uppercase
+LETTER_SET = frozenset(LETTERS)
+
+# Tie-break order when letters are equally likely: most common in English first
+LETTER_FREQUENCY_ORDER = 'ETAOINSHRDLCUMWFGYPBVKJXQZ'
+
+# Most remembered guesses per word group; later states are still solved, just not kept
+DECISION_CACHE_LIMIT = 20000
+
+
+def popcount(mask):
+    """Return the number of set bits in a non-negative integer."""
+    return bin(mask).count('1')
+
+
+if hasattr(int, 'bit_count'):  # Python 3.10+
+    popcount = int.bit_count  # noqa: F811
+
+
+def _bitmask(indices, size):
+    """Return an integer with the given bit positions set."""
+    bits = bytearray((size + 7) // 8)
+    for i in indices:
+        bits[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(bits, 'little')
+
+
+class WordGroup:
+    """The dictionary words of one length, with their letter and position bitmasks."""
+    
+    __slots__ = ('length', 'words', 'all_words', 'letter_masks', 'position_masks', 'decisions')
+    
+    def __init__(self, length, words):
+        """Index words (all of the given length, uppercase) into bitmasks."""
+        self.length = length
+        self.words = words
+        self.all_words = (1 << len(words)) - 1
+        
+        letter_indices = {letter: [] for letter in LETTERS}
+        position_indices = [{letter: [] for letter in LETTERS} for _ in range(length)]
+        for i, word in enumerate(words):
+            for letter in set(word):
+                letter_indices[letter].append(i)
+            for position, letter in enumerate(word):
+                position_indices[position][letter].append(i)
+        
+        size = len(words)
+        self.letter_masks = {letter: _bitmask(indices, size)
+                             for letter, indices in letter_indices.items()}
+        self.position_masks = [{letter: _bitmask(indices, size)
+                                for letter, indices in letters.items()}
+                               for letters in position_indices]
+        self.decisions = {}  # (pattern, guessed letters) -> best next letter
+    
+    def words_in(self, candidates, limit=None):
+        """Return the words whose bits are set in candidates (up to limit)."""
+        found = []
+        while candidates and (limit is None or len(found) < limit):
+            lowest = candidates & -candidates
+            found.append(self.words[lowest.bit_length() - 1])
+            candidates ^= lowest
+        return found
+
+
+class HangmanSolver:
+    """A dictionary indexed for fast candidate filtering, shared by any number of games."""
+    
+    def __init__(self, words):
+        """Index an iterable of words; non-alphabetic entries are skipped."""
+        by_length = {}
+        for word in words:
+            word = word.strip().upper()
+            if word and LETTER_SET.issuperset(word):
+                by_length.setdefault(len(word), set()).add(word)
+        self.groups = {length: WordGroup(length, sorted(group))
+                       for length, group in by_length.items()}
+    
+    def __len__(self):
+        """Return the number of indexed words."""
+        return sum(len(group.words) for group in self.groups.values())
+    
+    def new_game(self, length):
+        """Return a HangmanGuesser for a hidden word of the given length."""
+        return HangmanGuesser(self, length)
+
+
+class HangmanGuesser:
+    """Tracks one game's candidate words and narrows them after every guess."""
+    
+    def __init__(self, solver, length):
+        """Start with every dictionary word of the given length as a candidate."""
+        self.length = length
+        self.group = solver.groups.get(length)
+        self.candidates = self.group.all_words if self.group is not None else 0
+        self.guessed = set()
+        self.guess_mask = 0  # Same bit layout as HangmanGame.guess_mask
+        self.pattern = ['_'] * length
+    
+    def observe(self, letter, positions):
+        """Narrow the candidates by a guess and the positions where it was revealed."""
+        letter = letter.upper()
+        self.guessed.add(letter)
+        self.guess_mask |= 1 << (ord(letter) - 65)
+        for position in positions:
+            self.pattern[position] = letter
+        if self.group is None:
+            return
+        
+        if not positions:
+            self.candidates &= ~self.group.letter_masks[letter]
+            return
+        
+        # The letter is exactly at these positions: present in each, absent from the rest
+        masks = self.group.position_masks
+        for position in range(self.length):
+            if position in positions:
+                self.candidates &= masks[position][letter]
+            else:
+                self.candidates &= ~masks[position][letter]
+    
+    def candidate_count(self):
+        """Return how many dictionary words still fit the game."""
+        return popcount(self.candidates)
+    
+    def letter_scores(self):
+        """Return {letter: candidates containing it} for the letters not yet guessed."""
+        if not self.candidates:
+            return {}
+        letter_masks = self.group.letter_masks
+        candidates = self.candidates
+        return {letter: popcount(candidates & letter_masks[letter])
+                for letter in LETTERS if letter not in self.guessed}
+    
+    def next_letter(self):
+        """Return the unguessed letter found in the most remaining candidates."""
+        decisions = self.group.decisions if self.group is not None else {}
+        state = (''.join(self.pattern), ''.join(sorted(self.guessed)))
+        letter = decisions.get(state)
+        if letter is not None:
+            return letter
+        
+        scores = self.letter_scores()
+        remaining = [letter for letter in LETTER_FREQUENCY_ORDER if letter not in self.guessed]
+        if not remaining:
+            return None
+        # Falls back to plain letter frequency once no dictionary word fits
+        letter = max(remaining, key=lambda letter: scores.get(letter, 0))
+        if len(decisions) < DECISION_CACHE_LIMIT:
+            decisions[state] = letter
+        return letter
+    
+    def sync(self, game):
+        """Apply any guesses made in a HangmanGame since the last call."""
+        new_guesses = game.guess_mask & ~self.guess_mask
+        if not new_guesses:
+            return
+        pattern = game.display_word()[::2]
+        while new_guesses:
+            lowest = new_guesses & -new_guesses
+            letter = LETTERS[lowest.bit_length() - 1]
+            self.observe(letter, {i for i, shown in enumerate(pattern) if shown == letter})
+            new_guesses ^= lowest
+    
+    def guess(self, game):
+        """Return the best next letter for a HangmanGame in its current state."""
+        self.sync(game)
+        return self.next_letter()
+
+
+def play(game, solver):
+    """Let the solver play a HangmanGame to the end; return the letters it guessed."""
+    guesser = solver.new_game(len(game.word))
+    guesses = []
+    while not game.game_over:
+        letter = guesser.guess(game)
+        if letter is None:
+            break
+        game.make_guess(letter)
+        guesses.append(letter)
+    return guesses
+
+
+def main():
+    """Solve one word with a dictionary file, showing each guess."""
+    from hangman import HangmanGame
+    from word_corpus import WordCorpus
+    
+    parser = argparse.ArgumentParser(description="Let the solver guess a Hangman word.")
+    parser.add_argument('--words', metavar='FILE', required=True,
+                        help="dictionary, one word per line")
+    parser.add_argument('word', nargs='?',
+                        help="word to guess (default: a random dictionary word)")
+    args = parser.parse_args()
+    
+    with WordCorpus(args.words) as corpus:
+        solver = HangmanSolver(corpus.words())
+        game = HangmanGame(corpus)
+    if args.word:
+        game.reset_game(args.word)
+    
+    guesses = play(game, solver)
+    result = "solved" if game.won else "failed on"
+    print(f"\n🤖 Solver {result} '{game.word}' in {len(guesses)} guesses "
+          f"({game.incorrect_guesses} wrong): {' '.join(guesses)}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Simulation - Hangman Game
+=========================
+
+Play huge numbers of headless Hangman games to compare guessing strategies.
+
+Games run through HangmanGame.reset_game / make_guess with a quiet game, so no
+input, screen clearing or printing is involved. A strategy is any object with a
+new_game(length) method returning a guesser whose guess(game) returns the next
+letter; HangmanSolver is one, and two simple baselines are defined here. A
+strategy that uses randomness should also have a reseed(seed) method: every shard
+calls it first, so its choices depend on the shard and not on which worker, or
+which earlier shards, ran before it.
+
+Games are split into fixed-size shards, each with its own seed, so the same seed
+gives the same results whether the shards run in this process or across a process
+pool with any number of workers. Results report the win rate, the distribution
+of guesses per game and games per second per core.
+
+Author: CodeAlpha Intern
+Date: September 2025
+"""
+
+import argparse
+import math
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from hangman import LETTER_BITS, HangmanGame
+from hangman_solver import LETTER_FREQUENCY_ORDER, LETTERS, HangmanSolver
+from word_corpus import DIFFICULTIES, WordCorpus
+
+DEFAULT_GAMES = 100000
+
+# Games per shard; shards are the unit of work and of seeding
+DEFAULT_SHARD_SIZE = 10000
+
+STRATEGIES = ('frequency', 'random', 'solver')
+
+# Per-worker strategy and word source, set up by _load_worker
+_worker_setup = None
+
+
+class FixedOrderGuesser:
+    """Guesses letters in a fixed order, skipping any already guessed."""
+    
+    __slots__ = ('letters',)
+    
+    def __init__(self, order):
+        """Guess the letters of order from first to last."""
+        self.letters = iter(order)
+    
+    def guess(self, game):
+        """Return the next letter in the order that the game has not seen yet."""
+        for letter in self.letters:
+            if not game.guess_mask & LETTER_BITS[letter]:
+                return letter
+        return None
+
+
+class FrequencyStrategy:
+    """Guess letters from most to least common in English, whatever the word length."""
+    
+    def new_game(self, length):
+        """Return a guesser for one game."""
+        return FixedOrderGuesser(LETTER_FREQUENCY_ORDER)
+
+
+class RandomStrategy:
+    """Guess letters in a random order - the baseline any strategy should beat."""
+    
+    def __init__(self, seed=None):
+        """Shuffle with a generator seeded from seed."""
+        self.rng = random.Random(seed)
+    
+    def reseed(self, seed):
+        """Restart the generator from seed."""
+        self.rng.seed(seed)
+    
+    def new_game(self, length):
+        """Return a guesser for one game."""
+        order = list(LETTERS)
+        self.rng.shuffle(order)
+        return FixedOrderGuesser(order)
+
+
+def make_strategy(name, corpus=None, seed=None, word_length=None):
+    """Build a strategy by name; 'solver' indexes the corpus (or the built-in words).
+    
+    With a word_length, the solver only indexes corpus words of that length.
+    """
+    if name == 'frequency':
+        return FrequencyStrategy()
+    if name == 'random':
+        return RandomStrategy(seed)
+    if name == 'solver':
+        return HangmanSolver(corpus.words(word_length) if corpus is not None
+                             else HangmanGame().words)
+    raise ValueError(f"Unknown strategy '{name}'")
+
+
+def play_headless(game, strategy, word=None):
+    """Play one quiet game to the end; return the number of guesses made."""
+    game.reset_game(word)
+    guesser = strategy.new_game(len(game.word))
+    guesses = 0
+    while not game.game_over:
+        letter = guesser.guess(game)
+        if letter is None:
+            break
+        game.make_guess(letter)
+        guesses += 1
+    return guesses
+
+
+def simulate_shard(strategy, corpus, games, seed, word_length=None, difficulty=None):
+    """Play one shard of games; return (wins, Counter of guesses per game, seconds)."""
+    rng = random.Random(seed)
+    reseed = getattr(strategy, 'reseed', None)
+    if reseed is not None:
+        reseed(rng.getrandbits(64))
+    game = HangmanGame(quiet=True)
+    wins = 0
+    guess_counts = Counter()
+    
+    start_time = time.perf_counter()
+    for _ in range(games):
+        if corpus is not None:
+            word = corpus.random_word(word_length, difficulty, rng=rng)
+        else:
+            word = rng.choice(game.words)
+        guess_counts[play_headless(game, strategy, word)] += 1
+        wins += game.won
+    return wins, guess_counts, time.perf_counter() - start_time
+
+
+def _shard_seed(seed, shard):
+    """Return the seed of one shard, distinct for every (seed, shard) pair."""
+    return seed * 1000003 + shard
+
+
+def _load_worker(strategy_name, words_file, seed, word_length=None):
+    """Worker initializer: open the word file and build the strategy once."""
+    global _worker_setup
+    corpus = WordCorpus(words_file) if words_file else None
+    _worker_setup = (make_strategy(strategy_name, corpus, seed, word_length), corpus)
+
+
+def _run_shard(task):
+    """Play one shard in a worker process."""
+    return simulate_shard(*_worker_setup, *task)
+
+
+def run_simulation(strategy_name='solver', games=DEFAULT_GAMES, words_file=None,
+                   word_length=None, difficulty=None, workers=None, seed=0,
+                   shard_size=DEFAULT_SHARD_SIZE):
+    """Play games with a named strategy and return aggregated results.
+    
+    workers=None plays in this process; any other value uses a process pool
+    (0 for one worker per CPU). The same seed always gives the same results.
+    """
+    if strategy_name not in STRATEGIES:
+        raise ValueError(f"Unknown strategy '{strategy_name}'")
+    
+    start_time = time.perf_counter()
+    shard_count = max(1, math.ceil(games / shard_size))
+    tasks = [(min(shard_size, games - i * shard_size), _shard_seed(seed, i), word_length,
+              difficulty) for i in range(shard_count)]
+    
+    if workers is None:
+        _load_worker(strategy_name, words_file, seed, word_length)
+        results = [_run_shard(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers or None, initializer=_load_worker,
+                                 initargs=(strategy_name, words_file, seed, word_length)) as pool:
+            results = list(pool.map(_run_shard, tasks))
+    elapsed = time.perf_counter() - start_time
+    
+    wins = sum(shard_wins for shard_wins, _, _ in results)
+    guess_counts = Counter()
+    for _, shard_counts, _ in results:
+        guess_counts.update(shard_counts)
+    busy_seconds = sum(seconds for _, _, seconds in results)
+    return {
+        'strategy': strategy_name,
+        'games': games,
+        'wins': wins,
+        'win_rate': wins / games if games else 0.0,
+        'average_guesses': (sum(count * games_played for count, games_played
+                                in guess_counts.items()) / games if games else 0.0),
+        'guess_distribution': dict(sorted(guess_counts.items())),
+        'seconds': elapsed,
+        'games_per_second': games / elapsed if elapsed > 0 else 0.0,
+        'games_per_second_per_core': games / busy_seconds if busy_seconds > 0 else 0.0
+    }
+
+
+def main():
+    """Run a simulation from the command line and print its results."""
+    parser = argparse.ArgumentParser(description="Play headless Hangman games to rate a strategy.")
+    parser.add_argument('--strategy', choices=STRATEGIES, default='solver',
+                        help="guessing strategy (default: solver)")
+    parser.add_argument('--games', type=int, default=DEFAULT_GAMES, help="games to play")
+    parser.add_argument('--words', metavar='FILE',
+                        help="draw words from FILE (one word per line) instead of the built-in list")
+    parser.add_argument('--length', type=int, help="only use words of this length (with --words)")
+    parser.add_argument('--difficulty', choices=DIFFICULTIES,
+                        help="only use words of this difficulty (with --words)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes (0 for one per CPU; default: run in this process)")
+    parser.add_argument('--seed', type=int, default=0, help="random seed")
+    args = parser.parse_args()
+    
+    results = run_simulation(args.strategy, args.games, args.words, args.length,
+                             args.difficulty, args.workers, args.seed)
+    
+    print(f"🤖 Strategy: {results['strategy']}")
+    print(f"🎮 Games: {results['games']:,}  Wins: {results['wins']:,} "
+          f"({results['win_rate']:.2%})")
+    print(f"🔤 Average guesses per game: {results['average_guesses']:.2f}")
+    print("Guesses per game:")
+    largest = max(results['guess_distribution'].values(), default=0)
+    for guesses, count in results['guess_distribution'].items():
+        bar = '#' * max(1, round(40 * count / largest))
+        print(f"  {guesses:>2}: {count:>10,} {bar}")
+    print(f"⏱️  {results['seconds']:.2f}s, {results['games_per_second']:,.0f} games/sec "
+          f"({results['games_per_second_per_core']:,.0f} per core)")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,63 @@
+"""Tests for evil mode's family partitioning."""
+
+import os
+import tempfile
+import unittest
+
+from evil_hangman import EvilHangmanGame, WordGroups, choose_family, partition
+from hangman_solver import WordGroup
+from word_corpus import WordCorpus, word_difficulty
+
+WORDS = ['ALLY', 'BETA', 'COOL', 'DEAL', 'ELLA', 'GOOD', 'HOPE']
+
+
+class PartitionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.group = WordGroup(4, WORDS)
+
+    def family(self, members):
+        return sorted(self.group.words_in(members))
+
+    def test_families_by_letter_positions(self):
+        families = partition(self.group, self.group.all_words, 'L')
+        self.assertEqual({key: self.family(members) for key, members in families.items()},
+                         {0: ['BETA', 'GOOD', 'HOPE'],
+                          0b0110: ['ALLY', 'ELLA'],
+                          0b1000: ['COOL', 'DEAL']})
+
+    def test_revealed_positions_are_skipped(self):
+        families = partition(self.group, self.group.all_words, 'L', revealed={1})
+        self.assertEqual(self.family(families[0b0100]), ['ALLY', 'ELLA'])
+
+    def test_largest_family_prefers_missing_letter(self):
+        families = partition(self.group, self.group.all_words, 'O')
+        key, members = choose_family(families)
+        self.assertEqual(key, 0)
+        self.assertEqual(self.family(members), ['ALLY', 'BETA', 'DEAL', 'ELLA'])
+
+    def test_game_dodges_guesses(self):
+        game = EvilHangmanGame(WordGroups(words=WORDS), 4, quiet=True)
+        game.make_guess('O')
+        self.assertEqual(game.incorrect_guesses, 1)
+        self.assertEqual(game.candidate_count(), 4)
+        self.assertNotIn('O', game.word)
+
+
+class DifficultyTest(unittest.TestCase):
+
+    def test_corpus_words_of_one_difficulty(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'words.txt')
+            with open(filename, 'w', encoding='ascii') as wordfile:
+                wordfile.write("\n".join(['quiz', 'python', 'hangman', 'elephant', 'relation']))
+            with WordCorpus(filename) as corpus:
+                groups = WordGroups(corpus, difficulty='easy')
+                self.assertEqual(groups.lengths(), [8])
+                game = EvilHangmanGame(groups, quiet=True)
+                self.assertEqual(word_difficulty(game.word), 'easy')
+                self.assertEqual(game.candidate_count(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+"""Tests for the batched SQLite game statistics store."""
+
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+from game_stats import GameRecord, GameStatsStore
+
+
+def expected_streaks(results):
+    """Return (current streak, best streak) of a sequence of win/loss results."""
+    current = best = 0
+    for won in results:
+        current = current + 1 if won else 0
+        best = max(best, current)
+    return current, best
+
+
+class GameStatsStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.filename = os.path.join(self.directory.name, 'stats.db')
+
+    def open_store(self, **options):
+        store = GameStatsStore(self.filename, flush_interval=0.01, **options)
+        self.addCleanup(store.close)
+        return store
+
+    def record(self, store, player, won, word='PYTHON'):
+        store.record_result(GameRecord(player, word, won, 1 if won else 6, 10, 0.0))
+
+    def test_streaks_across_batch_boundaries(self):
+        rng = random.Random(7)
+        results = {'ann': [], 'bob': []}
+        store = self.open_store(batch_size=4)
+        for _ in range(30):
+            # Flush at random points so streaks are split across many batches
+            for _ in range(rng.randrange(1, 9)):
+                player = rng.choice(['ann', 'bob'])
+                won = rng.random() < 0.7
+                results[player].append(won)
+                self.record(store, player, won)
+            store.flush()
+
+        for player, played in results.items():
+            stats = store.player_stats(player)
+            self.assertEqual(stats['games'], len(played))
+            self.assertEqual(stats['wins'], sum(played))
+            self.assertEqual((stats['current_streak'], stats['best_streak']),
+                             expected_streaks(played))
+
+    def test_streak_continues_through_an_all_win_batch(self):
+        store = self.open_store()
+        for won in (False, True, True):
+            self.record(store, 'ann', won)
+        store.flush()
+        for _ in range(3):
+            self.record(store, 'ann', True)
+        store.flush()
+        self.record(store, 'ann', True)
+        self.record(store, 'ann', False)
+        store.flush()
+        stats = store.player_stats('ann')
+        self.assertEqual((stats['current_streak'], stats['best_streak']), (0, 6))
+
+    def test_totals_and_word_stats(self):
+        store = self.open_store()
+        self.record(store, 'ann', True, word='ZEBRA')
+        self.record(store, 'bob', False, word='ZEBRA')
+        self.record(store, 'bob', True, word='QUIZ')
+        store.close()
+
+        store = self.open_store()
+        self.assertEqual(store.totals()['games'], 3)
+        self.assertEqual(store.word_stats('zebra')['wins'], 1)
+        self.assertEqual(store.hardest_words(limit=1)[0]['word'], 'ZEBRA')
+        self.assertEqual([game.word for game in store.history('bob')], ['QUIZ', 'ZEBRA'])
+
+    def test_unexpected_writer_error_is_reported(self):
+        store = GameStatsStore(self.filename, flush_interval=0.01)
+        with mock.patch.object(GameStatsStore, '_write', side_effect=TypeError("bad record")):
+            self.record(store, 'ann', True)
+            with self.assertRaises(RuntimeError) as caught:
+                store.flush()  # Used to hang once the writer thread had died
+        self.assertIsInstance(caught.exception.__cause__, TypeError)
+        with self.assertRaises(RuntimeError):
+            self.record(store, 'ann', True)
+        with self.assertRaises(RuntimeError):
+            store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+"""Tests for the Hangman line-protocol server."""
+
+import asyncio
+import unittest
+from unittest import mock
+
+from hangman_server import HangmanServer, HangmanSession
+
+
+async def _exchange(payload, reply_lines):
+    """Send payload to a fresh in-process server and return the first reply lines."""
+    server = HangmanServer(port=0)
+    await server.start()
+    try:
+        reader, writer = await asyncio.open_connection(server.host, server.port)
+        writer.write(payload)
+        await writer.drain()
+        replies = [(await reader.readline()).decode('ascii') for _ in range(reply_lines)]
+        writer.close()
+        return replies
+    finally:
+        await server.stop()
+
+
+class HangmanServerTest(unittest.TestCase):
+
+    def test_pipelined_commands(self):
+        replies = asyncio.run(_exchange(b"NEW\nSTATE\nQUIT\n", 3))
+        self.assertTrue(replies[0].startswith("GAME "))
+        self.assertTrue(replies[1].startswith("GAME "))
+        self.assertEqual(replies[2], "BYE\n")
+
+    def test_non_ascii_line_keeps_session(self):
+        replies = asyncio.run(_exchange("GUESS é\né\nNEW\n".encode('utf-8'), 3))
+        self.assertEqual(replies[0], "ERROR Commands must be plain ASCII\n")
+        self.assertEqual(replies[1], "ERROR Commands must be plain ASCII\n")
+        self.assertTrue(replies[2].startswith("GAME "))
+
+    def test_unknown_command(self):
+        replies = asyncio.run(_exchange(b"JUMP\nSTATE\n", 2))
+        self.assertEqual(replies[0], "ERROR Unknown command 'JUMP'\n")
+        self.assertEqual(replies[1], "ERROR No game in progress; send NEW\n")
+
+    def test_only_validation_errors_are_answered(self):
+        session = HangmanSession(None, 0.0)
+        with mock.patch.object(HangmanSession, 'handle', side_effect=ValueError("Bad length")):
+            self.assertEqual(HangmanServer._answer(session, b"NEW 5"),
+                             ("ERROR Bad length\n", True))
+        with mock.patch.object(HangmanSession, 'handle', side_effect=RuntimeError("bug")):
+            with self.assertRaises(RuntimeError):
+                HangmanServer._answer(session, b"NEW 5")
+
+
+if __name__ == '__main__':
+    unittest.main()
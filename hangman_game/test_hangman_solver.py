@@ -0,0 +1,53 @@
+"""Tests for the bitmask Hangman solver and its decision cache."""
+
+import unittest
+
+from hangman import HangmanGame
+from hangman_solver import HangmanSolver, play
+
+WORDS = ['python', 'zebra', 'quiz', 'hangman', 'jazz', 'puzzle', 'rhythm', 'sphinx', 'oxygen']
+
+
+class HangmanSolverTest(unittest.TestCase):
+
+    def setUp(self):
+        self.solver = HangmanSolver(WORDS + ['not a word', 'café'])
+
+    def test_non_words_are_skipped(self):
+        self.assertEqual(len(self.solver), len(WORDS))
+
+    def test_solves_every_dictionary_word(self):
+        game = HangmanGame(quiet=True)
+        for word in WORDS:
+            game.reset_game(word)
+            play(game, self.solver)
+            self.assertTrue(game.won, word)
+
+    def test_observe_narrows_candidates(self):
+        guesser = self.solver.new_game(6)
+        guesser.observe('Y', {1})
+        self.assertEqual(guesser.candidate_count(), 1)
+        self.assertEqual(guesser.group.words_in(guesser.candidates), ['PYTHON'])
+
+    def test_guesses_narrow_to_each_word(self):
+        for word in WORDS:
+            word = word.upper()
+            guesser = self.solver.new_game(len(word))
+            while guesser.candidate_count() > 1:
+                letter = guesser.next_letter()
+                guesser.observe(letter, {i for i, shown in enumerate(word) if shown == letter})
+            self.assertEqual(guesser.group.words_in(guesser.candidates), [word])
+
+    def test_decisions_are_cached_per_state(self):
+        game = HangmanGame(quiet=True)
+        game.reset_game('rhythm')
+        first = play(game, self.solver)
+        decisions = dict(self.solver.groups[6].decisions)
+        game.reset_game('rhythm')
+        self.assertEqual(play(game, self.solver), first)
+        self.assertEqual(self.solver.groups[6].decisions, decisions)
+        self.assertEqual(len(decisions), len(first))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+"""Tests for the headless Hangman simulation."""
+
+import os
+import tempfile
+import unittest
+
+import simulation
+from simulation import run_simulation
+
+WORDS = "python\nzebra\nhangman\nquiz\nelephant\ngarden\nrhythm\nsphinx\noxygen\nbanana\n"
+
+RESULT_KEYS = ('wins', 'average_guesses', 'guess_distribution')
+
+
+class SimulationTest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.filename = os.path.join(directory.name, 'words.txt')
+        with open(self.filename, 'w', encoding='ascii') as wordfile:
+            wordfile.write(WORDS)
+
+    def test_results_do_not_depend_on_worker_count(self):
+        for strategy in ('solver', 'random'):
+            options = {'games': 300, 'words_file': self.filename, 'seed': 4, 'shard_size': 70}
+            serial = run_simulation(strategy, **options)
+            for workers in (1, 3):
+                parallel = run_simulation(strategy, workers=workers, **options)
+                for key in RESULT_KEYS:
+                    self.assertEqual(parallel[key], serial[key], (strategy, workers, key))
+
+    def test_solver_indexes_only_the_requested_length(self):
+        results = run_simulation('solver', games=50, words_file=self.filename, word_length=6)
+        self.assertEqual(results['wins'], 50)
+        strategy, corpus = simulation._worker_setup
+        self.assertEqual(list(strategy.groups), [6])
+        corpus.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
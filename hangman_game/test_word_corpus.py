@@ -0,0 +1,102 @@
+"""Tests for the indexed word corpus."""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from word_corpus import INDEX_EXTENSION, WordCorpus, cache_index_filename
+
+WORDS = "python\nzebra\nhangman\nnot a word\nquiz\nelephant\n"
+
+
+class WordCorpusTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.words_dir = os.path.join(self.directory.name, 'dict')
+        os.mkdir(self.words_dir)
+        self.filename = os.path.join(self.words_dir, 'words.txt')
+        with open(self.filename, 'w', encoding='ascii') as wordfile:
+            wordfile.write(WORDS)
+        cache_home = os.path.join(self.directory.name, 'cache')
+        patcher = mock.patch.dict(os.environ, {'XDG_CACHE_HOME': cache_home})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.read_only = []
+        self.real_build_index = WordCorpus.build_index
+        patcher = mock.patch.object(WordCorpus, 'build_index', autospec=True,
+                                    side_effect=self.build_index)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_read_only(self, path):
+        """Make index builds fail in a directory, as they would without write access."""
+        self.read_only.append(path)
+
+    def build_index(self, corpus):
+        if os.path.dirname(corpus.index_filename) in self.read_only:
+            raise PermissionError(13, "Permission denied", corpus.index_filename)
+        return self.real_build_index(corpus)
+
+    def test_index_next_to_word_file(self):
+        with WordCorpus(self.filename) as corpus:
+            self.assertEqual(len(corpus), 5)
+            self.assertEqual(sorted(corpus.words(length=5)), ['zebra'])
+            self.assertEqual(corpus.index_filename, self.filename + INDEX_EXTENSION)
+        self.assertTrue(os.path.exists(self.filename + INDEX_EXTENSION))
+
+    def test_lookups_by_length_and_difficulty(self):
+        with WordCorpus(self.filename) as corpus:
+            self.assertEqual(corpus.lengths(), [4, 5, 6, 7, 8])
+            self.assertEqual(sorted(corpus.words(difficulty='hard')),
+                             ['hangman', 'python', 'quiz', 'zebra'])
+            self.assertEqual(corpus.count(difficulty='medium'), 1)
+            self.assertEqual(corpus.word_at(0, length=8), 'elephant')
+            self.assertEqual(corpus.random_word(length=4), 'quiz')
+            with self.assertRaises(ValueError):
+                corpus.random_word(difficulty='easy')
+            with self.assertRaises(IndexError):
+                corpus.word_at(5)
+
+    def test_changed_word_file_is_reindexed(self):
+        WordCorpus(self.filename).close()
+        with open(self.filename, 'a', encoding='ascii') as wordfile:
+            wordfile.write("rhythm\n")
+        with WordCorpus(self.filename) as corpus:
+            self.assertEqual(len(corpus), 6)
+            self.assertEqual(sorted(corpus.words(length=6)), ['python', 'rhythm'])
+
+    def test_read_only_directory_uses_user_cache(self):
+        self.make_read_only(self.words_dir)
+        with WordCorpus(self.filename) as corpus:
+            self.assertEqual(corpus.index_filename, cache_index_filename(self.filename))
+            self.assertEqual(sorted(corpus.words(length=6)), ['python'])
+        with WordCorpus(self.filename) as corpus:  # Reuses the cached index
+            self.assertEqual(len(corpus), 5)
+
+    def test_nowhere_to_write_builds_index_in_memory(self):
+        self.make_read_only(self.words_dir)
+        self.make_read_only(os.path.dirname(cache_index_filename(self.filename)))
+        with WordCorpus(self.filename) as corpus:
+            self.assertIsNone(corpus.index_filename)
+            self.assertEqual(sorted(corpus.words(length=8)), ['elephant'])
+
+    def test_missing_word_file_creates_nothing(self):
+        missing = os.path.join(self.words_dir, 'missing.txt')
+        with self.assertRaises(FileNotFoundError):
+            WordCorpus(missing)
+        self.assertEqual(os.listdir(self.words_dir), ['words.txt'])
+        self.assertFalse(os.path.exists(os.path.dirname(cache_index_filename(missing))))
+
+    def test_failed_build_leaves_no_temp_file(self):
+        with mock.patch.object(WordCorpus, '_write_index', side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                WordCorpus(self.filename, index_filename=self.filename + INDEX_EXTENSION)
+        self.assertEqual(os.listdir(self.words_dir), ['words.txt'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Word Corpus - Hangman Game
+==========================
+
+Pick random words from very large word lists without loading them into memory.
+
+The word file (one word per line) is scanned once to build an index of line
+offsets, grouped into buckets by word length and difficulty. The index is saved
+next to the word file and reused until the word file changes; if that directory
+is read-only it is saved in the user's cache directory instead, or failing that
+kept in memory for the run. Both files are memory-mapped, so picking a random
+word - from the whole list, one length, one difficulty or both - takes constant
+time and almost no memory, however many millions of words the file holds. Lines
+that are not a single alphabetic word are skipped.
+
+Author: CodeAlpha Intern
+Date: September 2025
+"""
+
+import hashlib
+import io
+import mmap
+import os
+import random
+import struct
+from array import array
+
+INDEX_MAGIC = b'HMIDX'
+INDEX_VERSION = 1
+INDEX_EXTENSION = '.idx'
+
+# Subdirectory of the user cache for indexes that cannot be saved next to their word file
+CACHE_SUBDIRECTORY = 'hangman'
+
+# magic, version, offset typecode, word file size, word file mtime (ns), buckets, words
+INDEX_HEADER = struct.Struct('<5sHcQqII')
+
+# length, difficulty, first slot in the offset table, number of words
+BUCKET_ENTRY = struct.Struct('<HBxII')
+
+DIFFICULTIES = ('easy', 'medium', 'hard')
+
+# The most frequent letters in English; words built from them are found quickly
+COMMON_LETTERS = frozenset('ETAOINSHRDLU')
+
+
+def word_difficulty(word):
+    """Rate a word 'easy', 'medium' or 'hard' to guess.
+    
+    Short words and words using several uncommon letters are hard, long words made
+    only of common letters are easy.
+    """
+    rare_letters = len(set(word.upper()) - COMMON_LETTERS)
+    if len(word) <= 4 or rare_letters >= 2:
+        return 'hard'
+    if len(word) >= 8 and rare_letters == 0:
+        return 'easy'
+    return 'medium'
+
+
+def cache_index_filename(filename):
+    """Return the index path in the user cache for a word file, unique per word file path."""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'),
+                                                                   '.cache')
+    path = os.path.abspath(filename)
+    digest = hashlib.sha1(path.encode('utf-8', 'surrogateescape')).hexdigest()[:16]
+    return os.path.join(cache_home, CACHE_SUBDIRECTORY,
+                        f"{os.path.basename(path)}-{digest}{INDEX_EXTENSION}")
+
+
+class WordCorpus:
+    """A memory-mapped word file with a cached length/difficulty index."""
+    
+    def __init__(self, filename, index_filename=None):
+        """Open a word file, building or refreshing its index if needed.
+        
+        Without an explicit index_filename, a word file in a read-only directory
+        has its index in the user cache, or only in memory (index_filename None).
+        """
+        self.filename = filename
+        self._index_file = None
+        self._source_stamp()  # A missing word file fails here, before any index or cache is made
+        if index_filename is not None:
+            self._open_index(index_filename)
+        else:
+            self._open_default_index()
+        self._read_index()
+        
+        self._word_file = open(filename, 'rb')
+        self._words = self._map(self._word_file)
+    
+    def _open_index(self, index_filename):
+        """Map the index file, building it first if it is missing or out of date."""
+        self.index_filename = index_filename
+        if not self._index_is_current():
+            self.build_index()
+        self._index_file = open(index_filename, 'rb')
+        self._index = self._map(self._index_file)
+    
+    def _open_default_index(self):
+        """Map the index next to the word file, else in the user cache, else build it in memory."""
+        try:
+            self._open_index(self.filename + INDEX_EXTENSION)
+            return
+        except OSError:
+            pass  # Typically a read-only dictionary directory
+        
+        try:
+            cache_filename = cache_index_filename(self.filename)
+            os.makedirs(os.path.dirname(cache_filename), exist_ok=True)
+            self._open_index(cache_filename)
+            return
+        except OSError:
+            pass
+        
+        self.index_filename = None
+        indexfile = io.BytesIO()
+        self._write_index(indexfile)
+        data = indexfile.getbuffer()
+        self._index = mmap.mmap(-1, len(data))
+        self._index.write(data)
+    
+    @staticmethod
+    def _map(fileobj):
+        """Memory-map a whole file read-only."""
+        return mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    def _source_stamp(self):
+        """Return (size, mtime in ns) of the word file, used to detect changes."""
+        stat = os.stat(self.filename)
+        return stat.st_size, stat.st_mtime_ns
+    
+    def _index_is_current(self):
+        """Check whether the index on disk was built from the current word file."""
+        try:
+            with open(self.index_filename, 'rb') as indexfile:
+                header = indexfile.read(INDEX_HEADER.size)
+            magic, version, _, size, mtime, _, _ = INDEX_HEADER.unpack(header)
+        except (OSError, struct.error):
+            return False
+        return ((magic, version) == (INDEX_MAGIC, INDEX_VERSION)
+                and (size, mtime) == self._source_stamp())
+    
+    def build_index(self):
+        """Scan the word file and write its index of word offsets to index_filename."""
+        temp_filename = self.index_filename + '.tmp'
+        try:
+            with open(temp_filename, 'wb') as indexfile:  # Fails early in a read-only directory
+                self._write_index(indexfile)
+            os.replace(temp_filename, self.index_filename)
+        finally:
+            if os.path.exists(temp_filename):  # Only left behind by a failed build
+                os.remove(temp_filename)
+    
+    def _write_index(self, indexfile):
+        """Scan the word file and write its index to an open binary file."""
+        size, mtime = self._source_stamp()
+        typecode = 'I' if size < 2 ** 32 else 'Q'
+        buckets = {}  # (length, difficulty) -> array of line offsets
+        
+        offset = 0
+        with open(self.filename, 'rb') as wordfile:
+            for line in wordfile:
+                word = line.strip()
+                if word.isalpha():  # bytes.isalpha only accepts ASCII letters
+                    key = (len(word), DIFFICULTIES.index(word_difficulty(word.decode('ascii'))))
+                    if key not in buckets:
+                        buckets[key] = array(typecode)
+                    buckets[key].append(offset)
+                offset += len(line)
+        
+        # Buckets are stored in (length, difficulty) order, so each length is one run of slots
+        entries = []
+        slot = 0
+        for key in sorted(buckets):
+            entries.append(BUCKET_ENTRY.pack(key[0], key[1], slot, len(buckets[key])))
+            slot += len(buckets[key])
+        
+        indexfile.write(INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, typecode.encode('ascii'),
+                                          size, mtime, len(entries), slot))
+        indexfile.write(b''.join(entries))
+        indexfile.write(b'\0' * (-indexfile.tell() % 8))  # Align the offset table
+        for key in sorted(buckets):
+            buckets[key].tofile(indexfile)
+    
+    def _read_index(self):
+        """Load the bucket table and view the offset table in place."""
+        _, _, typecode, _, _, bucket_count, word_count = INDEX_HEADER.unpack_from(self._index)
+        if word_count == 0:
+            self._index.close()
+            if self._index_file is not None:
+                self._index_file.close()
+            raise ValueError(f"No words found in {self.filename}")
+        
+        # [((length, difficulty), (first slot, count))] in offset table order
+        self.buckets = []
+        position = INDEX_HEADER.size
+        for _ in range(bucket_count):
+            length, difficulty, start, count = BUCKET_ENTRY.unpack_from(self._index, position)
+            self.buckets.append(((length, DIFFICULTIES[difficulty]), (start, count)))
+            position += BUCKET_ENTRY.size
+        
+        position += -position % 8
+        itemsize = 4 if typecode == b'I' else 8
+        self._offsets = memoryview(self._index)[position:position + word_count * itemsize].cast(
+            typecode.decode('ascii'))
+        self.word_count = word_count
+    
+    def __len__(self):
+        """Return the number of indexed words."""
+        return self.word_count
+    
+    def lengths(self):
+        """Return the word lengths present in the corpus, shortest first."""
+        return sorted({length for (length, _), _ in self.buckets})
+    
+    def _matching_buckets(self, length=None, difficulty=None):
+        """Return [(first slot, count)] of the buckets matching the filters."""
+        if difficulty is not None and difficulty not in DIFFICULTIES:
+            raise ValueError(f"Unknown difficulty '{difficulty}'")
+        return [span for (bucket_length, bucket_difficulty), span in self.buckets
+                if (length is None or bucket_length == length)
+                and (difficulty is None or bucket_difficulty == difficulty)]
+    
+    def count(self, length=None, difficulty=None):
+        """Return how many words match the filters."""
+        return sum(count for _, count in self._matching_buckets(length, difficulty))
+    
+    def _word_at_slot(self, slot):
+        """Read the word whose offset is stored in a slot of the offset table."""
+        start = self._offsets[slot]
+        end = self._words.find(b'\n', start)
+        if end == -1:
+            end = len(self._words)
+        return self._words[start:end].strip().decode('ascii')
+    
+    def word_at(self, index, length=None, difficulty=None):
+        """Return the index-th word among those matching the filters."""
+        for start, count in self._matching_buckets(length, difficulty):
+            if index < count:
+                return self._word_at_slot(start + index)
+            index -= count
+        raise IndexError("Word index out of range")
+    
+    def random_word(self, length=None, difficulty=None, rng=random):
+        """Return a random word matching the filters, each equally likely."""
+        total = self.count(length, difficulty)
+        if total == 0:
+            raise ValueError("No words match the requested length and difficulty")
+        return self.word_at(rng.randrange(total), length, difficulty)
+    
+    def words(self, length=None, difficulty=None):
+        """Yield every word matching the filters."""
+        for start, count in self._matching_buckets(length, difficulty):
+            for slot in range(start, start + count):
+                yield self._word_at_slot(slot)
+    
+    def close(self):
+        """Release the memory maps and files."""
+        if self._index is None:
+            return
+        self._offsets.release()
+        self._words.close()
+        self._index.close()
+        self._word_file.close()
+        if self._index_file is not None:
+            self._index_file.close()
+        self._index = None
+    
+    def __enter__(self):
+        """Support use as a context manager."""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the corpus on leaving the with block."""
+        self.close()
\ No newline at end of file
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Batch Valuation - Stock Portfolio Tracker
+=========================================
+
+Value many client portfolios at once across a pool of worker processes.
+
+The price table is written once into shared memory as a column of doubles; each
+worker attaches to it when it starts and receives only the symbol order, so tasks
+carry nothing but the accounts they value. Totals are summed with math.fsum, like
+StockPortfolioTracker.calculate_portfolio_value, so the results match it exactly.
+Positions in symbols missing from the price table are skipped and reported per
+account, as the tracker skips unknown symbols on import.
+
+Author: CodeAlpha Intern
+Date: September 2025
+"""
+
+import argparse
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from multiprocessing import shared_memory
+
+# Accounts sent to a worker per task
+DEFAULT_CHUNK_SIZE = 256
+
+# Per-worker view of the shared price table, set up by _attach_prices
+_shared_block = None
+_prices = None
+_symbol_index = None
+
+
+def _attach_prices(block_name, symbols):
+    """Worker initializer: map the shared price column and index its symbols."""
+    global _shared_block, _prices, _symbol_index
+    _shared_block = shared_memory.SharedMemory(name=block_name)
+    _prices = _shared_block.buf[:8 * len(symbols)].cast('d')
+    _symbol_index = {symbol: i for i, symbol in enumerate(symbols)}
+
+
+def _value_accounts(accounts, include_positions):
+    """Value a chunk of (account_id, portfolio) pairs against the shared prices."""
+    results = []
+    for account_id, portfolio in accounts:
+        positions = []
+        values = []
+        unknown = []
+        for stock, quantity in portfolio.items():
+            index = _symbol_index.get(stock)
+            if index is None:
+                unknown.append(stock)
+                continue
+            price = _prices[index]
+            value = price * quantity
+            values.append(value)
+            if include_positions:
+                positions.append((stock, quantity, price, value))
+        results.append((account_id, math.fsum(values), positions, unknown))
+    return results
+
+
+def _chunked_accounts(portfolios, chunk_size):
+    """Yield lists of (account_id, portfolio) pairs of at most chunk_size."""
+    chunk = []
+    for account in portfolios.items():
+        chunk.append(account)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def value_portfolios(portfolios, stock_prices, workers=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                     include_positions=True):
+    """Value {account_id: portfolio} against one price table using a process pool.
+    
+    Returns {account_id: {'total': float, 'positions': [(stock, quantity, price, value)],
+    'unknown': [symbols without a price, left out of the total]}}.
+    """
+    symbols = list(stock_prices)
+    block = shared_memory.SharedMemory(create=True, size=max(8 * len(symbols), 8))
+    try:
+        prices = block.buf[:8 * len(symbols)].cast('d')
+        for i, symbol in enumerate(symbols):
+            prices[i] = stock_prices[symbol]
+        prices.release()
+        
+        results = {}
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach_prices,
+                                 initargs=(block.name, symbols)) as pool:
+            value_chunk = partial(_value_accounts, include_positions=include_positions)
+            for chunk_results in pool.map(value_chunk, _chunked_accounts(portfolios, chunk_size)):
+                for account_id, total_value, positions, unknown in chunk_results:
+                    results[account_id] = {'total': total_value, 'positions': positions,
+                                           'unknown': unknown}
+        return results
+    finally:
+        block.close()
+        block.unlink()
+
+
+def value_trackers(trackers, stock_prices=None, **options):
+    """Value {account_id: StockPortfolioTracker} in parallel against one price table.
+    
+    Without stock_prices the trackers' own tables are combined, which requires
+    them to agree: a symbol priced differently by two trackers raises ValueError.
+    """
+    if stock_prices is None:
+        stock_prices = _combined_prices(trackers)
+    portfolios = {account_id: tracker.portfolio for account_id, tracker in trackers.items()}
+    return value_portfolios(portfolios, stock_prices, **options)
+
+
+def _combined_prices(trackers):
+    """Merge the trackers' price tables, raising ValueError where they disagree."""
+    stock_prices = {}
+    seen_tables = set()
+    for account_id, tracker in trackers.items():
+        table = tracker.stock_prices
+        if id(table) in seen_tables:
+            continue  # Shared with an earlier tracker (see use_price_table)
+        seen_tables.add(id(table))
+        for symbol, price in table.items():
+            known = stock_prices.setdefault(symbol, price)
+            if known != price:
+                raise ValueError(f"Account {account_id} prices {symbol} at {price}, another "
+                                 f"account at {known}; pass one stock_prices table")
+    return stock_prices
+
+
+def _synthetic_accounts(accounts, positions, universe, seed=0):
+    """Build a reproducible price table and a set of random client portfolios."""
+    rng = random.Random(seed)
+    symbols = [f"SYM{i:05d}" for i in range(universe)]
+    stock_prices = {symbol: round(rng.uniform(1.0, 1000.0), 2) for symbol in symbols}
+    portfolios = {
+        f"ACCT{a:06d}": {symbol: rng.randint(1, 500) for symbol in rng.sample(symbols, positions)}
+        for a in range(accounts)
+    }
+    return portfolios, stock_prices
+
+
+def main():
+    """Compare serial and process-pool valuation of synthetic accounts."""
+    parser = argparse.ArgumentParser(description="Benchmark batch valuation of many portfolios.")
+    parser.add_argument('--accounts', type=int, default=5000, help="number of client accounts")
+    parser.add_argument('--positions', type=int, default=200, help="positions per account")
+    parser.add_argument('--universe', type=int, default=5000, help="symbols in the price table")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="worker processes")
+    args = parser.parse_args()
+    
+    portfolios, stock_prices = _synthetic_accounts(args.accounts, args.positions, args.universe)
+    
+    start_time = time.perf_counter()
+    serial = {}
+    for account_id, portfolio in portfolios.items():
+        serial[account_id] = math.fsum(stock_prices[stock] * quantity
+                                       for stock, quantity in portfolio.items())
+    serial_seconds = time.perf_counter() - start_time
+    
+    start_time = time.perf_counter()
+    results = value_portfolios(portfolios, stock_prices, workers=args.workers,
+                               include_positions=False)
+    parallel_seconds = time.perf_counter() - start_time
+    
+    matches = all(results[account_id]['total'] == total for account_id, total in serial.items())
+    print(f"Serial:   {serial_seconds:.2f}s")
+    print(f"Parallel: {parallel_seconds:.2f}s with {args.workers} workers "
+          f"({serial_seconds / parallel_seconds:.1f}x)")
+    print(f"Totals match serial valuation: {'✅' if matches else '❌'}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
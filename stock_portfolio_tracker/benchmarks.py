@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Benchmarks - Stock Portfolio Tracker
+====================================
+
+Reproducible timings of the tracker's hot paths as the portfolio grows.
+
+For every portfolio size a synthetic price table and portfolio are generated
+from a fixed seed, and each path is timed (best of several runs) and then run
+once more under tracemalloc for its peak memory. Results are written as JSON,
+and can be compared against a stored baseline so that slowdowns or memory growth
+beyond a tolerance are reported as regressions.
+
+Author: CodeAlpha Intern
+Date: September 2025
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+
+from stock_tracker import StockPortfolioTracker, np
+
+RESULTS_VERSION = 1
+
+# Portfolio sizes benchmarked by default, from 10 to 10 million positions
+DEFAULT_SIZES = (10, 100, 1000, 10000, 100000, 1000000, 10000000)
+
+# Add/remove pairs timed per size, at most
+POSITION_UPDATES = 10000
+
+# Timings and peaks below these are too noisy to flag as regressions
+MIN_COMPARED_SECONDS = 0.001
+MIN_COMPARED_BYTES = 1024 * 1024
+
+
+def synthetic_portfolio(size, seed=0):
+    """Return a reproducible (stock_prices, portfolio) pair with size positions."""
+    rng = random.Random(seed)
+    symbols = [f"SYM{i:08d}" for i in range(size)]
+    stock_prices = {symbol: round(rng.uniform(1.0, 1000.0), 2) for symbol in symbols}
+    portfolio = {symbol: rng.randint(1, 1000) for symbol in symbols}
+    return stock_prices, portfolio
+
+
+def build_tracker(stock_prices, portfolio):
+    """Return a tracker holding portfolio, valued against stock_prices."""
+    tracker = StockPortfolioTracker()
+    tracker.replace_stock_prices(stock_prices)
+    tracker._reset_positions(portfolio, record=False)
+    return tracker
+
+
+def _position_updates(tracker, symbols):
+    """Return a callable adding and then removing one share of each symbol."""
+    def run():
+        for symbol in symbols:
+            tracker.add_position(symbol, 1)
+            tracker.remove_position(symbol, 1)
+    return run
+
+
+def _benchmark_paths(tracker, directory, seed):
+    """Return [(name, operations, callable)] for every benchmarked path."""
+    rng = random.Random(seed)
+    symbols = list(tracker.portfolio)
+    update_symbols = rng.sample(symbols, min(len(symbols), POSITION_UPDATES))
+    csv_file = os.path.join(directory, 'portfolio.csv')
+    txt_file = os.path.join(directory, 'portfolio.txt')
+    
+    return [
+        ('calculate_portfolio_value', 1, tracker.calculate_portfolio_value),
+        ('revalue_all_positions', len(symbols), tracker._value_positions),
+        ('display_portfolio', len(symbols), tracker.display_portfolio),
+        ('save_as_csv', len(symbols), lambda: tracker._save_as_csv(csv_file)),
+        ('save_as_txt', len(symbols), lambda: tracker._save_as_txt(txt_file)),
+        ('add_remove_position', 2 * len(update_symbols),
+         _position_updates(tracker, update_symbols))
+    ]
+
+
+def _time_path(function, repeat):
+    """Return the best wall-clock time of repeat runs of function."""
+    best = float('inf')
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start_time)
+    return best
+
+
+def _peak_memory(function):
+    """Return the peak bytes allocated while function runs."""
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_benchmarks(sizes, repeat=3, seed=0, measure_memory=True, progress=None):
+    """Benchmark every path at every portfolio size and return the result records."""
+    results = []
+    with tempfile.TemporaryDirectory() as directory, open(os.devnull, 'w') as devnull:
+        for size in sizes:
+            stock_prices, portfolio = synthetic_portfolio(size, seed)
+            tracker = build_tracker(stock_prices, portfolio)
+            del stock_prices, portfolio
+            
+            for name, operations, function in _benchmark_paths(tracker, directory, seed):
+                # Console output goes nowhere, so only formatting cost is measured
+                with redirect_stdout(devnull):
+                    seconds = _time_path(function, repeat)
+                    peak_bytes = _peak_memory(function) if measure_memory else None
+                
+                record = {
+                    'path': name,
+                    'size': size,
+                    'operations': operations,
+                    'seconds': seconds,
+                    'ops_per_second': operations / seconds if seconds > 0 else None,
+                    'peak_bytes': peak_bytes
+                }
+                results.append(record)
+                if progress is not None:
+                    progress(record)
+    return results
+
+
+def compare_results(results, baseline, tolerance=0.25, memory_tolerance=0.10):
+    """Return a list of messages for results that regressed against the baseline.
+    
+    A path regresses if it is slower than the baseline by more than tolerance, or
+    uses more peak memory than it by more than memory_tolerance (both fractions).
+    Paths too fast or too small to measure reliably are not compared.
+    """
+    previous = {(record['path'], record['size']): record for record in baseline['results']}
+    regressions = []
+    
+    for record in results:
+        old = previous.get((record['path'], record['size']))
+        if old is None:
+            continue
+        
+        label = f"{record['path']} @ {record['size']:,}"
+        if (old['seconds'] >= MIN_COMPARED_SECONDS
+                and record['seconds'] > old['seconds'] * (1 + tolerance)):
+            regressions.append(f"{label}: {old['seconds'] * 1000:.2f} ms -> "
+                               f"{record['seconds'] * 1000:.2f} ms")
+        if (record['peak_bytes'] is not None and old.get('peak_bytes') is not None
+                and old['peak_bytes'] >= MIN_COMPARED_BYTES
+                and record['peak_bytes'] > old['peak_bytes'] * (1 + memory_tolerance)):
+            regressions.append(f"{label}: peak memory {old['peak_bytes']:,} -> "
+                               f"{record['peak_bytes']:,} bytes")
+    return regressions
+
+
+def _print_record(record):
+    """Print one result as a table row."""
+    peak = ''
+    if record['peak_bytes'] is not None:
+        peak = f"{record['peak_bytes'] / 1024 / 1024:10.1f}"
+    print(f"{record['path']:<26} {record['size']:>10,} {record['seconds'] * 1000:>12.3f} {peak}")
+
+
+def main():
+    """Run the benchmarks, save the results and compare them against a baseline."""
+    parser = argparse.ArgumentParser(description="Benchmark the portfolio tracker's hot paths.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help="portfolio sizes to benchmark")
+    parser.add_argument('--max-size', type=int, default=1000000,
+                        help="skip sizes above this (raise to 10000000 for the full range)")
+    parser.add_argument('--repeat', type=int, default=3, help="timed runs per path (best is kept)")
+    parser.add_argument('--seed', type=int, default=0, help="seed for the synthetic data")
+    parser.add_argument('--no-memory', action='store_true', help="skip peak memory measurement")
+    parser.add_argument('--output', default='benchmark_results.json', help="where to write results")
+    parser.add_argument('--baseline', help="results file to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="allowed slowdown against the baseline (0.25 = 25%%)")
+    args = parser.parse_args()
+    
+    sizes = [size for size in args.sizes if size <= args.max_size]
+    print(f"{'Path':<26} {'Positions':>10} {'Time (ms)':>12} {'Peak (MiB)':>10}")
+    print("-" * 61)
+    results = run_benchmarks(sizes, args.repeat, args.seed, not args.no_memory,
+                             progress=_print_record)
+    
+    with open(args.output, 'w', encoding='utf-8') as outfile:
+        json.dump({
+            'version': RESULTS_VERSION,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'numpy': np.__version__ if np is not None else None,
+            'seed': args.seed,
+            'results': results
+        }, outfile, indent=2)
+    print(f"\n✅ Results written to {args.output}")
+    
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as basefile:
+            baseline = json.load(basefile)
+        regressions = compare_results(results, baseline, args.tolerance)
+        if regressions:
+            print(f"❌ {len(regressions)} regression(s) against {args.baseline}:")
+            for message in regressions:
+                print(f"   {message}")
+            sys.exit(1)
+        print(f"✅ No regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Instrumentation - Stock Portfolio Tracker
+=========================================
+
+Opt-in metrics and profiling for a StockPortfolioTracker.
+
+instrument_tracker wraps the tracker's public operations, its file writers, the
+quote cache lookups and the menu dispatch on one instance, recording call counts,
+errors, latency histograms and bytes written per save. Time spent waiting at a
+prompt for the user to type is left out of every latency. Nothing is wrapped unless
+instrumentation is turned on, so an uninstrumented tracker pays nothing. Metrics
+can be dumped as JSON or in the Prometheus text format.
+
+Turned on from the environment by stock_tracker.py:
+
+    PORTFOLIO_METRICS=metrics.json        write metrics on exit (.prom for Prometheus text)
+    PORTFOLIO_PROFILE=profile.pstats      cProfile a sample of operations into this file
+    PORTFOLIO_PROFILE_EVERY=10            profile one operation in this many (default 10)
+
+Author: CodeAlpha Intern
+Date: September 2025
+"""
+
+import cProfile
+import json
+import os
+import sys
+import time
+from bisect import bisect_left
+from functools import wraps
+
+METRICS_ENV = 'PORTFOLIO_METRICS'
+PROFILE_ENV = 'PORTFOLIO_PROFILE'
+PROFILE_EVERY_ENV = 'PORTFOLIO_PROFILE_EVERY'
+DEFAULT_PROFILE_EVERY = 10
+
+# Upper bounds (seconds) of the latency histogram buckets; slower calls land in +Inf
+LATENCY_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+# Tracker methods timed as operations
+TRACKED_OPERATIONS = (
+    'refresh_prices', 'display_available_stocks', 'add_stock_to_portfolio',
+    'remove_stock_from_portfolio', 'calculate_portfolio_value', 'get_positions',
+    'display_portfolio', 'save_portfolio_to_file', 'import_portfolio_from_file',
+    'load_demo_portfolio', 'clear_portfolio', 'update_stock_price', 'replace_stock_prices',
+    'add_position', 'remove_position', 'search_stocks', 'clear_positions', 'export_portfolio',
+    'import_positions_from_csv', 'import_positions_from_snapshot'
+)
+
+# File writers, which also record the size of what they wrote
+TRACKED_WRITERS = {
+    '_write_csv': 'write_csv',
+    '_write_txt': 'write_txt',
+    '_write_snapshot': 'write_snapshot'
+}
+
+# Main menu choices recorded as their own operation; any other input counts as menu:invalid
+MENU_CHOICES = frozenset('123456789')
+
+PROMETHEUS_PREFIX = 'portfolio_tracker'
+
+
+def _label_value(value):
+    """Escape a Prometheus label value: backslash, double quote and newline."""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class LatencyHistogram:
+    """Call latencies counted into fixed buckets, plus their sum."""
+    
+    __slots__ = ('bucket_counts', 'count', 'total_seconds')
+    
+    def __init__(self):
+        """Start with every bucket empty."""
+        self.bucket_counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total_seconds = 0.0
+    
+    def observe(self, seconds):
+        """Count one call that took seconds."""
+        self.bucket_counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total_seconds += seconds
+    
+    def to_dict(self):
+        """Return the histogram as plain data, with per-bucket (not cumulative) counts."""
+        bounds = [str(bound) for bound in LATENCY_BUCKETS] + ['+Inf']
+        return {
+            'count': self.count,
+            'sum_seconds': self.total_seconds,
+            'buckets': dict(zip(bounds, self.bucket_counts))
+        }
+
+
+class TrackerMetrics:
+    """Counters, latency histograms and byte totals per tracker operation."""
+    
+    def __init__(self):
+        """Start with no recorded operations."""
+        self.calls = {}
+        self.errors = {}
+        self.latencies = {}
+        self.bytes_written = {}
+    
+    def observe(self, operation, seconds, failed=False):
+        """Record one call of an operation."""
+        self.calls[operation] = self.calls.get(operation, 0) + 1
+        if failed:
+            self.errors[operation] = self.errors.get(operation, 0) + 1
+        histogram = self.latencies.get(operation)
+        if histogram is None:
+            histogram = self.latencies[operation] = LatencyHistogram()
+        histogram.observe(seconds)
+    
+    def add_bytes(self, operation, size):
+        """Record bytes written by one call of an operation."""
+        self.bytes_written[operation] = self.bytes_written.get(operation, 0) + size
+    
+    def to_dict(self):
+        """Return all metrics as JSON-ready data."""
+        return {
+            'calls': dict(self.calls),
+            'errors': dict(self.errors),
+            'latency_seconds': {operation: histogram.to_dict()
+                                for operation, histogram in self.latencies.items()},
+            'bytes_written': dict(self.bytes_written)
+        }
+    
+    def to_json(self):
+        """Return all metrics as a JSON document."""
+        return json.dumps(self.to_dict(), indent=2, sort_keys=True)
+    
+    def to_prometheus(self):
+        """Return all metrics in the Prometheus text exposition format."""
+        lines = []
+        
+        def counter(name, help_text, values):
+            lines.append(f"# HELP {PROMETHEUS_PREFIX}_{name} {help_text}")
+            lines.append(f"# TYPE {PROMETHEUS_PREFIX}_{name} counter")
+            for operation in sorted(values):
+                label = _label_value(operation)
+                lines.append(f'{PROMETHEUS_PREFIX}_{name}{{operation="{label}"}} '
+                             f'{values[operation]}')
+        
+        counter('calls_total', "Calls per tracker operation.", self.calls)
+        counter('errors_total', "Calls per tracker operation that raised.", self.errors)
+        counter('bytes_written_total', "Bytes written to files per operation.", self.bytes_written)
+        
+        name = f"{PROMETHEUS_PREFIX}_latency_seconds"
+        lines.append(f"# HELP {name} Latency of tracker operations.")
+        lines.append(f"# TYPE {name} histogram")
+        for operation in sorted(self.latencies):
+            histogram = self.latencies[operation]
+            label = _label_value(operation)
+            cumulative = 0
+            for bound, bucket_count in zip(LATENCY_BUCKETS + ('+Inf',), histogram.bucket_counts):
+                cumulative += bucket_count
+                lines.append(f'{name}_bucket{{operation="{label}",le="{bound}"}} {cumulative}')
+            lines.append(f'{name}_sum{{operation="{label}"}} {histogram.total_seconds}')
+            lines.append(f'{name}_count{{operation="{label}"}} {histogram.count}')
+        
+        return "\n".join(lines) + "\n"
+    
+    def dump(self, filename):
+        """Write the metrics to filename: Prometheus text for .prom files, JSON otherwise."""
+        text = self.to_prometheus() if filename.endswith('.prom') else self.to_json()
+        with open(filename, 'w', encoding='utf-8') as metricsfile:
+            metricsfile.write(text)
+
+
+class SamplingProfiler:
+    """cProfile that is switched on for one top-level operation in every so many."""
+    
+    def __init__(self, every=10):
+        """Profile one operation out of every calls."""
+        self.every = max(1, every)
+        self.profile = cProfile.Profile()
+        self.sampled = 0
+        self._calls = 0
+        self._active = False
+    
+    def start(self):
+        """Start profiling if this call is sampled; return whether it was."""
+        if self._active:
+            return False  # Nested inside an operation that is already being profiled
+        self._calls += 1
+        if self._calls % self.every:
+            return False
+        self._active = True
+        self.sampled += 1
+        self.profile.enable()
+        return True
+    
+    def stop(self):
+        """Stop profiling the current sample."""
+        self.profile.disable()
+        self._active = False
+    
+    def dump(self, filename):
+        """Write the collected samples as a pstats file."""
+        self.profile.dump_stats(filename)
+
+
+class Instrumentation:
+    """Metrics, an optional sampling profiler and where to write them on exit."""
+    
+    def __init__(self, metrics_file=None, profile_file=None, profile_every=DEFAULT_PROFILE_EVERY):
+        """Collect metrics always; profile only if a profile file is given."""
+        self.metrics = TrackerMetrics()
+        self.metrics_file = metrics_file
+        self.profile_file = profile_file
+        self.profiler = SamplingProfiler(profile_every) if profile_file else None
+        self.input_wait = 0.0  # Total seconds spent waiting at prompts
+    
+    @classmethod
+    def from_environment(cls, environ=None):
+        """Return Instrumentation configured from environment variables, or None if off."""
+        environ = os.environ if environ is None else environ
+        metrics_file = environ.get(METRICS_ENV)
+        profile_file = environ.get(PROFILE_ENV)
+        if not metrics_file and not profile_file:
+            return None
+        
+        profile_every = environ.get(PROFILE_EVERY_ENV, DEFAULT_PROFILE_EVERY)
+        try:
+            profile_every = int(profile_every)
+        except ValueError:
+            print(f"⚠️  Ignoring {PROFILE_EVERY_ENV}={profile_every!r} (not a whole number); "
+                  f"profiling one operation in {DEFAULT_PROFILE_EVERY}", file=sys.stderr)
+            profile_every = DEFAULT_PROFILE_EVERY
+        return cls(metrics_file, profile_file, profile_every)
+    
+    def call(self, operation, function, args, kwargs, count_bytes=False):
+        """Call function, recording its latency (and bytes written, for writers)."""
+        profiling = self.profiler is not None and self.profiler.start()
+        failed = True
+        input_wait = self.input_wait
+        start_time = time.perf_counter()
+        try:
+            result = function(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            elapsed = time.perf_counter() - start_time - (self.input_wait - input_wait)
+            self.metrics.observe(operation, elapsed, failed)
+            if profiling:
+                self.profiler.stop()
+            if count_bytes and not failed:
+                self.metrics.add_bytes(operation, os.path.getsize(args[0]))
+    
+    def wrap(self, operation, function, count_bytes=False):
+        """Return function wrapped to record every call as the given operation."""
+        @wraps(function)
+        def instrumented(*args, **kwargs):
+            return self.call(operation, function, args, kwargs, count_bytes)
+        return instrumented
+    
+    def wrap_menu(self, function):
+        """Return the menu dispatch wrapped to record each choice as its own operation.
+        
+        Unrecognised input is recorded as menu:invalid, so typing cannot create
+        new metrics without bound.
+        """
+        @wraps(function)
+        def instrumented(choice):
+            operation = f"menu:{choice}" if choice in MENU_CHOICES else "menu:invalid"
+            return self.call(operation, function, (choice,), {})
+        return instrumented
+    
+    def wrap_prompt(self, function):
+        """Return the prompt wrapped to add the time spent waiting for input to input_wait."""
+        @wraps(function)
+        def instrumented(*args, **kwargs):
+            start_time = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.input_wait += time.perf_counter() - start_time
+        return instrumented
+    
+    def dump(self):
+        """Write metrics and profile samples to their configured files."""
+        if self.metrics_file:
+            self.metrics.dump(self.metrics_file)
+        if self.profiler is not None:
+            self.profiler.dump(self.profile_file)
+
+
+def instrument_tracker(tracker, instrumentation=None):
+    """Wrap a tracker's operations on this instance only; return the Instrumentation."""
+    if instrumentation is None:
+        instrumentation = Instrumentation()
+    
+    for name in TRACKED_OPERATIONS:
+        setattr(tracker, name, instrumentation.wrap(name, getattr(tracker, name)))
+    for name, operation in TRACKED_WRITERS.items():
+        setattr(tracker, name, instrumentation.wrap(operation, getattr(tracker, name),
+                                                    count_bytes=True))
+    
+    tracker._handle_menu_choice = instrumentation.wrap_menu(tracker._handle_menu_choice)
+    tracker._prompt = instrumentation.wrap_prompt(tracker._prompt)
+    cache = tracker.quote_cache
+    cache.get_quotes = instrumentation.wrap('quote_cache.get_quotes', cache.get_quotes)
+    return instrumentation
\ No newline at end of file
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Load Test - Stock Portfolio Tracker
+===================================
+
+Drive the valuation service with many concurrent keep-alive clients.
+
+Accounts are seeded with random positions first. Then every client sends a mix of
+single-account valuations, batched valuations and occasional price updates over
+its own connection, and the run reports requests per second and latency
+percentiles. Without --port an in-process server on a free local port is used.
+
+Author: CodeAlpha Intern
+Date: September 2025
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from stock_tracker import DEFAULT_STOCK_PRICES
+from valuation_server import ValuationServer, ValuationService
+
+
+class ServiceClient:
+    """One keep-alive HTTP/JSON connection to the valuation service."""
+    
+    def __init__(self, host, port):
+        """Remember the service address; connect() opens the connection."""
+        self.host = host
+        self.port = port
+        self._reader = None
+        self._writer = None
+    
+    async def connect(self):
+        """Open the connection."""
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+    
+    async def request(self, method, path, payload=None):
+        """Send one request and return (status, decoded JSON body)."""
+        body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+        self._writer.write(f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+                           f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+                           "Connection: keep-alive\r\n\r\n".encode('ascii') + body)
+        await self._writer.drain()
+        
+        status_line = await self._reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Valuation service closed the connection")
+        
+        headers = {}
+        while True:
+            line = await self._reader.readline()
+            if line in (b'\r\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        
+        response = await self._reader.readexactly(int(headers.get('content-length', 0)))
+        return int(status_line.split()[1]), json.loads(response.decode('utf-8'))
+    
+    async def close(self):
+        """Close the connection."""
+        if self._writer is not None:
+            self._writer.close()
+            await self._writer.wait_closed()
+
+
+def _percentile(sorted_values, fraction):
+    """Return the value at the given fraction of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+async def _seed_accounts(client, accounts, positions, rng):
+    """Give every account a few random positions."""
+    symbols = list(DEFAULT_STOCK_PRICES)
+    for account_id in accounts:
+        for symbol in rng.sample(symbols, positions):
+            await client.request('POST', f"/accounts/{account_id}/positions",
+                                 {'symbol': symbol, 'quantity': rng.randint(1, 100)})
+
+
+async def _client_loop(client, accounts, args, rng, latencies, counts):
+    """Send this client's share of requests and record each latency."""
+    symbols = list(DEFAULT_STOCK_PRICES)
+    for _ in range(args.requests):
+        roll = rng.random()
+        if roll < args.price_update_rate:
+            kind, method, path = 'prices', 'POST', '/prices'
+            payload = {rng.choice(symbols): round(rng.uniform(10.0, 500.0), 2)}
+        elif roll < args.price_update_rate + args.batch_rate:
+            kind, method, path = 'valuations', 'POST', '/valuations'
+            payload = {'accounts': rng.sample(accounts, min(args.batch_size, len(accounts)))}
+        else:
+            kind, method, path = 'value', 'GET', f"/accounts/{rng.choice(accounts)}/value"
+            payload = None
+        
+        start_time = time.perf_counter()
+        status, _ = await client.request(method, path, payload)
+        latencies.append(time.perf_counter() - start_time)
+        counts[kind] = counts.get(kind, 0) + 1
+        if status != 200:
+            counts['errors'] = counts.get('errors', 0) + 1
+
+
+async def run_load_test(host, port, args):
+    """Seed the accounts, run all clients at once and return the run statistics."""
+    rng = random.Random(args.seed)
+    accounts = [f"load{i}" for i in range(args.accounts)]
+    
+    seeder = ServiceClient(host, port)
+    await seeder.connect()
+    try:
+        await _seed_accounts(seeder, accounts, args.positions, rng)
+    finally:
+        await seeder.close()
+    
+    clients = [ServiceClient(host, port) for _ in range(args.clients)]
+    await asyncio.gather(*(client.connect() for client in clients))
+    latencies = []
+    counts = {}
+    start_time = time.perf_counter()
+    try:
+        await asyncio.gather(*(
+            _client_loop(client, accounts, args, random.Random(args.seed + i + 1),
+                         latencies, counts)
+            for i, client in enumerate(clients)
+        ))
+    finally:
+        await asyncio.gather(*(client.close() for client in clients))
+    elapsed = time.perf_counter() - start_time
+    
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'errors': counts.pop('errors', 0),
+        'by_kind': counts,
+        'seconds': elapsed,
+        'requests_per_second': len(latencies) / elapsed if elapsed else 0.0,
+        'p50_ms': _percentile(latencies, 0.50) * 1000,
+        'p99_ms': _percentile(latencies, 0.99) * 1000
+    }
+
+
+async def _main(args):
+    """Run against the given service, or an in-process one if no port was given."""
+    server = None
+    host, port = args.host, args.port
+    if port is None:
+        server = ValuationServer(ValuationService(), host, 0)
+        await server.start()
+        port = server.port
+    
+    try:
+        stats = await run_load_test(host, port, args)
+    finally:
+        if server is not None:
+            await server.stop()
+    
+    kinds = "  ".join(f"{kind}: {count:,}" for kind, count in sorted(stats['by_kind'].items()))
+    print(f"✅ {stats['requests']:,} requests from {args.clients} clients "
+          f"in {stats['seconds']:.2f}s ({stats['requests_per_second']:,.0f} requests/sec)")
+    print(f"Latency p50: {stats['p50_ms']:.2f} ms  p99: {stats['p99_ms']:.2f} ms")
+    print(f"{kinds}  errors: {stats['errors']}")
+
+
+def main():
+    """Load-test the valuation service from the command line."""
+    parser = argparse.ArgumentParser(description="Load-test the portfolio valuation service.")
+    parser.add_argument('--host', default='127.0.0.1', help="service address")
+    parser.add_argument('--port', type=int, default=None,
+                        help="service port (default: start an in-process server)")
+    parser.add_argument('--clients', type=int, default=32, help="concurrent connections")
+    parser.add_argument('--requests', type=int, default=500, help="requests per client")
+    parser.add_argument('--accounts', type=int, default=200, help="accounts to seed")
+    parser.add_argument('--positions', type=int, default=5, help="positions per account")
+    parser.add_argument('--batch-size', type=int, default=50, help="accounts per batched valuation")
+    parser.add_argument('--batch-rate', type=float, default=0.1,
+                        help="fraction of requests that are batched valuations")
+    parser.add_argument('--price-update-rate', type=float, default=0.01,
+                        help="fraction of requests that publish a price change")
+    parser.add_argument('--seed', type=int, default=0, help="random seed")
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
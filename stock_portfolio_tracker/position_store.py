@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Position Store - Stock Portfolio Tracker
+========================================
+
+The tracker's positions in compact columns, and exact decimal valuation for exports.
+
+A PositionStore is a mapping of symbol to quantity, changed only through set(),
+kept as a list of symbols and an aligned int64 quantity array plus a dict from
+symbol to slot. It is the tracker's only copy of its positions: market values are not stored per
+position but computed from the current price when they are needed, and the
+quantity column is handed to NumPy without copying. A removed position leaves an
+empty slot, so the others keep the order they were added in, and the columns are
+compacted once half of the slots are empty.
+
+Exports are valued exactly. A price that is a whole number of cents is valued
+with integers; any other price is taken at its shortest decimal form (0.004 stays
+0.004) and multiplied as a Decimal. Only the row values and the total are rounded
+to cents, so totals do not drift however many positions are added up, sub-cent
+prices are not lost, and the result is the same in every run.
+
+Author: CodeAlpha Intern
+Date: September 2025
+"""
+
+from array import array
+from collections.abc import Mapping
+from decimal import MAX_EMAX, MAX_PREC, MIN_EMIN, ROUND_HALF_UP, Context, Decimal
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the columns are then only used from Python
+    np = None
+
+# Largest quantity an int64 column can hold
+INT64_MAX = 2 ** 63 - 1
+
+# Below this many cents a float division still formats to the exact amount
+FLOAT_FORMAT_LIMIT = 2 ** 50
+
+# Prices with a whole number of cents below this are valued with plain integers
+EXACT_CENTS_LIMIT = 10 ** 15
+
+# Empty slots tolerated before the columns are compacted (and at least half must be empty)
+MIN_COMPACT_SLOTS = 64
+
+# Decimal arithmetic without rounding, for sums and products of exact amounts
+EXACT = Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN)
+CENT = Decimal('0.01')
+
+
+def price_cents(price):
+    """Return a price as a whole number of cents if it is exactly one, else None."""
+    cents = round(price * 100)
+    if -EXACT_CENTS_LIMIT < cents < EXACT_CENTS_LIMIT and cents / 100 == price:
+        return cents
+    return None
+
+
+def exact_price(price):
+    """Return a price as the Decimal of its shortest round-tripping form, e.g. 0.004."""
+    return Decimal(repr(price))
+
+
+def format_cents(cents):
+    """Format a number of cents as a decimal amount, e.g. 123456 -> '1234.56'."""
+    if -FLOAT_FORMAT_LIMIT < cents < FLOAT_FORMAT_LIMIT:
+        return f"{cents / 100:.2f}"
+    sign = '-' if cents < 0 else ''
+    whole, fraction = divmod(abs(cents), 100)
+    return f"{sign}{whole}.{fraction:02d}"
+
+
+def format_amount(amount):
+    """Format a Decimal amount rounded to cents, e.g. Decimal('3999.995') -> '4000.00'."""
+    return str(amount.quantize(CENT, rounding=ROUND_HALF_UP, context=EXACT))
+
+
+class PositionStore(Mapping):
+    """Symbols with int64 quantities in aligned columns; a {symbol: quantity} mapping."""
+    
+    __slots__ = ('symbols', 'quantities', '_slots')
+    
+    def __init__(self, positions=()):
+        """Start with the positions of a {symbol: quantity} mapping or (symbol, quantity) pairs."""
+        self.symbols = []            # None marks the slot of a removed position
+        self.quantities = array('q')
+        self._slots = {}             # symbol -> slot
+        if isinstance(positions, Mapping):
+            positions = positions.items()
+        for symbol, quantity in positions:
+            self.set(symbol, quantity)
+    
+    def __getitem__(self, symbol):
+        """Return the quantity held of a symbol."""
+        return self.quantities[self._slots[symbol]]
+    
+    def get(self, symbol, default=None):
+        """Return the quantity held of a symbol, or default if none is held."""
+        slot = self._slots.get(symbol)
+        return default if slot is None else self.quantities[slot]
+    
+    def __contains__(self, symbol):
+        """Check whether a symbol is held."""
+        return symbol in self._slots
+    
+    def __iter__(self):
+        """Yield the held symbols in the order they were added."""
+        return (symbol for symbol in self.symbols if symbol is not None)
+    
+    def __len__(self):
+        """Return the number of positions."""
+        return len(self._slots)
+    
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self.positions())!r})"
+    
+    def __reduce__(self):
+        """Pickle as the plain list of positions, without empty slots."""
+        return type(self), (list(self.positions()),)
+    
+    def positions(self):
+        """Yield (symbol, quantity) for every position, quicker than items()."""
+        for symbol, quantity in zip(self.symbols, self.quantities):
+            if symbol is not None:
+                yield symbol, quantity
+    
+    def set(self, symbol, quantity):
+        """Set the quantity of a symbol; a quantity of 0 or less removes the position."""
+        if quantity > INT64_MAX:
+            raise ValueError(f"Quantity {quantity} is too large (at most {INT64_MAX})")
+        
+        slot = self._slots.get(symbol)
+        if quantity <= 0:
+            if slot is not None:
+                self._remove_slot(symbol, slot)
+        elif slot is None:
+            self._slots[symbol] = len(self.symbols)
+            self.symbols.append(symbol)
+            self.quantities.append(quantity)
+        else:
+            self.quantities[slot] = quantity
+    
+    def _remove_slot(self, symbol, slot):
+        """Empty a slot, compacting the columns once half of them are empty."""
+        del self._slots[symbol]
+        if not self._slots:
+            self.clear()
+            return
+        
+        self.symbols[slot] = None
+        self.quantities[slot] = 0
+        empty = len(self.symbols) - len(self._slots)
+        if empty >= MIN_COMPACT_SLOTS and empty * 2 >= len(self.symbols):
+            self._compact()
+    
+    def _compact(self):
+        """Drop the empty slots, keeping the positions in order."""
+        positions = list(self.positions())
+        self.symbols = [symbol for symbol, _ in positions]
+        self.quantities = array('q', [quantity for _, quantity in positions])
+        self._slots = {symbol: slot for slot, symbol in enumerate(self.symbols)}
+    
+    def clear(self):
+        """Remove every position."""
+        self.symbols = []
+        self.quantities = array('q')
+        self._slots = {}
+    
+    def quantity_column(self):
+        """Return the quantities, one per slot (0 for empty slots), as a NumPy view.
+        
+        The view shares memory with the store, which cannot grow while it exists,
+        so it should only be kept for the length of one calculation.
+        """
+        return np.frombuffer(self.quantities, dtype=np.int64)
+
+
+class ExactValuation:
+    """Exact decimal values of positions at given prices, for exports."""
+    
+    def __init__(self, portfolio, stock_prices):
+        """Value a {symbol: quantity} mapping (or PositionStore) against a {symbol: price} table."""
+        self.portfolio = portfolio
+        self.stock_prices = stock_prices
+    
+    def _positions(self):
+        """Return an iterator of (symbol, quantity) pairs."""
+        if isinstance(self.portfolio, PositionStore):
+            return self.portfolio.positions()
+        return iter(self.portfolio.items())
+    
+    def rows(self):
+        """Yield (symbol, quantity, price, value) with the value rounded to cents, as text."""
+        stock_prices = self.stock_prices
+        for symbol, quantity in self._positions():
+            price = stock_prices[symbol]
+            cents = price_cents(price)
+            if cents is not None:
+                yield symbol, quantity, format_cents(cents), format_cents(cents * quantity)
+            else:
+                exact = exact_price(price)
+                yield symbol, quantity, str(exact), format_amount(EXACT.multiply(exact, quantity))
+    
+    def total(self):
+        """Return the exact total value as a Decimal, before any rounding."""
+        stock_prices = self.stock_prices
+        total_cents = 0
+        other = Decimal(0)
+        for symbol, quantity in self._positions():
+            price = stock_prices[symbol]
+            cents = price_cents(price)
+            if cents is not None:
+                total_cents += cents * quantity
+            else:
+                other = EXACT.add(other, EXACT.multiply(exact_price(price), quantity))
+        return EXACT.add(EXACT.scaleb(Decimal(total_cents), -2), other)
+    
+    def formatted_total(self):
+        """Return the total rounded to cents as text, e.g. '4000.00'."""
+        return format_amount(self.total())
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Price History - Stock Portfolio Tracker
+=======================================
+
+A daily price history for a fixed set of symbols, stored as memory-mapped arrays.
+
+A history lives in a directory holding three files:
+
+- symbols.txt  one symbol per line, fixing the column order
+- dates.bin    int64 day numbers (days since 1970-01-01), one per row
+- prices.bin   float64 prices, one row of len(symbols) values per date
+
+Rows are only ever appended, so adding a new day never rewrites old data, and a
+portfolio's value on every stored date comes out of one matrix-vector product.
+Missing prices are stored as NaN. Requires NumPy.
+
+Author: CodeAlpha Intern
+Date: September 2025
+"""
+
+import argparse
+import os
+import random
+from datetime import date, timedelta
+
+import numpy as np
+
+SYMBOLS_FILE = 'symbols.txt'
+DATES_FILE = 'dates.bin'
+PRICES_FILE = 'prices.bin'
+
+
+class PriceHistory:
+    """Memory-mapped symbols x dates price matrix with append-only days."""
+    
+    def __init__(self, directory):
+        """Open an existing price history directory."""
+        self.directory = directory
+        with open(self._path(SYMBOLS_FILE), encoding='utf-8') as symfile:
+            self.symbols = [line.strip() for line in symfile if line.strip()]
+        self.symbol_index = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self._dates = None
+        self._prices = None
+    
+    @classmethod
+    def create(cls, directory, symbols):
+        """Create an empty price history for the given symbols."""
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, SYMBOLS_FILE), 'w', encoding='utf-8') as symfile:
+            symfile.write(''.join(f"{symbol}\n" for symbol in symbols))
+        for name in (DATES_FILE, PRICES_FILE):
+            open(os.path.join(directory, name), 'wb').close()
+        return cls(directory)
+    
+    def _path(self, name):
+        """Return the path of a file inside the history directory."""
+        return os.path.join(self.directory, name)
+    
+    def __len__(self):
+        """Return the number of stored days."""
+        return os.path.getsize(self._path(DATES_FILE)) // 8
+    
+    def _map(self, name, dtype, shape):
+        """Memory-map a data file read-only, or return an empty array if it has no rows."""
+        if shape[0] == 0:
+            return np.empty(shape, dtype=dtype)
+        return np.memmap(self._path(name), dtype=dtype, mode='r', shape=shape)
+    
+    @property
+    def dates(self):
+        """Return the stored dates as a datetime64[D] array view."""
+        if self._dates is None:
+            self._dates = self._map(DATES_FILE, '<i8', (len(self),)).view('datetime64[D]')
+        return self._dates
+    
+    @property
+    def prices(self):
+        """Return the (days, symbols) price matrix as a read-only memory map."""
+        if self._prices is None:
+            self._prices = self._map(PRICES_FILE, '<f8', (len(self), len(self.symbols)))
+        return self._prices
+    
+    def append_days(self, days, price_rows):
+        """Append whole rows: one date and one price per symbol (in symbol order) per row."""
+        day_numbers = np.asarray(days, dtype='datetime64[D]').astype('<i8')
+        rows = np.asarray(price_rows, dtype='<f8').reshape(len(day_numbers), len(self.symbols))
+        
+        last_day = int(self.dates[-1].astype('<i8')) if len(self) else None
+        if len(day_numbers) and ((last_day is not None and day_numbers[0] <= last_day)
+                                 or np.any(np.diff(day_numbers) <= 0)):
+            raise ValueError("Days must be appended in strictly increasing order")
+        
+        # Drop the old maps before the files grow so they are re-mapped at the new size
+        self._dates = self._prices = None
+        
+        # Prices go first, so a crash in between never leaves a date without its row.
+        # It can leave rows (or part of one) without a date: both files are cut back to
+        # the stored days before writing, so such leftovers are overwritten, not kept.
+        days_stored = len(self)
+        self._write_at(PRICES_FILE, days_stored * len(self.symbols) * 8, rows)
+        self._write_at(DATES_FILE, days_stored * 8, day_numbers)
+    
+    def _write_at(self, name, offset, array):
+        """Write an array to a data file at offset, dropping anything after that offset."""
+        with open(self._path(name), 'r+b') as datafile:
+            datafile.truncate(offset)
+            datafile.seek(offset)
+            array.tofile(datafile)
+    
+    def append_day(self, day, stock_prices):
+        """Append one day from a {symbol: price} dict; unlisted symbols are stored as NaN."""
+        row = np.full(len(self.symbols), np.nan)
+        for symbol, price in stock_prices.items():
+            index = self.symbol_index.get(symbol)
+            if index is not None:
+                row[index] = price
+        self.append_days([day], row)
+    
+    def value_series(self, portfolio):
+        """Return (dates, values): the portfolio's value on every stored date.
+        
+        Days where a held symbol has no price come out as NaN.
+        """
+        missing = [stock for stock in portfolio if stock not in self.symbol_index]
+        if missing:
+            raise ValueError(f"No price history for: {', '.join(missing)}")
+        
+        columns = np.fromiter((self.symbol_index[stock] for stock in portfolio),
+                              dtype=np.intp, count=len(portfolio))
+        quantities = np.fromiter(portfolio.values(), dtype=np.float64, count=len(portfolio))
+        return self.dates, self.prices[:, columns] @ quantities
+
+
+def main():
+    """Build a synthetic history and value the demo portfolio over it."""
+    from stock_tracker import StockPortfolioTracker
+    
+    parser = argparse.ArgumentParser(description="Value the demo portfolio over a synthetic price history.")
+    parser.add_argument('directory', help="directory to store the price history in")
+    parser.add_argument('--years', type=int, default=10, help="years of daily prices to generate")
+    args = parser.parse_args()
+    
+    tracker = StockPortfolioTracker()
+    tracker.load_demo_portfolio()
+    
+    history = PriceHistory.create(args.directory, list(tracker.stock_prices))
+    rng = random.Random(0)
+    start = date.today() - timedelta(days=365 * args.years)
+    days = [start + timedelta(days=i) for i in range(365 * args.years)]
+    
+    # Random walk starting from today's prices
+    rows = []
+    prices = dict(tracker.stock_prices)
+    for _ in days:
+        prices = {symbol: price * (1 + rng.gauss(0, 0.01)) for symbol, price in prices.items()}
+        rows.append([prices[symbol] for symbol in history.symbols])
+    history.append_days(days, rows)
+    
+    dates, values = history.value_series(tracker.portfolio)
+    print(f"📈 {len(dates):,} days from {dates[0]} to {dates[-1]}")
+    print(f"Lowest value:  ${values.min():,.2f}")
+    print(f"Highest value: ${values.max():,.2f}")
+    print(f"Latest value:  ${values[-1]:,.2f}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Price Sources - Stock Portfolio Tracker
+=======================================
+
+Pluggable price providers and a quote cache that sits in front of them.
+
+A provider only has to list the symbols it knows and fetch prices for a batch of
+symbols. QuoteCache keeps a per-symbol TTL, evicts the least recently used quotes,
+groups misses into one batched fetch and lets concurrent callers asking for the
+same symbol share a single in-flight request.
+
+Author: CodeAlpha Intern
+Date: September 2025
+"""
+
+import csv
+import json
+import os
+import random
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import quote
+from urllib.request import urlopen
+
+
+class PriceProvider:
+    """Base class for anything that can supply stock prices."""
+    
+    def symbols(self):
+        """Return the list of symbols this provider can quote."""
+        raise NotImplementedError
+    
+    def fetch_quotes(self, symbols):
+        """Return a {symbol: price} dict for the requested symbols it knows."""
+        raise NotImplementedError
+
+
+class StaticPriceProvider(PriceProvider):
+    """Serve prices from a fixed dictionary."""
+    
+    def __init__(self, prices):
+        """Copy the price table so later edits to the original do not leak in."""
+        self.prices = dict(prices)
+    
+    def symbols(self):
+        """Return the list of symbols this provider can quote."""
+        return list(self.prices)
+    
+    def fetch_quotes(self, symbols):
+        """Return a {symbol: price} dict for the requested symbols it knows."""
+        return {symbol: self.prices[symbol] for symbol in symbols if symbol in self.prices}
+
+
+class FilePriceProvider(PriceProvider):
+    """Serve prices from a 'Symbol,Price' CSV file, re-reading it when it changes."""
+    
+    def __init__(self, filename):
+        """Remember the price file; it is read lazily on first use."""
+        self.filename = filename
+        self._mtime = None
+        self._prices = {}
+    
+    def _load(self):
+        """Re-read the price file if it has been modified since the last read."""
+        mtime = os.path.getmtime(self.filename)
+        if mtime == self._mtime:
+            return self._prices
+        
+        prices = {}
+        with open(self.filename, newline='', encoding='utf-8') as csvfile:
+            for row in csv.reader(csvfile):
+                if len(row) < 2:
+                    continue
+                try:
+                    prices[row[0].strip().upper()] = float(row[1].strip().lstrip('$'))
+                except ValueError:
+                    continue  # Header or malformed row
+        
+        self._prices = prices
+        self._mtime = mtime
+        return prices
+    
+    def symbols(self):
+        """Return the list of symbols this provider can quote."""
+        return list(self._load())
+    
+    def fetch_quotes(self, symbols):
+        """Return a {symbol: price} dict for the requested symbols it knows."""
+        prices = self._load()
+        return {symbol: prices[symbol] for symbol in symbols if symbol in prices}
+
+
+class HttpPriceProvider(PriceProvider):
+    """Fetch prices as JSON from a local HTTP quote service.
+    
+    The service answers GET /symbols with a JSON list of symbols and
+    GET /quotes?symbols=A,B with a JSON object mapping symbols to prices.
+    """
+    
+    def __init__(self, base_url, batch_size=200, timeout=5.0):
+        """Set the service URL and how many symbols to request per call."""
+        self.base_url = base_url.rstrip('/')
+        self.batch_size = batch_size
+        self.timeout = timeout
+    
+    def _get_json(self, path):
+        """GET a path from the quote service and decode the JSON body."""
+        with urlopen(self.base_url + path, timeout=self.timeout) as response:
+            return json.loads(response.read().decode('utf-8'))
+    
+    def symbols(self):
+        """Return the list of symbols this provider can quote."""
+        return self._get_json('/symbols')
+    
+    def fetch_quotes(self, symbols):
+        """Return a {symbol: price} dict for the requested symbols it knows."""
+        quotes = {}
+        for start in range(0, len(symbols), self.batch_size):
+            batch = ','.join(symbols[start:start + self.batch_size])
+            quotes.update(self._get_json('/quotes?symbols=' + quote(batch, safe=',')))
+        return {symbol: float(price) for symbol, price in quotes.items()}
+
+
+class SyntheticPriceProvider(PriceProvider):
+    """Generate reproducible prices that drift once per time step."""
+    
+    def __init__(self, symbols, seed=0, step_seconds=60.0, volatility=0.02):
+        """Set the symbol universe and the parameters of the random walk."""
+        self._symbols = list(symbols)
+        self.seed = seed
+        self.step_seconds = step_seconds
+        self.volatility = volatility
+    
+    def symbols(self):
+        """Return the list of symbols this provider can quote."""
+        return list(self._symbols)
+    
+    def fetch_quotes(self, symbols):
+        """Return a {symbol: price} dict for the requested symbols it knows."""
+        step = int(time.time() // self.step_seconds)
+        quotes = {}
+        for symbol in symbols:
+            base = random.Random(f"{self.seed}:{symbol}").uniform(10.0, 1000.0)
+            drift = random.Random(f"{self.seed}:{symbol}:{step}").gauss(0.0, self.volatility)
+            quotes[symbol] = round(base * (1.0 + drift), 2)
+        return quotes
+
+
+class QuoteCache:
+    """A TTL + LRU cache of quotes with batched fetches and request coalescing."""
+    
+    def __init__(self, provider, ttl=60.0, max_size=100000):
+        """Wrap a provider; a ttl of None keeps quotes until they are evicted."""
+        self.provider = provider
+        self.ttl = ttl
+        self.max_size = max_size
+        
+        self._quotes = OrderedDict()  # symbol -> (price, expires_at), oldest first
+        self._in_flight = {}          # symbol -> Event set when its fetch finishes
+        self._lock = threading.Lock()
+        
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.fetches = 0
+        self.evictions = 0
+    
+    def get_quote(self, symbol):
+        """Return the price of one symbol, or None if the provider does not know it."""
+        return self.get_quotes([symbol]).get(symbol)
+    
+    def get_quotes(self, symbols):
+        """Return {symbol: price} for the symbols, fetching all misses in one batch."""
+        now = time.monotonic()
+        quotes = {}
+        to_fetch = []
+        waiting = []
+        done = threading.Event()
+        
+        with self._lock:
+            for symbol in symbols:
+                entry = self._quotes.get(symbol)
+                if entry is not None and (entry[1] is None or entry[1] > now):
+                    self._quotes.move_to_end(symbol)
+                    quotes[symbol] = entry[0]
+                    self.hits += 1
+                elif symbol in self._in_flight:
+                    waiting.append((symbol, self._in_flight[symbol]))
+                    self.coalesced += 1
+                else:
+                    self._in_flight[symbol] = done
+                    to_fetch.append(symbol)
+                    self.misses += 1
+        
+        if to_fetch:
+            fetched = {}
+            try:
+                fetched = self.provider.fetch_quotes(to_fetch)
+            finally:
+                with self._lock:
+                    self.fetches += 1
+                    self._store(fetched)
+                    for symbol in to_fetch:
+                        self._in_flight.pop(symbol, None)
+                done.set()
+            quotes.update(fetched)
+        
+        # Pick up symbols that another caller was already fetching
+        for symbol, event in waiting:
+            event.wait()
+            with self._lock:
+                entry = self._quotes.get(symbol)
+            if entry is not None:
+                quotes[symbol] = entry[0]
+        
+        return quotes
+    
+    def _store(self, fetched):
+        """Insert fresh quotes and evict the least recently used ones over capacity."""
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        for symbol, price in fetched.items():
+            self._quotes[symbol] = (price, expires_at)
+            self._quotes.move_to_end(symbol)
+        
+        while len(self._quotes) > self.max_size:
+            self._quotes.popitem(last=False)
+            self.evictions += 1
+    
+    def invalidate(self, symbols=None):
+        """Drop cached quotes for the given symbols, or all of them."""
+        with self._lock:
+            if symbols is None:
+                self._quotes.clear()
+            else:
+                for symbol in symbols:
+                    self._quotes.pop(symbol, None)
+    
+    def stats(self):
+        """Return hit/miss counters and the current cache size."""
+        with self._lock:
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'coalesced': self.coalesced,
+                'fetches': self.fetches,
+                'evictions': self.evictions,
+                'size': len(self._quotes),
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
\ No newline at end of file
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Quote Refresher - Stock Portfolio Tracker
+=========================================
+
+Refresh prices for very large symbol universes with asyncio.
+
+Symbols are split into batches and fetched from a JSON quote service by a fixed
+number of workers, each holding one keep-alive connection. A bounded queue between
+the batch producer and the workers provides backpressure, failed batches are retried
+with exponential backoff, and the finished price table is swapped into the tracker
+in one step. FakeQuoteServer speaks the same protocol for local testing.
+
+Author: CodeAlpha Intern
+Date: September 2025
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from http import HTTPStatus
+from urllib.parse import parse_qs, quote, urlsplit
+
+from price_sources import SyntheticPriceProvider
+
+
+class QuoteFetchError(Exception):
+    """Raised when the quote service answers with an error status."""
+
+
+def _parse_quotes(body):
+    """Return a /quotes response as a {symbol: float price} dict."""
+    if not isinstance(body, dict):
+        raise ValueError("Quote response is not a JSON object")
+    return {symbol: float(price) for symbol, price in body.items()}
+
+
+def _parse_symbols(body):
+    """Return a /symbols response as a list of symbols."""
+    if not isinstance(body, list):
+        raise ValueError("Symbol list response is not a JSON array")
+    return body
+
+
+class AsyncQuoteRefresher:
+    """Fetch quotes in concurrent batches over reused HTTP connections."""
+    
+    def __init__(self, host, port, batch_size=500, concurrency=8, retries=3,
+                 backoff=0.05, timeout=5.0):
+        """Configure the quote service address and the refresh pipeline limits."""
+        if batch_size < 1 or concurrency < 1 or retries < 0:
+            raise ValueError("batch_size and concurrency must be at least 1 and retries at least 0")
+        self.host = host
+        self.port = port
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self._reset_stats()
+    
+    def _reset_stats(self):
+        """Clear the counters of the last refresh."""
+        self.stats = {
+            'symbols': 0,
+            'quotes': 0,
+            'batches': 0,
+            'retries': 0,
+            'failed_batches': 0,
+            'connections': 0,
+            'seconds': 0.0,
+            'quotes_per_second': 0.0
+        }
+    
+    async def _connect(self):
+        """Open a new connection to the quote service."""
+        self.stats['connections'] += 1
+        return await asyncio.wait_for(asyncio.open_connection(self.host, self.port), self.timeout)
+    
+    async def _request(self, reader, writer, path):
+        """Send one keep-alive GET request and return the decoded JSON body."""
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+                     "Connection: keep-alive\r\n\r\n".encode('ascii'))
+        await writer.drain()
+        
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Quote service closed the connection")
+        
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        
+        body = await reader.readexactly(int(headers.get('content-length', 0)))
+        status = int(status_line.split()[1])
+        if status != 200:
+            raise QuoteFetchError(f"Quote service returned HTTP {status}")
+        return json.loads(body.decode('utf-8'))
+    
+    async def _fetch(self, connection, path, parse):
+        """Request path over connection (None opens one), retrying with backoff on failure.
+        
+        Returns (parse(body), connection), or (None, connection) once every attempt
+        has failed. The returned connection is still open, or None.
+        """
+        for attempt in range(self.retries + 1):
+            try:
+                if connection is None:
+                    connection = await self._connect()
+                body = await asyncio.wait_for(self._request(*connection, path), self.timeout)
+                return parse(body), connection
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError,
+                    QuoteFetchError, ValueError, TypeError):
+                # Never reuse a connection that failed mid-request
+                if connection is not None:
+                    connection[1].close()
+                    connection = None
+                if attempt < self.retries:
+                    self.stats['retries'] += 1
+                    await asyncio.sleep(self.backoff * 2 ** attempt)
+            except BaseException:
+                if connection is not None:
+                    connection[1].close()
+                raise
+        return None, connection
+    
+    async def _worker(self, queue, prices):
+        """Take batches off the queue and fetch them, retrying on failure."""
+        connection = None
+        try:
+            while True:
+                batch = await queue.get()
+                try:
+                    if batch is None:
+                        return
+                    path = '/quotes?symbols=' + quote(','.join(batch), safe=',')
+                    quotes, connection = await self._fetch(connection, path, _parse_quotes)
+                    if quotes is None:
+                        self.stats['failed_batches'] += 1
+                    else:
+                        prices.update(quotes)
+                        self.stats['batches'] += 1
+                finally:
+                    queue.task_done()
+        finally:
+            if connection is not None:
+                connection[1].close()
+    
+    async def _produce(self, queue, symbols):
+        """Feed symbol batches to the workers, waiting whenever the queue is full."""
+        for start in range(0, len(symbols), self.batch_size):
+            await queue.put(symbols[start:start + self.batch_size])
+        for _ in range(self.concurrency):
+            await queue.put(None)
+    
+    async def fetch_prices(self, symbols):
+        """Fetch prices for all symbols and return them as a new dictionary."""
+        self._reset_stats()
+        symbols = list(symbols)
+        prices = {}
+        start_time = time.perf_counter()
+        
+        queue = asyncio.Queue(maxsize=self.concurrency * 2)
+        producer = asyncio.ensure_future(self._produce(queue, symbols))
+        workers = [asyncio.ensure_future(self._worker(queue, prices))
+                   for _ in range(self.concurrency)]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            # If a worker failed, the producer and the other workers would wait forever
+            for task in (producer, *workers):
+                task.cancel()
+            await asyncio.gather(producer, *workers, return_exceptions=True)
+        
+        elapsed = time.perf_counter() - start_time
+        self.stats['symbols'] = len(symbols)
+        self.stats['quotes'] = len(prices)
+        self.stats['seconds'] = elapsed
+        self.stats['quotes_per_second'] = len(prices) / elapsed if elapsed > 0 else 0.0
+        return prices
+    
+    async def fetch_symbols(self):
+        """Ask the quote service for its full symbol list, retrying like a batch."""
+        symbols, connection = await self._fetch(None, '/symbols', _parse_symbols)
+        if connection is not None:
+            connection[1].close()
+        if symbols is None:
+            raise QuoteFetchError(f"No symbol list after {self.retries + 1} attempts")
+        return symbols
+    
+    async def refresh_tracker(self, tracker, symbols=None):
+        """Fetch a fresh price table and swap it into a StockPortfolioTracker."""
+        if symbols is None:
+            symbols = await self.fetch_symbols()
+        prices = await self.fetch_prices(symbols)
+        tracker.replace_stock_prices(prices)
+        return self.stats
+
+
+class FakeQuoteServer:
+    """A local HTTP quote service backed by any PriceProvider, for testing."""
+    
+    def __init__(self, provider, host='127.0.0.1', port=0, latency=0.0, failure_rate=0.0, seed=0):
+        """Configure the provider plus optional artificial latency and failures."""
+        self.provider = provider
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._server = None
+    
+    async def start(self):
+        """Start listening; the bound port is stored in self.port."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+    
+    async def stop(self):
+        """Stop the server and wait for it to close."""
+        self._server.close()
+        await self._server.wait_closed()
+    
+    async def _handle(self, reader, writer):
+        """Serve requests on one connection until the client goes away."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                while (await reader.readline()) not in (b'\r\n', b''):
+                    pass  # Skip request headers
+                
+                self.requests += 1
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                
+                if self._random.random() < self.failure_rate:
+                    status, body = 503, {'error': 'try again'}
+                else:
+                    status, body = self._route(request_line.split()[1].decode('ascii'))
+                
+                payload = json.dumps(body).encode('utf-8')
+                writer.write(f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\nContent-Type: application/json\r\n"
+                             f"Content-Length: {len(payload)}\r\n\r\n".encode('ascii') + payload)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+    
+    def _route(self, target):
+        """Return (status, body) for a request path."""
+        url = urlsplit(target)
+        if url.path == '/symbols':
+            return 200, self.provider.symbols()
+        if url.path == '/quotes':
+            symbols = parse_qs(url.query).get('symbols', [''])[0].split(',')
+            return 200, self.provider.fetch_quotes([symbol for symbol in symbols if symbol])
+        return 404, {'error': 'not found'}
+
+
+async def _demo(args):
+    """Refresh a synthetic universe through a local fake server and report throughput."""
+    from stock_tracker import StockPortfolioTracker
+    
+    universe = [f"SYM{i:06d}" for i in range(args.symbols)]
+    server = FakeQuoteServer(SyntheticPriceProvider(universe), latency=args.latency,
+                             failure_rate=args.failure_rate)
+    await server.start()
+    try:
+        tracker = StockPortfolioTracker()
+        refresher = AsyncQuoteRefresher(server.host, server.port, batch_size=args.batch_size,
+                                        concurrency=args.concurrency)
+        stats = await refresher.refresh_tracker(tracker)
+    finally:
+        await server.stop()
+    
+    print(f"✅ Refreshed {stats['quotes']:,} of {stats['symbols']:,} quotes "
+          f"in {stats['seconds']:.2f}s ({stats['quotes_per_second']:,.0f} quotes/sec)")
+    print(f"Batches: {stats['batches']}  Retries: {stats['retries']}  "
+          f"Failed batches: {stats['failed_batches']}  Connections: {stats['connections']}")
+
+
+def main():
+    """Run the refresher against a local fake quote server."""
+    parser = argparse.ArgumentParser(description="Refresh quotes from a local fake quote server.")
+    parser.add_argument('--symbols', type=int, default=20000, help="size of the symbol universe")
+    parser.add_argument('--batch-size', type=int, default=500, help="symbols per request")
+    parser.add_argument('--concurrency', type=int, default=8, help="concurrent connections")
+    parser.add_argument('--latency', type=float, default=0.0, help="server delay per request (s)")
+    parser.add_argument('--failure-rate', type=float, default=0.0,
+                        help="fraction of requests the server fails")
+    asyncio.run(_demo(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Risk Engine - Stock Portfolio Tracker
+=====================================
+
+Monte Carlo value-at-risk and expected shortfall for a portfolio.
+
+Daily returns are modelled as multivariate normal, with the mean and covariance
+estimated from supplied return observations (or a PriceHistory). Scenarios are
+drawn as correlated returns through a Cholesky factor and the portfolio is
+revalued for a whole batch of them with one matrix product. Only the worst
+losses needed for the tail are kept between batches, so memory is bounded by the
+batch size and the tail, not by the number of scenarios.
+
+Scenarios are split into fixed-size shards, each with its own seed spawned from
+one SeedSequence. Shards can run serially or across a process pool and the result
+is identical either way, for any number of workers. Requires NumPy.
+
+Author: CodeAlpha Intern
+Date: September 2025
+"""
+
+import argparse
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+DEFAULT_SCENARIOS = 1000000
+DEFAULT_BATCH_SIZE = 50000
+
+# Scenarios per shard; shards are the unit of work and of seeding
+DEFAULT_SHARD_SIZE = 250000
+
+# Per-worker model, set up by _load_model
+_worker_model = None
+
+
+class RiskModel:
+    """Mean and covariance of daily returns for a list of symbols."""
+    
+    def __init__(self, symbols, mean, covariance):
+        """Store the return model and factor its covariance for scenario generation."""
+        self.symbols = list(symbols)
+        self.symbol_index = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self.mean = np.asarray(mean, dtype=np.float64)
+        self.covariance = np.asarray(covariance, dtype=np.float64)
+        self.factor = _covariance_factor(self.covariance)
+    
+    @classmethod
+    def from_returns(cls, symbols, returns):
+        """Estimate the model from a (observations, symbols) array of simple returns."""
+        returns = np.asarray(returns, dtype=np.float64)
+        if returns.ndim != 2 or returns.shape[1] != len(symbols):
+            raise ValueError("Returns must have one column per symbol")
+        if returns.shape[0] < 2:
+            raise ValueError("At least two return observations are needed")
+        return cls(symbols, returns.mean(axis=0),
+                   np.atleast_2d(np.cov(returns, rowvar=False)))
+    
+    @classmethod
+    def from_history(cls, history, symbols):
+        """Estimate the model from day-over-day returns in a PriceHistory.
+        
+        Days where any of the symbols has no price are left out.
+        """
+        columns = [history.symbol_index[symbol] for symbol in symbols]
+        prices = np.asarray(history.prices[:, columns])
+        returns = prices[1:] / prices[:-1] - 1.0
+        return cls.from_returns(symbols, returns[~np.isnan(returns).any(axis=1)])
+    
+    def exposures(self, portfolio, stock_prices):
+        """Return the market value held in each model symbol as a vector."""
+        missing = [stock for stock in portfolio if stock not in self.symbol_index]
+        if missing:
+            raise ValueError(f"No return model for: {', '.join(missing)}")
+        
+        values = np.zeros(len(self.symbols))
+        for stock, quantity in portfolio.items():
+            values[self.symbol_index[stock]] = quantity * stock_prices[stock]
+        return values
+
+
+def _covariance_factor(covariance):
+    """Return L with L @ L.T == covariance, even for singular covariances."""
+    try:
+        return np.linalg.cholesky(covariance)
+    except np.linalg.LinAlgError:
+        # Perfectly correlated or constant series: factor through the eigenvalues instead
+        eigenvalues, eigenvectors = np.linalg.eigh(covariance)
+        return eigenvectors * np.sqrt(np.clip(eigenvalues, 0.0, None))
+
+
+def _worst(losses, count):
+    """Return the count largest losses (in no particular order)."""
+    if len(losses) <= count:
+        return losses
+    return np.partition(losses, len(losses) - count)[len(losses) - count:]
+
+
+def _simulate_shard(mean, factor, exposures, scenarios, seed, tail_size, batch_size, horizon_days):
+    """Simulate one shard; return (its tail of worst losses, sum of losses)."""
+    rng = np.random.default_rng(seed)
+    drift = mean * horizon_days
+    scale = math.sqrt(horizon_days)
+    tail = np.empty(0)
+    loss_sum = 0.0
+    
+    for start in range(0, scenarios, batch_size):
+        count = min(batch_size, scenarios - start)
+        shocks = rng.standard_normal((count, len(exposures)))
+        returns = drift + scale * (shocks @ factor.T)
+        losses = -(returns @ exposures)
+        loss_sum += float(losses.sum())
+        tail = _worst(np.concatenate((tail, losses)), tail_size)
+    
+    return tail, loss_sum
+
+
+def _load_model(mean, factor, exposures):
+    """Worker initializer: keep the model and exposures for every shard."""
+    global _worker_model
+    _worker_model = (mean, factor, exposures)
+
+
+def _run_shard(task):
+    """Simulate one shard in a worker process."""
+    return _simulate_shard(*_worker_model, *task)
+
+
+def simulate_risk(model, exposures, scenarios=DEFAULT_SCENARIOS, confidence=0.99,
+                  horizon_days=1, batch_size=DEFAULT_BATCH_SIZE, workers=None, seed=0,
+                  shard_size=DEFAULT_SHARD_SIZE):
+    """Estimate value-at-risk and expected shortfall of a vector of exposures.
+    
+    VaR is the loss exceeded in a (1 - confidence) fraction of scenarios, and
+    expected shortfall is the average loss in those scenarios, both as positive
+    amounts. workers=None runs in this process; any other value uses a process
+    pool (0 for one worker per CPU). The same seed always gives the same result.
+    """
+    if not 0 < confidence < 1:
+        raise ValueError("Confidence must be between 0 and 1")
+    if scenarios < 1 or batch_size < 1 or shard_size < 1 or horizon_days < 1:
+        raise ValueError("Scenarios, batch size, shard size and horizon must be at least 1")
+    if workers is not None and workers < 0:
+        raise ValueError("Workers must be 0 (one per CPU) or more")
+    exposures = np.asarray(exposures, dtype=np.float64)
+    if exposures.shape != model.mean.shape:
+        raise ValueError("Exposures must have one value per model symbol")
+    
+    start_time = time.perf_counter()
+    tail_size = max(1, math.ceil((1 - confidence) * scenarios))
+    shard_count = max(1, math.ceil(scenarios / shard_size))
+    seeds = np.random.SeedSequence(seed).spawn(shard_count)
+    tasks = [(min(shard_size, scenarios - i * shard_size), seeds[i], tail_size, batch_size,
+              horizon_days) for i in range(shard_count)]
+    
+    if workers is None:
+        results = [_simulate_shard(model.mean, model.factor, exposures, *task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers or None, initializer=_load_model,
+                                 initargs=(model.mean, model.factor, exposures)) as pool:
+            results = list(pool.map(_run_shard, tasks))
+    
+    tail = _worst(np.concatenate([shard_tail for shard_tail, _ in results]), tail_size)
+    elapsed = time.perf_counter() - start_time
+    return {
+        'scenarios': scenarios,
+        'confidence': confidence,
+        'horizon_days': horizon_days,
+        'value': float(exposures.sum()),
+        'value_at_risk': float(tail.min()),
+        'expected_shortfall': float(tail.mean()),
+        'mean_loss': sum(loss_sum for _, loss_sum in results) / scenarios,
+        'seconds': elapsed,
+        'scenarios_per_second': scenarios / elapsed if elapsed > 0 else 0.0
+    }
+
+
+def portfolio_risk(tracker, model, **options):
+    """Estimate VaR and expected shortfall of a tracker's current portfolio."""
+    tracker.refresh_prices()
+    return simulate_risk(model, model.exposures(tracker.portfolio, tracker.stock_prices), **options)
+
+
+def _synthetic_returns(symbols, days, seed=0):
+    """Return correlated daily returns for the symbols: one market factor plus noise."""
+    rng = np.random.default_rng(seed)
+    market = rng.normal(0.0003, 0.01, size=(days, 1))
+    betas = rng.uniform(0.5, 1.5, size=len(symbols))
+    return market * betas + rng.normal(0.0, 0.015, size=(days, len(symbols)))
+
+
+def main():
+    """Estimate the demo portfolio's risk from synthetic return history."""
+    from stock_tracker import StockPortfolioTracker
+    
+    parser = argparse.ArgumentParser(
+        description="Monte Carlo VaR and expected shortfall of the demo portfolio.")
+    parser.add_argument('--scenarios', type=int, default=DEFAULT_SCENARIOS,
+                        help="scenarios to simulate")
+    parser.add_argument('--confidence', type=float, default=0.99, help="confidence level")
+    parser.add_argument('--horizon', type=int, default=1, help="horizon in trading days")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help="scenarios per batch")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes (0 for one per CPU; default: run in this process)")
+    parser.add_argument('--seed', type=int, default=0, help="random seed")
+    args = parser.parse_args()
+    
+    tracker = StockPortfolioTracker()
+    tracker.load_demo_portfolio()
+    symbols = list(tracker.stock_prices)
+    model = RiskModel.from_returns(symbols, _synthetic_returns(symbols, days=750))
+    
+    risk = portfolio_risk(tracker, model, scenarios=args.scenarios, confidence=args.confidence,
+                          horizon_days=args.horizon, batch_size=args.batch_size,
+                          workers=args.workers, seed=args.seed)
+    level = f"{risk['confidence']:.1%}"
+    print(f"💼 Portfolio value: ${risk['value']:,.2f}")
+    print(f"📉 {risk['horizon_days']}-day VaR ({level}): ${risk['value_at_risk']:,.2f}")
+    print(f"📉 {risk['horizon_days']}-day expected shortfall ({level}): "
+          f"${risk['expected_shortfall']:,.2f}")
+    print(f"{risk['scenarios']:,} scenarios in {risk['seconds']:.2f}s "
+          f"({risk['scenarios_per_second']:,.0f} scenarios/sec)")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
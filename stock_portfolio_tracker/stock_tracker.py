@@ -10,86 +10,422 @@ Date: September 2025
 """
 
 import csv
+import itertools
+import math
+import mmap
 import os
+import argparse
+import struct
+import sys
+import time
+from array import array
 from datetime import datetime
 
+from instrumentation import Instrumentation, instrument_tracker
+from position_store import ExactValuation, PositionStore
+from price_sources import FilePriceProvider, QuoteCache, StaticPriceProvider
+from symbol_universe import SymbolUniverse
+from transaction_ledger import TransactionLedger
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; valuation falls back to the dict loop
+    np = None
+
+
+# Hardcoded stock prices (in USD), used when no other price source is given
+DEFAULT_STOCK_PRICES = {
+    "AAPL": 180.50,   # Apple Inc.
+    "TSLA": 250.75,   # Tesla Inc.
+    "GOOGL": 2750.30, # Alphabet Inc.
+    "MSFT": 415.20,   # Microsoft Corporation
+    "AMZN": 3380.90,  # Amazon.com Inc.
+    "META": 305.15,   # Meta Platforms Inc.
+    "NFLX": 485.60,   # Netflix Inc.
+    "NVDA": 470.85,   # NVIDIA Corporation
+    "PYPL": 285.40,   # PayPal Holdings Inc.
+    "ADBE": 620.75    # Adobe Inc.
+}
+
+# Company names shown in the stock listing for the built-in price table
+DEFAULT_COMPANY_NAMES = {
+    "AAPL": "Apple Inc.",
+    "TSLA": "Tesla Inc.",
+    "GOOGL": "Alphabet Inc.",
+    "MSFT": "Microsoft Corp.",
+    "AMZN": "Amazon.com Inc.",
+    "META": "Meta Platforms Inc.",
+    "NFLX": "Netflix Inc.",
+    "NVDA": "NVIDIA Corp.",
+    "PYPL": "PayPal Holdings Inc.",
+    "ADBE": "Adobe Inc."
+}
+
+# Portfolios with at least this many positions are valued with the columnar engine
+COLUMNAR_THRESHOLD = 1000
+
+# Rows handled per batch when importing positions from CSV files
+IMPORT_CHUNK_SIZE = 10000
+
+# Header names recognised for the symbol and quantity columns of imported CSV files
+SYMBOL_COLUMNS = ('stock symbol', 'symbol', 'ticker', 'stock')
+QUANTITY_COLUMNS = ('quantity', 'qty', 'shares')
+
+# Binary snapshot layout: magic, version, symbol width, position count, then a
+# fixed-width symbol table and little-endian int64 quantity / float64 price columns
+SNAPSHOT_MAGIC = b'PFSNAP'
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEADER = struct.Struct('<6sHIQ')
+SNAPSHOT_EXTENSION = '.pfsnap'
+
+
+class ColumnarPortfolio:
+    """Price ids aligned with the slots of a PositionStore, for vectorized valuation."""
+    
+    def __init__(self, stock_prices):
+        """Build the symbol id table and price column from the price dictionary."""
+        self.symbol_ids = {symbol: i for i, symbol in enumerate(stock_prices)}
+        self.price_column = np.fromiter(stock_prices.values(), dtype=np.float64,
+                                        count=len(stock_prices))
+        self.ids = np.empty(0, dtype=np.intp)
+    
+    def load(self, store):
+        """Look up the price id of every slot; empty slots hold nothing, so any id will do."""
+        self.ids = np.fromiter(map(self.symbol_ids.get, store.symbols, itertools.repeat(0)),
+                               dtype=np.intp, count=len(store.symbols))
+    
+    def valuate(self, store):
+        """Return per-slot prices, values and the total in one vectorized pass."""
+        prices = self.price_column[self.ids]
+        values = prices * store.quantity_column()
+        # fsum rounds once, so the total matches the dict loop and the running total exactly
+        total_value = math.fsum(values.tolist())
+        return prices, values, total_value
+
+
+def _find_column(names, candidates):
+    """Return the index of the first header name found in candidates, or None."""
+    for i, name in enumerate(names):
+        if name in candidates:
+            return i
+    return None
+
+
+def read_position_rows(filename):
+    """Yield (symbol, quantity) text pairs from a broker export or a saved portfolio CSV."""
+    with open(filename, newline='', encoding='utf-8') as csvfile:
+        reader = csv.reader(csvfile)
+        header = next(reader, None)
+        if header is None:
+            return
+        
+        names = [name.strip().lower() for name in header]
+        symbol_col = _find_column(names, SYMBOL_COLUMNS)
+        quantity_col = _find_column(names, QUANTITY_COLUMNS)
+        
+        if symbol_col is None or quantity_col is None:
+            # No recognised header, so the first row is data in symbol, quantity order
+            symbol_col, quantity_col = 0, 1
+            reader = itertools.chain([header], reader)
+        
+        width = max(symbol_col, quantity_col)
+        for row in reader:
+            if len(row) > width:
+                yield row[symbol_col], row[quantity_col]
+            else:
+                yield '', ''
+
+
+def check_price(symbol, price):
+    """Raise ValueError unless a price is a finite, non-negative number."""
+    if not math.isfinite(price) or price < 0:
+        raise ValueError(f"Invalid price {price} for {symbol}: must be a finite, non-negative number")
+
+
+def add_exact(partials, value):
+    """Add a float to a list of non-overlapping partial sums without rounding.
+    
+    This is the running form of math.fsum (Shewchuk's algorithm): math.fsum(partials)
+    is always the correctly rounded sum of every value added so far.
+    """
+    i = 0
+    for partial in partials:
+        if abs(value) < abs(partial):
+            value, partial = partial, value
+        high = value + partial
+        low = partial - (high - value)
+        if low:
+            partials[i] = low
+            i += 1
+        value = high
+    partials[i:] = [value]
+
+
+def chunked(iterable, size):
+    """Yield successive lists of at most size items from an iterable."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def write_portfolio_snapshot(filename, positions):
+    """Write (stock, quantity, price) rows to a binary portfolio snapshot."""
+    symbols = [stock.encode('ascii') for stock, _, _ in positions]
+    quantities = array('q', [quantity for _, quantity, _ in positions])
+    prices = array('d', [price for _, _, price in positions])
+    
+    if sys.byteorder != 'little':
+        quantities.byteswap()
+        prices.byteswap()
+    
+    # Pad the symbol table so the numeric columns stay 8-byte aligned
+    width = max(map(len, symbols), default=1)
+    table_size = width * len(symbols)
+    padding = -(SNAPSHOT_HEADER.size + table_size) % 8
+    
+    with open(filename, 'wb') as snapfile:
+        snapfile.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, width, len(symbols)))
+        snapfile.write(b''.join(symbol.ljust(width, b'\0') for symbol in symbols))
+        snapfile.write(b'\0' * padding)
+        quantities.tofile(snapfile)
+        prices.tofile(snapfile)
+
+
+class PortfolioSnapshot:
+    """A read-only, memory-mapped view of a binary portfolio snapshot."""
+    
+    def __init__(self, filename):
+        """Map the snapshot file and expose its columns without copying them."""
+        self._file = open(filename, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{filename} is not a portfolio snapshot (empty file)")
+        
+        try:
+            self._read_layout(filename)
+        except ValueError:
+            self.close()
+            raise
+    
+    def _read_layout(self, filename):
+        """Validate the header and locate the symbol table and numeric columns."""
+        if len(self._map) < SNAPSHOT_HEADER.size:
+            raise ValueError(f"{filename} is not a portfolio snapshot (file too short)")
+        
+        magic, version, width, count = SNAPSHOT_HEADER.unpack_from(self._map)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f"{filename} is not a portfolio snapshot (bad magic)")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"{filename} has unsupported snapshot version {version}")
+        
+        table_size = width * count
+        quantities_offset = SNAPSHOT_HEADER.size + table_size
+        quantities_offset += -quantities_offset % 8
+        prices_offset = quantities_offset + 8 * count
+        
+        if len(self._map) < prices_offset + 8 * count:
+            raise ValueError(f"{filename} is truncated")
+        
+        self.count = count
+        self._width = width
+        self._view = memoryview(self._map)
+        self._symbol_table = self._view[SNAPSHOT_HEADER.size:SNAPSHOT_HEADER.size + table_size]
+        
+        if np is not None:
+            self.quantities = np.frombuffer(self._map, dtype='<i8', count=count,
+                                            offset=quantities_offset)
+            self.prices = np.frombuffer(self._map, dtype='<f8', count=count,
+                                        offset=prices_offset)
+        elif sys.byteorder == 'little':
+            self.quantities = self._view[quantities_offset:prices_offset].cast('q')
+            self.prices = self._view[prices_offset:prices_offset + 8 * count].cast('d')
+        else:
+            # Big-endian hosts without NumPy have to copy and swap the columns
+            self.quantities = array('q', self._view[quantities_offset:prices_offset])
+            self.prices = array('d', self._view[prices_offset:prices_offset + 8 * count])
+            self.quantities.byteswap()
+            self.prices.byteswap()
+    
+    def symbol(self, index):
+        """Return the stock symbol stored at a position index."""
+        start = index * self._width
+        return bytes(self._symbol_table[start:start + self._width]).rstrip(b'\0').decode('ascii')
+    
+    def symbols(self):
+        """Yield every stock symbol in file order."""
+        for index in range(self.count):
+            yield self.symbol(index)
+    
+    def total_value(self):
+        """Calculate the total value of the snapshot from its stored prices."""
+        if self.count == 0:
+            return 0.0
+        
+        if np is not None:
+            return math.fsum((self.prices * self.quantities).tolist())
+        
+        return math.fsum(price * quantity for quantity, price in zip(self.quantities, self.prices))
+    
+    def close(self):
+        """Release the views and unmap the file.
+        
+        If the caller still holds quantities or prices (or anything sliced from
+        them), the mapping cannot be closed yet; it is then left for the garbage
+        collector to unmap once the last of those arrays is gone.
+        """
+        self.quantities = self.prices = self._symbol_table = None
+        try:
+            if getattr(self, '_view', None) is not None:
+                self._view.release()
+                self._view = None
+            self._map.close()
+        except BufferError:
+            pass
+        finally:
+            self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
 
 class StockPortfolioTracker:
     """A class to manage and track stock portfolios."""
     
-    def __init__(self):
-        """Initialize the portfolio tracker with predefined stock prices."""
-        # Hardcoded stock prices (in USD)
-        self.stock_prices = {
-            "AAPL": 180.50,   # Apple Inc.
-            "TSLA": 250.75,   # Tesla Inc.
-            "GOOGL": 2750.30, # Alphabet Inc.
-            "MSFT": 415.20,   # Microsoft Corporation
-            "AMZN": 3380.90,  # Amazon.com Inc.
-            "META": 305.15,   # Meta Platforms Inc.
-            "NFLX": 485.60,   # Netflix Inc.
-            "NVDA": 470.85,   # NVIDIA Corporation
-            "PYPL": 285.40,   # PayPal Holdings Inc.
-            "ADBE": 620.75    # Adobe Inc.
-        }
+    def __init__(self, check_consistency=False, price_source=None, quote_ttl=60.0, universe=None,
+                 ledger=None):
+        """Initialize the portfolio tracker with prices from a price source."""
+        if price_source is None:
+            # The built-in price table never changes, so its quotes never expire
+            price_source = StaticPriceProvider(DEFAULT_STOCK_PRICES)
+            quote_ttl = None
+        
+        self.quote_cache = QuoteCache(price_source, ttl=quote_ttl)
+        self.stock_prices = {}
+        self._shared_prices = False  # stock_prices belongs to someone else; copy before editing
+        self._prices_valid_until = 0.0
+        
+        # Bumped on every price change; the rendered stock listing is cached per version
+        self.price_version = 0
+        self._listing_cache = None
+        self.universe = universe if universe is not None else SymbolUniverse(DEFAULT_COMPANY_NAMES)
+        
+        self.portfolio = PositionStore()  # Symbol -> quantity, in compact columns
+        
+        # Running total, updated on every position or price change. It is kept as exact
+        # partial sums, so adding and removing large values leaves no rounding error behind
+        self._total_partials = []
+        self._total_value = 0.0
         
-        self.portfolio = {}  # Dictionary to store user's portfolio
+        # Verify the running totals against a full recompute on every read
+        self.check_consistency = check_consistency
+        
+        # Columnar copy of the portfolio, rebuilt lazily after changes
+        self._columns = None
+        self._columns_stale = True
+        
+        # Durable log of portfolio changes; recover whatever it already holds
+        self.ledger = ledger
+        self._unpriced_positions = {}  # Recovered positions with no price, kept for the ledger
+        
+        self.refresh_prices()
+        
+        if ledger is not None:
+            self._recover_positions(ledger.recover())
     
-    def display_available_stocks(self):
-        """Display all available stocks and their current prices."""
-        print("\n" + "=" * 60)
-        print("           📈 AVAILABLE STOCKS & PRICES 📈")
-        print("=" * 60)
-        print(f"{'Stock Symbol':<12} {'Company':<25} {'Price (USD)':<12}")
-        print("-" * 60)
-        
-        stock_info = {
-            "AAPL": "Apple Inc.",
-            "TSLA": "Tesla Inc.",
-            "GOOGL": "Alphabet Inc.",
-            "MSFT": "Microsoft Corp.",
-            "AMZN": "Amazon.com Inc.",
-            "META": "Meta Platforms Inc.",
-            "NFLX": "Netflix Inc.",
-            "NVDA": "NVIDIA Corp.",
-            "PYPL": "PayPal Holdings Inc.",
-            "ADBE": "Adobe Inc."
-        }
+    def _recover_positions(self, portfolio):
+        """Load positions recovered from the ledger, setting aside symbols without a price."""
+        self._unpriced_positions = {symbol: quantity for symbol, quantity in portfolio.items()
+                                    if symbol not in self.stock_prices}
+        if self._unpriced_positions:
+            # e.g. logged under another --prices file; ledger snapshots keep them until
+            # the portfolio is cleared or replaced, so a later run with their prices has them
+            print(f"⚠️  Skipped recovered positions in symbols without a price: "
+                  f"{', '.join(sorted(self._unpriced_positions))}")
+            portfolio = {symbol: quantity for symbol, quantity in portfolio.items()
+                         if symbol in self.stock_prices}
+        self._reset_positions(portfolio, record=False)
+    
+    def refresh_prices(self, force=False):
+        """Pull the latest prices through the quote cache once per refresh window."""
+        now = time.monotonic()
+        if not force and now < self._prices_valid_until:
+            return
+        
+        symbols = self.quote_cache.provider.symbols()
+        for symbol, price in self.quote_cache.get_quotes(symbols).items():
+            if self.stock_prices.get(symbol) != price:
+                self.update_stock_price(symbol, price)
+        
+        ttl = self.quote_cache.ttl
+        self._prices_valid_until = math.inf if ttl is None else now + ttl
+    
+    def _render_available_stocks(self):
+        """Return the stock listing table, re-rendering it only after prices change."""
+        if self._listing_cache is not None and self._listing_cache[0] == self.price_version:
+            return self._listing_cache[1]
+        
+        lines = [
+            "\n" + "=" * 60,
+            "           📈 AVAILABLE STOCKS & PRICES 📈",
+            "=" * 60,
+            f"{'Stock Symbol':<12} {'Company':<25} {'Price (USD)':<12}",
+            "-" * 60
+        ]
         
         for symbol, price in self.stock_prices.items():
-            company = stock_info.get(symbol, "Unknown Company")
-            print(f"{symbol:<12} {company:<25} ${price:<11.2f}")
+            company = self.universe.company(symbol)
+            lines.append(f"{symbol:<12} {company:<25} ${price:<11.2f}")
         
-        print("=" * 60)
+        lines.append("=" * 60)
+        listing = "\n".join(lines)
+        self._listing_cache = (self.price_version, listing)
+        return listing
+    
+    def display_available_stocks(self):
+        """Display all available stocks and their current prices."""
+        self.refresh_prices()
+        print(self._render_available_stocks())
     
     def add_stock_to_portfolio(self):
         """Add a stock to the user's portfolio."""
         while True:
             self.display_available_stocks()
             
-            stock_symbol = input("\nEnter stock symbol (or 'back' to return): ").strip().upper()
+            stock_symbol = self._prompt("\nEnter stock symbol (or 'back' to return): ").strip().upper()
             
             if stock_symbol.lower() == 'back':
                 return
             
             if stock_symbol not in self.stock_prices:
                 print(f"❌ Stock symbol '{stock_symbol}' not found in our database.")
-                print("Please choose from the available stocks listed above.")
+                suggestions = self.universe.suggest(stock_symbol)
+                if suggestions:
+                    print(f"Did you mean: {', '.join(suggestions)}?")
+                else:
+                    print("Please choose from the available stocks listed above.")
                 continue
             
             try:
-                quantity = int(input(f"Enter quantity of {stock_symbol} shares: "))
+                quantity = int(self._prompt(f"Enter quantity of {stock_symbol} shares: "))
                 if quantity <= 0:
                     print("❌ Quantity must be a positive number.")
                     continue
                 
                 # Add to portfolio (if stock exists, add to existing quantity)
                 if stock_symbol in self.portfolio:
-                    self.portfolio[stock_symbol] += quantity
+                    self._set_position(stock_symbol, self.portfolio[stock_symbol] + quantity)
                     print(f"✅ Added {quantity} more shares of {stock_symbol}")
                     print(f"Total {stock_symbol} shares: {self.portfolio[stock_symbol]}")
                 else:
-                    self.portfolio[stock_symbol] = quantity
+                    self._set_position(stock_symbol, quantity)
                     print(f"✅ Added {quantity} shares of {stock_symbol} to your portfolio")
                 
                 break
@@ -106,7 +442,7 @@ class StockPortfolioTracker:
         print("\n📋 Your Current Portfolio:")
         self.display_portfolio()
         
-        stock_symbol = input("\nEnter stock symbol to remove (or 'back' to return): ").strip().upper()
+        stock_symbol = self._prompt("\nEnter stock symbol to remove (or 'back' to return): ").strip().upper()
         
         if stock_symbol.lower() == 'back':
             return
@@ -119,7 +455,7 @@ class StockPortfolioTracker:
             current_quantity = self.portfolio[stock_symbol]
             print(f"Current quantity of {stock_symbol}: {current_quantity}")
             
-            quantity_to_remove = int(input(f"Enter quantity to remove (max {current_quantity}): "))
+            quantity_to_remove = int(self._prompt(f"Enter quantity to remove (max {current_quantity}): "))
             
             if quantity_to_remove <= 0:
                 print("❌ Quantity must be a positive number.")
@@ -130,27 +466,181 @@ class StockPortfolioTracker:
                 return
             
             if quantity_to_remove == current_quantity:
-                del self.portfolio[stock_symbol]
+                self._set_position(stock_symbol, 0)
                 print(f"✅ Removed all {stock_symbol} shares from portfolio")
             else:
-                self.portfolio[stock_symbol] -= quantity_to_remove
+                self._set_position(stock_symbol, current_quantity - quantity_to_remove)
                 print(f"✅ Removed {quantity_to_remove} shares of {stock_symbol}")
                 print(f"Remaining {stock_symbol} shares: {self.portfolio[stock_symbol]}")
         
         except ValueError:
             print("❌ Please enter a valid number.")
     
+    def _set_position(self, symbol, quantity):
+        """Set the quantity held of a symbol and update the running total."""
+        old_quantity = self.portfolio.get(symbol, 0)
+        self.portfolio.set(symbol, quantity)
+        
+        price = self.stock_prices[symbol]
+        self._adjust_total(price * quantity if quantity > 0 else 0.0,
+                           price * old_quantity if old_quantity else 0.0)
+        self._columns_stale = True
+        
+        if self.ledger is not None:
+            self.ledger.record_set(symbol, max(quantity, 0))
+            self._snapshot_if_due()
+    
+    def _reset_positions(self, portfolio, record=True):
+        """Replace the whole portfolio and rebuild the running total."""
+        store = PositionStore(portfolio)  # Checks every quantity before anything changes
+        if record and self.ledger is not None:
+            self.ledger.record_reset(store)
+            self._unpriced_positions = {}  # The logged reset clears them too
+        
+        self.portfolio = store
+        positions, self._total_value = self._value_positions()
+        self._total_partials = []
+        for _, _, _, value in positions:
+            add_exact(self._total_partials, value)
+        self._columns_stale = True
+        
+        if record and self.ledger is not None:
+            self._snapshot_if_due()
+    
+    def _snapshot_if_due(self):
+        """Write a compacted ledger snapshot once enough changes have been logged."""
+        if self.ledger.snapshot_due():
+            positions = dict(self._unpriced_positions)
+            positions.update(self.portfolio.positions())
+            self.ledger.write_snapshot(positions)
+    
+    def _adjust_total(self, value, old_value):
+        """Replace a position's old market value with its new one in the running total."""
+        if self.portfolio:
+            add_exact(self._total_partials, value)
+            add_exact(self._total_partials, -old_value)
+            self._total_value = math.fsum(self._total_partials)
+        else:
+            self._total_partials = []
+            self._total_value = 0.0
+    
+    def update_stock_price(self, symbol, price):
+        """Change the price of a stock and revalue any position held in it."""
+        check_price(symbol, price)
+        if self._shared_prices:
+            self.stock_prices = dict(self.stock_prices)
+            self._shared_prices = False
+        old_price = self.stock_prices.get(symbol)
+        self.stock_prices[symbol] = price
+        self.price_version += 1
+        self._columns = None
+        
+        quantity = self.portfolio.get(symbol)
+        if quantity is not None:
+            self._adjust_total(price * quantity, old_price * quantity)
+    
+    def replace_stock_prices(self, prices):
+        """Swap in a whole new price table at once and revalue the portfolio against it."""
+        for symbol, price in prices.items():
+            check_price(symbol, price)
+        
+        stock_prices = dict(self.stock_prices)
+        stock_prices.update(prices)
+        
+        # A single assignment, so readers see either the old table or the new one
+        self.stock_prices = stock_prices
+        self._shared_prices = False
+        self.price_version += 1
+        self._columns = None
+        self._reset_positions(self.portfolio, record=False)
+        
+        ttl = self.quote_cache.ttl
+        if ttl is not None:
+            self._prices_valid_until = time.monotonic() + ttl
+    
+    def use_price_table(self, prices):
+        """Read prices from a table shared with other trackers, without copying it.
+        
+        The table replaces the tracker's own prices and the portfolio is revalued
+        against it. The owner must publish changes as a new table rather than edit
+        this one; the tracker itself copies the table before changing any price.
+        """
+        self.stock_prices = prices
+        self._shared_prices = True
+        self.price_version += 1
+        self._columns = None
+        self._reset_positions(self.portfolio, record=False)
+        self._prices_valid_until = math.inf  # Prices now come from the table's owner
+    
+    def verify_cached_totals(self):
+        """Compare the running total against a full recompute of the portfolio."""
+        _, total_value = self._value_positions()
+        
+        # Both sides are the correctly rounded sum of the same values, so they must be equal
+        if self._total_value != total_value:
+            raise RuntimeError(f"Cached portfolio total is {self._total_value}, expected {total_value}")
+    
+    def _cached_positions(self):
+        """Return (stock, quantity, price, value) rows and the running total."""
+        self.refresh_prices()
+        
+        if self.check_consistency:
+            self.verify_cached_totals()
+        
+        # Rows come from the same engine as the totals (columnar for large portfolios)
+        positions, _ = self._value_positions()
+        return positions, self._total_value
+    
+    def exact_positions(self):
+        """Return an ExactValuation of the portfolio, for exact values and totals in cents."""
+        self.refresh_prices()
+        return ExactValuation(self.portfolio, self.stock_prices)
+    
+    def get_positions(self):
+        """Return (stock, quantity, price, value) rows and the total portfolio value."""
+        return self._cached_positions()
+    
+    def _columnar_portfolio(self):
+        """Return the columnar store, reloading positions only if they changed."""
+        if self._columns is None:
+            self._columns = ColumnarPortfolio(self.stock_prices)
+            self._columns_stale = True
+        
+        if self._columns_stale:
+            self._columns.load(self.portfolio)
+            self._columns_stale = False
+        
+        return self._columns
+    
+    def _use_columnar(self):
+        """Check whether the portfolio is large enough for vectorized valuation."""
+        return np is not None and len(self.portfolio) >= COLUMNAR_THRESHOLD
+    
+    def _value_positions(self):
+        """Return (stock, quantity, price, value) rows and the total portfolio value."""
+        if self._use_columnar():
+            store = self.portfolio
+            prices, values, total_value = self._columnar_portfolio().valuate(store)
+            positions = [row for row in zip(store.symbols, store.quantities, prices.tolist(),
+                                            values.tolist())
+                         if row[0] is not None]
+            return positions, total_value
+        
+        positions = []
+        for stock, quantity in self.portfolio.positions():
+            price = self.stock_prices[stock]
+            positions.append((stock, quantity, price, price * quantity))
+        
+        return positions, math.fsum(value for _, _, _, value in positions)
+    
     def calculate_portfolio_value(self):
         """Calculate the total value of the portfolio."""
-        if not self.portfolio:
-            return 0.0
+        self.refresh_prices()
         
-        total_value = 0.0
-        for stock, quantity in self.portfolio.items():
-            stock_value = self.stock_prices[stock] * quantity
-            total_value += stock_value
+        if self.check_consistency:
+            self.verify_cached_totals()
         
-        return total_value
+        return self._total_value
     
     def display_portfolio(self):
         """Display the current portfolio with values."""
@@ -164,13 +654,9 @@ class StockPortfolioTracker:
         print(f"{'Stock':<8} {'Quantity':<10} {'Price/Share':<12} {'Total Value':<15}")
         print("-" * 70)
         
-        total_portfolio_value = 0.0
+        positions, total_portfolio_value = self._cached_positions()
         
-        for stock, quantity in self.portfolio.items():
-            price_per_share = self.stock_prices[stock]
-            total_value = price_per_share * quantity
-            total_portfolio_value += total_value
-            
+        for stock, quantity, price_per_share, total_value in positions:
             print(f"{stock:<8} {quantity:<10} ${price_per_share:<11.2f} ${total_value:<14.2f}")
         
         print("-" * 70)
@@ -178,7 +664,7 @@ class StockPortfolioTracker:
         print("=" * 70)
     
     def save_portfolio_to_file(self, filename=None):
-        """Save the portfolio to a CSV or TXT file."""
+        """Save the portfolio to a CSV, TXT or binary snapshot file."""
         if not self.portfolio:
             print("❌ Portfolio is empty. Nothing to save.")
             return
@@ -189,39 +675,67 @@ class StockPortfolioTracker:
         
         # Ask user for file format
         while True:
-            file_format = input("Save as (1) CSV or (2) TXT? Enter 1 or 2: ").strip()
-            if file_format in ['1', '2']:
+            file_format = self._prompt("Save as (1) CSV, (2) TXT or (3) binary snapshot? Enter 1-3: ").strip()
+            if file_format in ['1', '2', '3']:
                 break
-            print("❌ Please enter 1 for CSV or 2 for TXT.")
+            print("❌ Please enter 1 for CSV, 2 for TXT or 3 for a binary snapshot.")
         
         if file_format == '1':
             filename += '.csv'
             self._save_as_csv(filename)
-        else:
+        elif file_format == '2':
             filename += '.txt'
             self._save_as_txt(filename)
+        else:
+            filename += SNAPSHOT_EXTENSION
+            self._save_as_snapshot(filename)
+    
+    def _write_csv(self, filename):
+        """Write the portfolio to a CSV file."""
+        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.writer(csvfile)
+            
+            # Write header
+            writer.writerow(['Stock Symbol', 'Quantity', 'Price per Share', 'Total Value'])
+            
+            valuation = self.exact_positions()
+            
+            # Write portfolio data
+            for stock, quantity, price, value in valuation.rows():
+                writer.writerow([stock, quantity, f"${price}", f"${value}"])
+            
+            # Write total
+            writer.writerow(['', '', 'TOTAL:', f"${valuation.formatted_total()}"])
+    
+    def _write_txt(self, filename):
+        """Write the portfolio to a TXT file."""
+        with open(filename, 'w', encoding='utf-8') as txtfile:
+            txtfile.write("STOCK PORTFOLIO TRACKER - CodeAlpha\n")
+            txtfile.write("=" * 50 + "\n")
+            txtfile.write(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+            
+            txtfile.write(f"{'Stock':<8} {'Quantity':<10} {'Price/Share':<12} {'Total Value':<15}\n")
+            txtfile.write("-" * 50 + "\n")
+            
+            valuation = self.exact_positions()
+            
+            for stock, quantity, price, value in valuation.rows():
+                txtfile.write(f"{stock:<8} {quantity:<10} ${price:<11} ${value:<14}\n")
+            
+            txtfile.write("-" * 50 + "\n")
+            txtfile.write(f"TOTAL PORTFOLIO VALUE: ${valuation.formatted_total()}\n")
+    
+    def _write_snapshot(self, filename):
+        """Write the portfolio to a binary snapshot file."""
+        self.refresh_prices()
+        positions = [(stock, quantity, self.stock_prices[stock])
+                     for stock, quantity in self.portfolio.positions()]
+        write_portfolio_snapshot(filename, positions)
     
     def _save_as_csv(self, filename):
         """Save portfolio as CSV file."""
         try:
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                
-                # Write header
-                writer.writerow(['Stock Symbol', 'Quantity', 'Price per Share', 'Total Value'])
-                
-                total_value = 0.0
-                
-                # Write portfolio data
-                for stock, quantity in self.portfolio.items():
-                    price = self.stock_prices[stock]
-                    value = price * quantity
-                    total_value += value
-                    writer.writerow([stock, quantity, f"${price:.2f}", f"${value:.2f}"])
-                
-                # Write total
-                writer.writerow(['', '', 'TOTAL:', f"${total_value:.2f}"])
-            
+            self._write_csv(filename)
             print(f"✅ Portfolio saved successfully as {filename}")
             
         except Exception as e:
@@ -230,30 +744,172 @@ class StockPortfolioTracker:
     def _save_as_txt(self, filename):
         """Save portfolio as TXT file."""
         try:
-            with open(filename, 'w', encoding='utf-8') as txtfile:
-                txtfile.write("STOCK PORTFOLIO TRACKER - CodeAlpha\n")
-                txtfile.write("=" * 50 + "\n")
-                txtfile.write(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                
-                txtfile.write(f"{'Stock':<8} {'Quantity':<10} {'Price/Share':<12} {'Total Value':<15}\n")
-                txtfile.write("-" * 50 + "\n")
-                
-                total_value = 0.0
-                
-                for stock, quantity in self.portfolio.items():
-                    price = self.stock_prices[stock]
-                    value = price * quantity
-                    total_value += value
-                    txtfile.write(f"{stock:<8} {quantity:<10} ${price:<11.2f} ${value:<14.2f}\n")
-                
-                txtfile.write("-" * 50 + "\n")
-                txtfile.write(f"TOTAL PORTFOLIO VALUE: ${total_value:.2f}\n")
-            
+            self._write_txt(filename)
             print(f"✅ Portfolio saved successfully as {filename}")
             
         except Exception as e:
             print(f"❌ Error saving file: {e}")
     
+    def _aggregate_import_chunk(self, chunk, totals):
+        """Validate a chunk of imported rows and add its quantities to totals."""
+        rejected = 0
+        for symbol, quantity in chunk:
+            symbol = symbol.strip().upper()
+            
+            if not symbol or symbol == 'TOTAL:':
+                # Blank symbols are the total row of files written by _save_as_csv
+                if quantity.strip():
+                    rejected += 1
+                continue
+            
+            if symbol not in self.stock_prices:
+                rejected += 1
+                continue
+            
+            try:
+                totals[symbol] = totals.get(symbol, 0) + int(quantity.strip().replace(',', ''))
+            except ValueError:
+                rejected += 1
+        
+        return rejected
+    
+    def import_positions_from_csv(self, filename, chunk_size=IMPORT_CHUNK_SIZE):
+        """Stream positions from a CSV file into the portfolio, aggregating per symbol."""
+        self.refresh_prices()
+        
+        start_time = time.perf_counter()
+        totals = {}
+        rows = 0
+        rejected = 0
+        
+        for chunk in chunked(read_position_rows(filename), chunk_size):
+            rows += len(chunk)
+            rejected += self._aggregate_import_chunk(chunk, totals)
+        
+        # Apply the aggregated quantities only once the whole file has been read
+        for symbol, quantity in totals.items():
+            self._set_position(symbol, max(self.portfolio.get(symbol, 0) + quantity, 0))
+        
+        elapsed = time.perf_counter() - start_time
+        return {
+            'rows': rows,
+            'rejected': rejected,
+            'symbols': len(totals),
+            'seconds': elapsed,
+            'rows_per_second': rows / elapsed if elapsed > 0 else 0.0
+        }
+    
+    def import_portfolio_from_file(self):
+        """Ask for a CSV or snapshot file and import its positions into the portfolio."""
+        filename = self._prompt("Enter CSV or snapshot file to import (or 'back' to return): ").strip()
+        
+        if filename.lower() == 'back':
+            return
+        
+        try:
+            if filename.endswith(SNAPSHOT_EXTENSION):
+                stats = self.import_positions_from_snapshot(filename)
+            else:
+                stats = self.import_positions_from_csv(filename)
+        except (OSError, ValueError, csv.Error) as e:
+            print(f"❌ Error importing file: {e}")
+            return
+        
+        print(f"✅ Imported {stats['rows']:,} rows covering {stats['symbols']} stocks "
+              f"in {stats['seconds']:.2f}s ({stats['rows_per_second']:,.0f} rows/sec)")
+        if stats['rejected']:
+            print(f"⚠️  Skipped {stats['rejected']:,} rows with unknown symbols or invalid quantities")
+    
+    def _save_as_snapshot(self, filename):
+        """Save portfolio as a binary snapshot file."""
+        try:
+            self._write_snapshot(filename)
+            print(f"✅ Portfolio saved successfully as {filename}")
+        
+        except Exception as e:
+            print(f"❌ Error saving file: {e}")
+    
+    def import_positions_from_snapshot(self, filename):
+        """Add the positions stored in a binary snapshot to the portfolio."""
+        self.refresh_prices()
+        
+        start_time = time.perf_counter()
+        totals = {}
+        rejected = 0
+        
+        with PortfolioSnapshot(filename) as snapshot:
+            for symbol, quantity in zip(snapshot.symbols(), snapshot.quantities.tolist()):
+                if symbol in self.stock_prices:
+                    totals[symbol] = totals.get(symbol, 0) + quantity
+                else:
+                    rejected += 1
+            rows = snapshot.count
+        
+        for symbol, quantity in totals.items():
+            self._set_position(symbol, max(self.portfolio.get(symbol, 0) + quantity, 0))
+        
+        elapsed = time.perf_counter() - start_time
+        return {
+            'rows': rows,
+            'rejected': rejected,
+            'symbols': len(totals),
+            'seconds': elapsed,
+            'rows_per_second': rows / elapsed if elapsed > 0 else 0.0
+        }
+    
+    def add_position(self, symbol, quantity):
+        """Add shares of a stock without prompting or printing anything."""
+        self.refresh_prices()
+        symbol = symbol.upper()
+        
+        if symbol not in self.stock_prices:
+            raise ValueError(f"Stock symbol '{symbol}' not found in our database")
+        if quantity <= 0:
+            raise ValueError("Quantity must be a positive number")
+        
+        self._set_position(symbol, self.portfolio.get(symbol, 0) + quantity)
+    
+    def remove_position(self, symbol, quantity=None):
+        """Remove shares of a stock (all of them if quantity is None) without any output."""
+        symbol = symbol.upper()
+        current_quantity = self.portfolio.get(symbol)
+        
+        if current_quantity is None:
+            raise ValueError(f"{symbol} not found in your portfolio")
+        if quantity is None:
+            quantity = current_quantity
+        if quantity <= 0:
+            raise ValueError("Quantity must be a positive number")
+        if quantity > current_quantity:
+            raise ValueError(f"Cannot remove {quantity} shares. You only have {current_quantity}")
+        
+        self._set_position(symbol, current_quantity - quantity)
+    
+    def search_stocks(self, text, limit=20):
+        """Return (symbol, company, price) for listed stocks matching a symbol or name prefix."""
+        self.refresh_prices()
+        return [(symbol, self.universe.company(symbol), self.stock_prices[symbol])
+                for symbol in self.universe.search(text, limit)
+                if symbol in self.stock_prices]
+    
+    def clear_positions(self):
+        """Empty the portfolio without asking for confirmation."""
+        self._reset_positions({})
+    
+    def export_portfolio(self, filename, file_format=None):
+        """Write the portfolio to a csv, txt or snapshot file, picking the format from the extension."""
+        if file_format is None:
+            file_format = os.path.splitext(filename)[1].lstrip('.').lower() or 'csv'
+        
+        writers = {
+            'csv': self._write_csv,
+            'txt': self._write_txt,
+            SNAPSHOT_EXTENSION.lstrip('.'): self._write_snapshot
+        }
+        if file_format not in writers:
+            raise ValueError(f"Unknown file format '{file_format}'")
+        writers[file_format](filename)
+    
     def load_demo_portfolio(self):
         """Load a demo portfolio for testing purposes."""
         demo_portfolio = {
@@ -262,7 +918,7 @@ class StockPortfolioTracker:
             "GOOGL": 2
         }
         
-        self.portfolio = demo_portfolio.copy()
+        self._reset_positions(demo_portfolio)
         print("✅ Demo portfolio loaded!")
         print("Demo includes: 10 AAPL, 5 TSLA, 2 GOOGL shares")
     
@@ -272,9 +928,9 @@ class StockPortfolioTracker:
             print("📭 Portfolio is already empty.")
             return
         
-        confirm = input("⚠️  Are you sure you want to clear your entire portfolio? (y/n): ").strip().lower()
+        confirm = self._prompt("⚠️  Are you sure you want to clear your entire portfolio? (y/n): ").strip().lower()
         if confirm in ['y', 'yes']:
-            self.portfolio.clear()
+            self._reset_positions({})
             print("✅ Portfolio cleared successfully.")
         else:
             print("Portfolio clearing cancelled.")
@@ -291,9 +947,52 @@ class StockPortfolioTracker:
         print("5. 💾 Save Portfolio to File")
         print("6. 🧪 Load Demo Portfolio")
         print("7. 🗑️  Clear Portfolio")
-        print("8. 🚪 Exit")
+        print("8. 📥 Import Positions from File")
+        print("9. 🚪 Exit")
         print("=" * 50)
     
+    def _prompt(self, message):
+        """Ask the user for a line of input; instrumentation times the wait separately."""
+        return input(message)
+    
+    def _handle_menu_choice(self, choice):
+        """Carry out one main menu choice; return False when the user chose to exit."""
+        if choice == '1':
+            self.display_available_stocks()
+            self._prompt("\nPress Enter to continue...")
+        
+        elif choice == '2':
+            self.add_stock_to_portfolio()
+        
+        elif choice == '3':
+            self.remove_stock_from_portfolio()
+        
+        elif choice == '4':
+            self.display_portfolio()
+            self._prompt("\nPress Enter to continue...")
+        
+        elif choice == '5':
+            self.save_portfolio_to_file()
+        
+        elif choice == '6':
+            self.load_demo_portfolio()
+        
+        elif choice == '7':
+            self.clear_portfolio()
+        
+        elif choice == '8':
+            self.import_portfolio_from_file()
+        
+        elif choice == '9':
+            print("\n👋 Thank you for using Stock Portfolio Tracker!")
+            print("Happy investing! 📈")
+            return False
+        
+        else:
+            print("❌ Invalid choice. Please enter a number between 1-9.")
+        
+        return True
+    
     def run(self):
         """Main application loop."""
         print("🎉 Welcome to Stock Portfolio Tracker!")
@@ -303,38 +1002,9 @@ class StockPortfolioTracker:
             self.display_menu()
             
             try:
-                choice = input("\nEnter your choice (1-8): ").strip()
-                
-                if choice == '1':
-                    self.display_available_stocks()
-                    input("\nPress Enter to continue...")
-                
-                elif choice == '2':
-                    self.add_stock_to_portfolio()
-                
-                elif choice == '3':
-                    self.remove_stock_from_portfolio()
-                
-                elif choice == '4':
-                    self.display_portfolio()
-                    input("\nPress Enter to continue...")
-                
-                elif choice == '5':
-                    self.save_portfolio_to_file()
-                
-                elif choice == '6':
-                    self.load_demo_portfolio()
-                
-                elif choice == '7':
-                    self.clear_portfolio()
-                
-                elif choice == '8':
-                    print("\n👋 Thank you for using Stock Portfolio Tracker!")
-                    print("Happy investing! 📈")
+                choice = self._prompt("\nEnter your choice (1-9): ").strip()
+                if not self._handle_menu_choice(choice):
                     break
-                
-                else:
-                    print("❌ Invalid choice. Please enter a number between 1-8.")
             
             except KeyboardInterrupt:
                 print("\n\n👋 Goodbye! Thanks for using Stock Portfolio Tracker!")
@@ -344,10 +1014,125 @@ class StockPortfolioTracker:
                 print("Please try again.")
 
 
+def _parse_quantity(text):
+    """Parse a share quantity from a batch command argument."""
+    try:
+        return int(text)
+    except ValueError:
+        raise ValueError(f"Invalid quantity '{text}'") from None
+
+
+def run_batch_commands(tracker, lines, out=None, err=None, strict=False):
+    """Apply a stream of text commands to a tracker without any menus or prompts.
+    
+    One command per line; blank lines and lines starting with '#' are ignored:
+    
+        add SYMBOL QUANTITY       remove SYMBOL [QUANTITY]      clear
+        value                     price SYMBOL PRICE            save FILE [csv|txt|pfsnap]
+        import FILE
+    
+    Only 'value' writes to out. Errors go to err with their line number and the run
+    carries on, unless strict is set. Returns counts and throughput for the run.
+    """
+    out = out or sys.stdout
+    err = err or sys.stderr
+    
+    def value(args):
+        out.write(f"{tracker.calculate_portfolio_value():.2f}\n")
+    
+    def import_file(args):
+        if args[0].endswith(SNAPSHOT_EXTENSION):
+            tracker.import_positions_from_snapshot(args[0])
+        else:
+            tracker.import_positions_from_csv(args[0])
+    
+    handlers = {
+        'add': (2, 2, lambda args: tracker.add_position(args[0], _parse_quantity(args[1]))),
+        'remove': (1, 2, lambda args: tracker.remove_position(
+            args[0], _parse_quantity(args[1]) if len(args) > 1 else None)),
+        'clear': (0, 0, lambda args: tracker.clear_positions()),
+        'value': (0, 0, value),
+        'price': (2, 2, lambda args: tracker.update_stock_price(args[0].upper(), float(args[1]))),
+        'save': (1, 2, lambda args: tracker.export_portfolio(*args)),
+        'import': (1, 1, import_file)
+    }
+    
+    start_time = time.perf_counter()
+    commands = 0
+    errors = 0
+    
+    for line_number, line in enumerate(lines, 1):
+        parts = line.split()
+        if not parts or parts[0].startswith('#'):
+            continue
+        
+        commands += 1
+        name, args = parts[0].lower(), parts[1:]
+        try:
+            if name not in handlers:
+                raise ValueError(f"Unknown command '{name}'")
+            min_args, max_args, handler = handlers[name]
+            if not min_args <= len(args) <= max_args:
+                raise ValueError(f"Wrong number of arguments for '{name}'")
+            handler(args)
+        except (ValueError, OSError, csv.Error) as e:
+            errors += 1
+            err.write(f"❌ Line {line_number}: {e}\n")
+            if strict:
+                break
+    
+    elapsed = time.perf_counter() - start_time
+    return {
+        'commands': commands,
+        'errors': errors,
+        'seconds': elapsed,
+        'commands_per_second': commands / elapsed if elapsed > 0 else 0.0
+    }
+
+
 def main():
     """Main function to run the Stock Portfolio Tracker."""
-    tracker = StockPortfolioTracker()
-    tracker.run()
+    parser = argparse.ArgumentParser(description="Stock Portfolio Tracker - CodeAlpha")
+    parser.add_argument('--batch', metavar='FILE',
+                        help="apply commands from FILE ('-' for stdin) instead of the menu")
+    parser.add_argument('--prices', metavar='CSV', help="load prices from a Symbol,Price CSV file")
+    parser.add_argument('--universe', metavar='CSV',
+                        help="load company names from a Symbol,Company CSV file")
+    parser.add_argument('--ledger', metavar='DIR',
+                        help="keep a durable transaction log in DIR and recover from it on start")
+    parser.add_argument('--strict', action='store_true', help="stop at the first failing command")
+    args = parser.parse_args()
+    
+    price_source = FilePriceProvider(args.prices) if args.prices else None
+    universe = SymbolUniverse.from_file(args.universe) if args.universe else None
+    ledger = TransactionLedger(args.ledger) if args.ledger else None
+    tracker = StockPortfolioTracker(price_source=price_source, universe=universe, ledger=ledger)
+    
+    # Metrics and profiling are off unless asked for in the environment
+    instrumentation = Instrumentation.from_environment()
+    if instrumentation is not None:
+        instrument_tracker(tracker, instrumentation)
+    
+    try:
+        if args.batch is None:
+            tracker.run()
+            return
+        
+        if args.batch == '-':
+            stats = run_batch_commands(tracker, sys.stdin, strict=args.strict)
+        else:
+            with open(args.batch, encoding='utf-8') as commands:
+                stats = run_batch_commands(tracker, commands, strict=args.strict)
+    finally:
+        if ledger is not None:
+            ledger.close()
+        if instrumentation is not None:
+            instrumentation.dump()
+    
+    sys.stderr.write(f"Processed {stats['commands']:,} commands in {stats['seconds']:.2f}s "
+                     f"({stats['commands_per_second']:,.0f} commands/sec), {stats['errors']:,} errors\n")
+    if stats['errors']:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
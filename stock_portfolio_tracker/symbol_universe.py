@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Symbol Universe - Stock Portfolio Tracker
+=========================================
+
+An index over the listed stocks: symbols, company names and fast lookups.
+
+Symbols are kept in a trie for prefix search. Company names are kept in a sorted
+list and searched with bisect, which gives the same prefix lookups without one
+trie node per character of every name. "Did you mean" suggestions narrow the
+universe down with a bigram index before ranking the survivors with difflib, so
+they stay fast with tens of thousands of listings.
+
+Author: CodeAlpha Intern
+Date: September 2025
+"""
+
+import csv
+import difflib
+from bisect import bisect_left
+from collections import Counter
+
+# Candidates kept after bigram filtering, before difflib ranks them
+FUZZY_CANDIDATES = 50
+
+
+def _bigrams(text):
+    """Return the set of two-letter substrings of text (padded at both ends)."""
+    padded = f" {text} "
+    return {padded[i:i + 2] for i in range(len(padded) - 1)}
+
+
+class SymbolUniverse:
+    """Searchable index of stock symbols and company names."""
+    
+    def __init__(self, companies=None):
+        """Build the index from a {symbol: company name} dictionary."""
+        self.companies = {}
+        self._trie = {}
+        self._names = []  # Sorted (lowercase name, symbol) pairs
+        self._bigram_index = {}
+        self._names_sorted = True
+        
+        for symbol, company in (companies or {}).items():
+            self.add(symbol, company)
+    
+    @classmethod
+    def from_file(cls, filename):
+        """Load a universe from a 'Symbol,Company' CSV file (a header row is optional)."""
+        universe = cls()
+        with open(filename, newline='', encoding='utf-8') as csvfile:
+            for row in csv.reader(csvfile):
+                if len(row) < 2 or not row[0].strip():
+                    continue
+                symbol = row[0].strip().upper()
+                if symbol in ('SYMBOL', 'STOCK SYMBOL', 'TICKER'):
+                    continue
+                universe.add(symbol, row[1].strip())
+        return universe
+    
+    def __len__(self):
+        """Return the number of listed symbols."""
+        return len(self.companies)
+    
+    def __contains__(self, symbol):
+        """Check whether a symbol is listed."""
+        return symbol in self.companies
+    
+    def company(self, symbol, default="Unknown Company"):
+        """Return the company name for a symbol."""
+        return self.companies.get(symbol, default)
+    
+    def add(self, symbol, company):
+        """Add one listing to every index."""
+        symbol = symbol.upper()
+        if symbol in self.companies:
+            return
+        self.companies[symbol] = company
+        
+        node = self._trie
+        for char in symbol:
+            node = node.setdefault(char, {})
+        node[None] = symbol  # None marks the end of a symbol
+        
+        self._names.append((company.lower(), symbol))
+        self._names_sorted = False
+        
+        for key in (symbol.lower(), company.lower()):
+            for bigram in _bigrams(key):
+                self._bigram_index.setdefault(bigram, []).append(symbol)
+    
+    def _sorted_names(self):
+        """Return the name index, sorting it first if listings were added."""
+        if not self._names_sorted:
+            self._names.sort()
+            self._names_sorted = True
+        return self._names
+    
+    def symbols_with_prefix(self, prefix, limit=20):
+        """Return up to limit symbols starting with prefix, in alphabetical order."""
+        node = self._trie
+        for char in prefix.upper():
+            node = node.get(char)
+            if node is None:
+                return []
+        
+        matches = []
+        stack = [node]
+        while stack and len(matches) < limit:
+            node = stack.pop()
+            if None in node:
+                matches.append(node[None])
+            # Push children in reverse so they pop in alphabetical order
+            children = sorted((char for char in node if char is not None), reverse=True)
+            stack.extend(node[char] for char in children)
+        return matches
+    
+    def companies_with_prefix(self, prefix, limit=20):
+        """Return up to limit symbols whose company name starts with prefix."""
+        prefix = prefix.lower()
+        names = self._sorted_names()
+        matches = []
+        for i in range(bisect_left(names, (prefix, '')), len(names)):
+            name, symbol = names[i]
+            if not name.startswith(prefix) or len(matches) == limit:
+                break
+            matches.append(symbol)
+        return matches
+    
+    def search(self, text, limit=20):
+        """Return symbols whose symbol or company name starts with text."""
+        matches = self.symbols_with_prefix(text, limit)
+        for symbol in self.companies_with_prefix(text, limit):
+            if len(matches) == limit:
+                break
+            if symbol not in matches:
+                matches.append(symbol)
+        return matches
+    
+    def suggest(self, text, limit=3, cutoff=0.6):
+        """Return up to limit symbols that closely match text by symbol or company name."""
+        text = text.strip()
+        if not text:
+            return []
+        
+        # Keep only listings sharing the most bigrams with the text, then rank them properly
+        shared = Counter()
+        for bigram in _bigrams(text.lower()):
+            shared.update(self._bigram_index.get(bigram, ()))
+        candidates = [symbol for symbol, _ in shared.most_common(FUZZY_CANDIDATES)]
+        
+        scored = []
+        for symbol in candidates:
+            symbol_score = difflib.SequenceMatcher(None, text.upper(), symbol).ratio()
+            company_score = difflib.SequenceMatcher(None, text.lower(),
+                                                    self.companies[symbol].lower()).ratio()
+            score = max(symbol_score, company_score)
+            if score >= cutoff:
+                scored.append((-score, symbol))
+        
+        return [symbol for _, symbol in sorted(scored)[:limit]]
\ No newline at end of file
@@ -0,0 +1,46 @@
+"""Tests for process-pool valuation of many portfolios."""
+
+import unittest
+
+from batch_valuation import value_portfolios, value_trackers
+from price_sources import StaticPriceProvider
+from stock_tracker import StockPortfolioTracker
+
+PRICES = {'AAPL': 180.5, 'TSLA': 250.75, 'MSFT': 0.1}
+
+
+def _tracker(positions, prices=PRICES):
+    tracker = StockPortfolioTracker(price_source=StaticPriceProvider(prices), quote_ttl=None)
+    for symbol, quantity in positions.items():
+        tracker.add_position(symbol, quantity)
+    return tracker
+
+
+class BatchValuationTest(unittest.TestCase):
+
+    def test_unknown_symbols_are_reported_per_account(self):
+        portfolios = {'A': {'AAPL': 2, 'NOPE': 3}, 'B': {'TSLA': 1}}
+        results = value_portfolios(portfolios, PRICES, workers=2, chunk_size=1)
+        self.assertEqual(results['A']['total'], 361.0)
+        self.assertEqual(results['A']['unknown'], ['NOPE'])
+        self.assertEqual(results['A']['positions'], [('AAPL', 2, 180.5, 361.0)])
+        self.assertEqual(results['B'], {'total': 250.75, 'positions': [('TSLA', 1, 250.75, 250.75)],
+                                        'unknown': []})
+
+    def test_totals_match_tracker(self):
+        trackers = {'A': _tracker({'AAPL': 3, 'MSFT': 10 ** 15}), 'B': _tracker({'TSLA': 7})}
+        results = value_trackers(trackers, workers=2, include_positions=False)
+        for account_id, tracker in trackers.items():
+            self.assertEqual(results[account_id]['total'], tracker.calculate_portfolio_value())
+
+    def test_conflicting_tracker_prices_are_rejected(self):
+        trackers = {'A': _tracker({'AAPL': 1}),
+                    'B': _tracker({'AAPL': 1}, dict(PRICES, AAPL=190.0))}
+        with self.assertRaises(ValueError):
+            value_trackers(trackers, workers=1)
+        results = value_trackers(trackers, stock_prices=PRICES, workers=1)
+        self.assertEqual(results['B']['total'], 180.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
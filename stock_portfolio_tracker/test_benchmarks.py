@@ -0,0 +1,53 @@
+"""Tests for the benchmark suite and its regression check."""
+
+import unittest
+
+from benchmarks import MIN_COMPARED_BYTES, compare_results, run_benchmarks
+
+
+def _record(path, size, seconds, peak_bytes=None):
+    return {'path': path, 'size': size, 'seconds': seconds, 'peak_bytes': peak_bytes}
+
+
+class CompareResultsTest(unittest.TestCase):
+
+    def test_slower_path_regresses(self):
+        baseline = {'results': [_record('save_as_csv', 1000, 0.010)]}
+        self.assertEqual(compare_results([_record('save_as_csv', 1000, 0.012)], baseline), [])
+        regressions = compare_results([_record('save_as_csv', 1000, 0.013)], baseline)
+        self.assertEqual(regressions, ["save_as_csv @ 1,000: 10.00 ms -> 13.00 ms"])
+
+    def test_peak_memory_regresses(self):
+        old_peak = 10 * MIN_COMPARED_BYTES
+        baseline = {'results': [_record('display_portfolio', 100, 0.0, old_peak)]}
+        self.assertEqual(compare_results(
+            [_record('display_portfolio', 100, 0.0, old_peak * 1.05)], baseline), [])
+        regressions = compare_results(
+            [_record('display_portfolio', 100, 0.0, int(old_peak * 1.2))], baseline)
+        self.assertEqual(len(regressions), 1)
+        self.assertIn("peak memory", regressions[0])
+
+    def test_unmeasurable_and_new_paths_are_not_compared(self):
+        baseline = {'results': [_record('calculate_portfolio_value', 10, 0.0001, 1000),
+                                _record('save_as_txt', 10, 0.01)]}
+        results = [_record('calculate_portfolio_value', 10, 0.01, 100000),
+                   _record('save_as_txt', 10, 0.1, 10 * MIN_COMPARED_BYTES),
+                   _record('save_as_txt', 100, 1.0)]
+        self.assertEqual(compare_results(results, baseline),
+                         ["save_as_txt @ 10: 10.00 ms -> 100.00 ms"])
+
+
+class RunBenchmarksTest(unittest.TestCase):
+
+    def test_small_run_covers_every_path(self):
+        results = run_benchmarks([10], repeat=1, measure_memory=False)
+        self.assertEqual({record['path'] for record in results},
+                         {'calculate_portfolio_value', 'revalue_all_positions',
+                          'display_portfolio', 'save_as_csv', 'save_as_txt',
+                          'add_remove_position'})
+        self.assertTrue(all(record['peak_bytes'] is None for record in results))
+        self.assertEqual(compare_results(results, {'results': results}), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""Tests for tracker instrumentation and its metrics."""
+
+import contextlib
+import io
+import os
+import tempfile
+import time
+import unittest
+
+from instrumentation import DEFAULT_PROFILE_EVERY, Instrumentation, TrackerMetrics
+
+
+class InstrumentationTest(unittest.TestCase):
+
+    def test_calls_and_errors_are_counted(self):
+        instrumentation = Instrumentation()
+        parse = instrumentation.wrap('parse', int)
+        self.assertEqual(parse('42'), 42)
+        with self.assertRaises(ValueError):
+            parse('forty-two')
+        metrics = instrumentation.metrics
+        self.assertEqual(metrics.calls, {'parse': 2})
+        self.assertEqual(metrics.errors, {'parse': 1})
+        self.assertEqual(metrics.latencies['parse'].count, 2)
+
+    def test_writers_count_bytes(self):
+        def write(filename, text):
+            with open(filename, 'w', encoding='ascii') as outfile:
+                outfile.write(text)
+
+        instrumentation = Instrumentation()
+        save = instrumentation.wrap('save', write, count_bytes=True)
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'out.txt')
+            save(filename, 'x' * 10)
+            save(filename, 'x' * 5)
+        self.assertEqual(instrumentation.metrics.bytes_written, {'save': 15})
+
+    def test_latency_histogram(self):
+        metrics = TrackerMetrics()
+        metrics.observe('refresh_prices', 0.0002)
+        metrics.observe('refresh_prices', 10.0, failed=True)
+        buckets = metrics.to_dict()['latency_seconds']['refresh_prices']['buckets']
+        self.assertEqual((buckets['0.0005'], buckets['+Inf'], sum(buckets.values())), (1, 1, 2))
+        text = metrics.to_prometheus()
+        self.assertIn('portfolio_tracker_latency_seconds_bucket'
+                      '{operation="refresh_prices",le="0.001"} 1', text)
+        self.assertIn('portfolio_tracker_latency_seconds_bucket'
+                      '{operation="refresh_prices",le="+Inf"} 2', text)
+        self.assertIn('portfolio_tracker_errors_total{operation="refresh_prices"} 1', text)
+
+    def test_environment_turns_instrumentation_on(self):
+        self.assertIsNone(Instrumentation.from_environment({}))
+        instrumentation = Instrumentation.from_environment({'PORTFOLIO_METRICS': 'out.prom'})
+        self.assertEqual(instrumentation.metrics_file, 'out.prom')
+        self.assertIsNone(instrumentation.profiler)
+
+    def test_unrecognised_menu_input_shares_one_label(self):
+        instrumentation = Instrumentation()
+        handle = instrumentation.wrap_menu(lambda choice: True)
+        for choice in ('4', 'hello', '', '42', '4'):
+            handle(choice)
+        self.assertEqual(instrumentation.metrics.calls, {'menu:4': 2, 'menu:invalid': 3})
+
+    def test_prometheus_label_values_are_escaped(self):
+        metrics = TrackerMetrics()
+        metrics.observe('say "hi"\\now\n', 0.001)
+        text = metrics.to_prometheus()
+        self.assertIn('portfolio_tracker_calls_total{operation="say \\"hi\\"\\\\now\\n"} 1', text)
+        self.assertEqual(len(text.splitlines()), 22)  # A newline cannot split a sample
+
+    def test_prompt_wait_is_not_counted(self):
+        instrumentation = Instrumentation()
+        prompt = instrumentation.wrap_prompt(lambda message: time.sleep(0.2) or '')
+        handle = instrumentation.wrap_menu(lambda choice: prompt("Press Enter to continue..."))
+        handle('1')
+        latency = instrumentation.metrics.latencies['menu:1']
+        self.assertLess(latency.total_seconds, 0.1)
+        self.assertGreaterEqual(instrumentation.input_wait, 0.2)
+
+    def test_invalid_profile_every_falls_back_to_default(self):
+        environ = {'PORTFOLIO_PROFILE': 'out.pstats', 'PORTFOLIO_PROFILE_EVERY': 'often'}
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            instrumentation = Instrumentation.from_environment(environ)
+        self.assertEqual(instrumentation.profiler.every, DEFAULT_PROFILE_EVERY)
+        self.assertIn("PORTFOLIO_PROFILE_EVERY='often'", stderr.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
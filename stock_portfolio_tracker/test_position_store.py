@@ -0,0 +1,63 @@
+"""Tests for the position columns and exact valuation of position_store."""
+
+import pickle
+import unittest
+from decimal import Decimal
+
+from position_store import INT64_MAX, MIN_COMPACT_SLOTS, ExactValuation, PositionStore
+
+
+class PositionStoreTest(unittest.TestCase):
+
+    def test_mapping_behaviour(self):
+        store = PositionStore({'AAPL': 3, 'MSFT': 1})
+        store.set('TSLA', 2)
+        store.set('AAPL', 5)
+        store.set('MSFT', 0)
+        self.assertEqual(store, {'AAPL': 5, 'TSLA': 2})
+        self.assertEqual(list(store), ['AAPL', 'TSLA'])
+        self.assertNotIn('MSFT', store)
+        self.assertIsNone(store.get('MSFT'))
+
+    def test_compaction_keeps_order(self):
+        store = PositionStore((f"S{i}", i + 1) for i in range(2 * MIN_COMPACT_SLOTS))
+        for i in range(0, 2 * MIN_COMPACT_SLOTS, 2):
+            store.set(f"S{i}", 0)
+        self.assertEqual(len(store.symbols), MIN_COMPACT_SLOTS)
+        self.assertEqual(list(store.positions())[:2], [('S1', 2), ('S3', 4)])
+        self.assertEqual(store['S5'], 6)
+
+    def test_rejects_quantities_beyond_int64(self):
+        store = PositionStore({'AAPL': 1})
+        with self.assertRaises(ValueError):
+            store.set('AAPL', INT64_MAX + 1)
+        self.assertEqual(store, {'AAPL': 1})
+
+    def test_pickles_without_empty_slots(self):
+        store = PositionStore({'AAPL': 3, 'MSFT': 1})
+        store.set('AAPL', 0)
+        copy = pickle.loads(pickle.dumps(store))
+        self.assertEqual(copy, {'MSFT': 1})
+        self.assertEqual(copy.symbols, ['MSFT'])
+
+
+class ExactValuationTest(unittest.TestCase):
+
+    def test_total_is_exact(self):
+        portfolio = PositionStore({f"S{i}": 3 for i in range(100000)})
+        prices = {symbol: 0.1 for symbol in portfolio}
+        self.assertEqual(ExactValuation(portfolio, prices).total(), Decimal('30000.0'))
+
+    def test_sub_cent_prices_are_not_rounded_away(self):
+        valuation = ExactValuation({'PENNY': 1000000, 'AAPL': 3}, {'PENNY': 0.004, 'AAPL': 180.5})
+        self.assertEqual(list(valuation.rows()), [('PENNY', 1000000, '0.004', '4000.00'),
+                                                  ('AAPL', 3, '180.50', '541.50')])
+        self.assertEqual(valuation.formatted_total(), '4541.50')
+
+    def test_large_totals(self):
+        valuation = ExactValuation({'A': 2 ** 62, 'B': 2 ** 62}, {'A': 0.01, 'B': 0.01})
+        self.assertEqual(valuation.formatted_total(), '92233720368547758.08')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+"""Tests for the memory-mapped price history."""
+
+import math
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from price_history import PRICES_FILE, PriceHistory
+
+
+class PriceHistoryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.history = PriceHistory.create(self.directory.name, ['AAPL', 'MSFT', 'TSLA'])
+
+    def test_append_days_and_reopen(self):
+        self.history.append_days(['2025-09-01', '2025-09-02'], [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+        self.history.append_day('2025-09-03', {'MSFT': 7.0, 'XYZ': 1.0})
+
+        reopened = PriceHistory(self.directory.name)
+        self.assertEqual(len(reopened), 3)
+        self.assertEqual([str(day) for day in reopened.dates],
+                         ['2025-09-01', '2025-09-02', '2025-09-03'])
+        self.assertEqual(reopened.prices[1].tolist(), [4.0, 5.0, 6.0])
+        self.assertTrue(math.isnan(reopened.prices[2, 0]))
+        self.assertEqual(reopened.prices[2, 1], 7.0)
+
+    def test_days_must_increase(self):
+        self.history.append_day('2025-09-02', {'AAPL': 1.0})
+        with self.assertRaises(ValueError):
+            self.history.append_day('2025-09-02', {'AAPL': 2.0})
+        with self.assertRaises(ValueError):
+            self.history.append_days(['2025-09-04', '2025-09-03'], [[1.0] * 3, [2.0] * 3])
+        self.assertEqual(len(self.history), 1)
+
+    def test_value_series(self):
+        self.history.append_days(['2025-09-01', '2025-09-02'], [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+        self.history.append_day('2025-09-03', {'AAPL': 10.0})
+
+        dates, values = self.history.value_series({'AAPL': 2, 'TSLA': 1})
+        self.assertEqual(len(dates), 3)
+        self.assertEqual(values[:2].tolist(), [5.0, 14.0])
+        self.assertTrue(math.isnan(values[2]))  # No TSLA price that day
+        with self.assertRaises(ValueError):
+            self.history.value_series({'XYZ': 1})
+
+    def test_orphan_price_row_is_overwritten(self):
+        self.history.append_day('2025-09-01', {'AAPL': 1.0, 'MSFT': 2.0, 'TSLA': 3.0})
+        with open(os.path.join(self.directory.name, PRICES_FILE), 'ab') as pricefile:
+            pricefile.write(np.array([9.0, 9.0], dtype='<f8').tobytes())  # Crash mid-append
+
+        self.history.append_day('2025-09-02', {'AAPL': 4.0, 'MSFT': 5.0, 'TSLA': 6.0})
+        reopened = PriceHistory(self.directory.name)
+        self.assertEqual(reopened.prices.tolist(), [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+"""Tests for the TTL / LRU quote cache."""
+
+import threading
+import time
+import unittest
+
+from price_sources import QuoteCache, StaticPriceProvider
+
+
+class CountingProvider(StaticPriceProvider):
+    """A static provider that counts its fetches and can hold them until released."""
+
+    def __init__(self, prices):
+        super().__init__(prices)
+        self.requests = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def fetch_quotes(self, symbols):
+        self.requests.append(list(symbols))
+        self.started.set()
+        self.release.wait()
+        return super().fetch_quotes(symbols)
+
+
+class QuoteCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.provider = CountingProvider({'AAPL': 180.5, 'MSFT': 415.2, 'TSLA': 250.75})
+
+    def test_misses_are_fetched_in_one_batch_then_hit(self):
+        cache = QuoteCache(self.provider)
+        self.assertEqual(cache.get_quotes(['AAPL', 'MSFT', 'XYZ']),
+                         {'AAPL': 180.5, 'MSFT': 415.2})
+        self.assertEqual(cache.get_quotes(['AAPL', 'MSFT']), {'AAPL': 180.5, 'MSFT': 415.2})
+        self.assertEqual(self.provider.requests, [['AAPL', 'MSFT', 'XYZ']])
+        self.assertEqual((cache.hits, cache.misses), (2, 3))
+
+    def test_expired_quotes_are_fetched_again(self):
+        cache = QuoteCache(self.provider, ttl=0.01)
+        cache.get_quote('AAPL')
+        time.sleep(0.02)
+        cache.get_quote('AAPL')
+        self.assertEqual(self.provider.requests, [['AAPL'], ['AAPL']])
+
+    def test_least_recently_used_quote_is_evicted(self):
+        cache = QuoteCache(self.provider, max_size=2)
+        cache.get_quotes(['AAPL', 'MSFT'])
+        cache.get_quote('AAPL')
+        cache.get_quote('TSLA')
+        self.assertEqual(cache.evictions, 1)
+        cache.get_quotes(['AAPL', 'TSLA'])
+        self.assertEqual(len(self.provider.requests), 2)
+
+    def test_concurrent_requests_share_one_fetch(self):
+        cache = QuoteCache(self.provider)
+        self.provider.release.clear()
+        results = []
+        first = threading.Thread(target=lambda: results.append(cache.get_quote('AAPL')))
+        first.start()
+        self.provider.started.wait()
+        second = threading.Thread(target=lambda: results.append(cache.get_quote('AAPL')))
+        second.start()
+        while cache.coalesced == 0:
+            time.sleep(0.001)
+        self.provider.release.set()
+        first.join()
+        second.join()
+        self.assertEqual(results, [180.5, 180.5])
+        self.assertEqual(self.provider.requests, [['AAPL']])
+
+
+if __name__ == '__main__':
+    unittest.main()
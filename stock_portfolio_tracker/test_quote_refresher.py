@@ -0,0 +1,51 @@
+"""Tests for the asyncio quote refresher against the fake quote server."""
+
+import asyncio
+import unittest
+from unittest import mock
+
+from price_sources import StaticPriceProvider
+from quote_refresher import AsyncQuoteRefresher, FakeQuoteServer
+
+PRICES = {f"SYM{i:04d}": 10.0 + i for i in range(500)}
+
+
+async def _refresh(refresher_options, failure_rate=0.0, symbols=None):
+    """Fetch every price (and the symbol list, unless given) from a fresh fake server."""
+    server = FakeQuoteServer(StaticPriceProvider(PRICES), failure_rate=failure_rate, seed=3)
+    await server.start()
+    try:
+        refresher = AsyncQuoteRefresher(server.host, server.port, **refresher_options)
+        if symbols is None:
+            symbols = await refresher.fetch_symbols()
+        return await refresher.fetch_prices(symbols), refresher.stats
+    finally:
+        await server.stop()
+
+
+class AsyncQuoteRefresherTest(unittest.TestCase):
+
+    def test_full_table_arrives_despite_failures(self):
+        prices, stats = asyncio.run(_refresh({'batch_size': 20, 'concurrency': 4, 'retries': 10,
+                                              'backoff': 0.001}, failure_rate=0.3))
+        self.assertEqual(prices, PRICES)
+        self.assertEqual(stats['failed_batches'], 0)
+        self.assertGreater(stats['retries'], 0)
+
+    def test_rejects_empty_batches(self):
+        with self.assertRaises(ValueError):
+            AsyncQuoteRefresher('127.0.0.1', 1, batch_size=0)
+
+    def test_worker_error_stops_the_pipeline(self):
+        async def scenario():
+            with mock.patch.object(AsyncQuoteRefresher, '_request',
+                                   side_effect=RuntimeError("unexpected")):
+                with self.assertRaises(RuntimeError):
+                    await _refresh({'batch_size': 1, 'concurrency': 2}, symbols=list(PRICES))
+            return [task for task in asyncio.all_tasks()
+                    if task.get_coro().__name__ in ('_produce', '_worker')]
+        # No producer is left blocked on the full queue, and no worker on an empty one
+        self.assertEqual(asyncio.run(scenario()), [])
+
+if __name__ == '__main__':
+    unittest.main()
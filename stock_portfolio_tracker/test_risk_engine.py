@@ -0,0 +1,52 @@
+"""Tests for the Monte Carlo risk engine."""
+
+import unittest
+
+import numpy as np
+
+from price_sources import StaticPriceProvider
+from risk_engine import RiskModel, portfolio_risk, simulate_risk
+from stock_tracker import StockPortfolioTracker
+
+
+class RiskEngineTest(unittest.TestCase):
+
+    def setUp(self):
+        self.model = RiskModel(['AAPL', 'MSFT'], [0.0, 0.0], [[0.0004, 0.0001], [0.0001, 0.0009]])
+
+    def test_serial_and_parallel_results_are_identical(self):
+        options = {'scenarios': 20000, 'batch_size': 3000, 'shard_size': 7000, 'seed': 5}
+        serial = simulate_risk(self.model, [1000.0, 2000.0], **options)
+        parallel = simulate_risk(self.model, [1000.0, 2000.0], workers=2, **options)
+        for key in ('value_at_risk', 'expected_shortfall', 'mean_loss'):
+            self.assertEqual(serial[key], parallel[key])
+
+    def test_normal_tail_matches_closed_form(self):
+        model = RiskModel(['AAPL'], [0.0], [[0.01 ** 2]])
+        risk = simulate_risk(model, [1000.0], scenarios=400000, confidence=0.99)
+        # For a normal loss with sd 10: VaR = 2.3263 * 10, ES = 2.6652 * 10
+        self.assertAlmostEqual(risk['value_at_risk'], 23.263, delta=0.5)
+        self.assertAlmostEqual(risk['expected_shortfall'], 26.652, delta=0.6)
+
+    def test_rejects_bad_options(self):
+        for options in ({'scenarios': 0}, {'confidence': 1.0}, {'confidence': 0.0},
+                        {'confidence': float('nan')}, {'workers': -1}, {'batch_size': 0}):
+            with self.assertRaises(ValueError, msg=options):
+                simulate_risk(self.model, [1.0, 1.0], **options)
+
+    def test_portfolio_outside_the_model_is_rejected(self):
+        tracker = StockPortfolioTracker(price_source=StaticPriceProvider({'AAPL': 10.0,
+                                                                          'TSLA': 20.0}),
+                                        quote_ttl=None)
+        tracker.add_position('AAPL', 1)
+        tracker.add_position('TSLA', 1)
+        with self.assertRaises(ValueError):
+            portfolio_risk(tracker, self.model, scenarios=10)
+        tracker.remove_position('TSLA')
+        risk = portfolio_risk(tracker, self.model, scenarios=10)
+        self.assertEqual(risk['value'], 10.0)
+        self.assertTrue(np.isfinite(risk['value_at_risk']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+"""Tests for the running total, CSV import and binary portfolio snapshots of stock_tracker."""
+
+import os
+import tempfile
+import unittest
+
+import stock_tracker
+from stock_tracker import PortfolioSnapshot, StockPortfolioTracker, write_portfolio_snapshot
+
+
+class RunningTotalTest(unittest.TestCase):
+
+    def test_large_positions_leave_no_rounding_error(self):
+        tracker = StockPortfolioTracker(check_consistency=True)
+        tracker.add_position('AAPL', 1)
+        tracker.add_position('AMZN', 1000000000)
+        tracker.remove_position('AMZN', 999999999)
+        tracker.remove_position('AMZN')
+        self.assertEqual(tracker.calculate_portfolio_value(), 180.5)
+
+    def test_price_changes_keep_total_exact(self):
+        tracker = StockPortfolioTracker(check_consistency=True)
+        tracker.add_position('AAPL', 3)
+        tracker.add_position('TSLA', 10 ** 14)
+        tracker.update_stock_price('TSLA', 0.1)
+        tracker.remove_position('TSLA')
+        _, total = tracker.get_positions()
+        self.assertEqual(total, 541.5)
+
+    def test_rejects_prices_that_are_not_finite_or_negative(self):
+        tracker = StockPortfolioTracker(check_consistency=True)
+        tracker.add_position('AAPL', 2)
+        for price in (float('nan'), float('inf'), -1.0):
+            with self.assertRaises(ValueError):
+                tracker.update_stock_price('AAPL', price)
+        self.assertEqual(tracker.calculate_portfolio_value(), 361.0)
+
+
+@unittest.skipIf(stock_tracker.np is None, "NumPy is not installed")
+class ColumnarValuationTest(unittest.TestCase):
+
+    def test_columnar_rows_and_total_match_dict_loop(self):
+        count = 2 * stock_tracker.COLUMNAR_THRESHOLD
+        prices = {f"S{i}": 0.01 * (i + 1) + 0.001 for i in range(count)}
+        tracker = StockPortfolioTracker(price_source=stock_tracker.StaticPriceProvider(prices),
+                                        quote_ttl=None)
+        for i, symbol in enumerate(prices):
+            tracker.add_position(symbol, 3 ** (i % 30) + i)
+        for symbol in list(prices)[::3]:
+            tracker.remove_position(symbol)
+
+        self.assertTrue(tracker._use_columnar())
+        columnar = tracker.get_positions()
+        tracker._use_columnar = lambda: False
+        self.assertEqual(tracker.get_positions(), columnar)
+        self.assertEqual(tracker._value_positions(), columnar)
+
+
+class CsvImportTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.filename = os.path.join(self.directory.name, 'positions.csv')
+
+    def import_rows(self, text, tracker=None, **options):
+        with open(self.filename, 'w', encoding='utf-8') as csvfile:
+            csvfile.write(text)
+        tracker = tracker or StockPortfolioTracker(check_consistency=True)
+        return tracker, tracker.import_positions_from_csv(self.filename, **options)
+
+    def test_rows_are_aggregated_per_symbol(self):
+        tracker = StockPortfolioTracker(check_consistency=True)
+        tracker.add_position('AAPL', 1)
+        text = "Symbol,Quantity\naapl,2\nMSFT,\"1,000\"\nAAPL,3\nMSFT,-400\n"
+        tracker, stats = self.import_rows(text, tracker, chunk_size=2)
+        self.assertEqual(dict(tracker.portfolio), {'AAPL': 6, 'MSFT': 600})
+        self.assertEqual((stats['rows'], stats['rejected'], stats['symbols']), (4, 0, 2))
+
+    def test_unknown_symbols_and_bad_quantities_are_skipped(self):
+        text = "AAPL,2\nXYZ,5\nTSLA,many\n,\nTSLA,1\n"
+        tracker, stats = self.import_rows(text)
+        self.assertEqual(dict(tracker.portfolio), {'AAPL': 2, 'TSLA': 1})
+        self.assertEqual((stats['rows'], stats['rejected'], stats['symbols']), (5, 2, 2))
+
+
+class PortfolioSnapshotTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.directory.name, 'portfolio.pfsnap')
+        write_portfolio_snapshot(self.filename, [('AAPL', 3, 2.0), ('MSFT', 1, 5.0)])
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        with PortfolioSnapshot(self.filename) as snapshot:
+            self.assertEqual(list(snapshot.symbols()), ['AAPL', 'MSFT'])
+            self.assertEqual(list(snapshot.quantities), [3, 1])
+            self.assertEqual(snapshot.total_value(), 11.0)
+
+    def test_close_while_columns_are_held(self):
+        snapshot = PortfolioSnapshot(self.filename)
+        quantities = snapshot.quantities
+        snapshot.close()
+        self.assertTrue(snapshot._file.closed)
+        self.assertEqual(list(quantities), [3, 1])
+
+    def test_rejects_other_files(self):
+        with open(self.filename, 'wb') as snapfile:
+            snapfile.write(b'symbol,quantity\n' * 4)
+        with self.assertRaises(ValueError):
+            PortfolioSnapshot(self.filename)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+"""Tests for the symbol universe's prefix search and suggestions."""
+
+import os
+import tempfile
+import unittest
+
+from symbol_universe import SymbolUniverse
+
+COMPANIES = {
+    'AAPL': "Apple Inc.",
+    'AMZN': "Amazon.com Inc.",
+    'AMD': "Advanced Micro Devices",
+    'A': "Agilent Technologies",
+    'MSFT': "Microsoft Corporation",
+    'META': "Meta Platforms Inc.",
+    'TSLA': "Tesla Inc.",
+}
+
+
+class SymbolUniverseTest(unittest.TestCase):
+
+    def setUp(self):
+        self.universe = SymbolUniverse(COMPANIES)
+
+    def test_symbols_with_prefix(self):
+        self.assertEqual(self.universe.symbols_with_prefix('a'), ['A', 'AAPL', 'AMD', 'AMZN'])
+        self.assertEqual(self.universe.symbols_with_prefix('AM'), ['AMD', 'AMZN'])
+        self.assertEqual(self.universe.symbols_with_prefix('A', limit=2), ['A', 'AAPL'])
+        self.assertEqual(self.universe.symbols_with_prefix('X'), [])
+
+    def test_companies_with_prefix_and_search(self):
+        self.assertEqual(self.universe.companies_with_prefix('m'), ['META', 'MSFT'])
+        self.universe.add('MU', "Micron Technology")  # Added after the names were sorted
+        self.assertEqual(self.universe.companies_with_prefix('mic'), ['MU', 'MSFT'])
+        self.assertEqual(self.universe.search('ad'), ['AMD'])  # By company name only
+        self.assertEqual(self.universe.search('M'), ['META', 'MSFT', 'MU'])
+        self.assertEqual(self.universe.search('A', limit=2), ['A', 'AAPL'])
+
+    def test_suggest(self):
+        self.assertEqual(self.universe.suggest('APPL')[0], 'AAPL')
+        self.assertEqual(self.universe.suggest('microsft')[0], 'MSFT')
+        self.assertEqual(self.universe.suggest('TSL', limit=1), ['TSLA'])
+        self.assertEqual(self.universe.suggest('qqqq'), [])
+        self.assertEqual(self.universe.suggest('   '), [])
+
+    def test_from_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'listings.csv')
+            with open(filename, 'w', encoding='utf-8') as csvfile:
+                csvfile.write("Symbol,Company\nibm,IBM Corp\nAAPL,Apple Inc.\n,\nIBM,Duplicate\n")
+            universe = SymbolUniverse.from_file(filename)
+        self.assertEqual(len(universe), 2)
+        self.assertIn('IBM', universe)
+        self.assertEqual(universe.company('IBM'), "IBM Corp")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+"""Tests for the transaction ledger and portfolio recovery."""
+
+import contextlib
+import io
+import os
+import tempfile
+import time
+import unittest
+
+from price_sources import StaticPriceProvider
+from stock_tracker import StockPortfolioTracker
+from transaction_ledger import SEGMENT_PREFIX, SNAPSHOT_PREFIX, TransactionLedger
+
+
+class TransactionLedgerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)  # Runs after the ledgers are closed
+        self.path = self.directory.name
+
+    def open_ledger(self, **options):
+        ledger = TransactionLedger(self.path, **options)
+        self.addCleanup(ledger.close)
+        return ledger
+
+    def files(self, prefix):
+        return sorted(name for name in os.listdir(self.path) if name.startswith(prefix))
+
+    def test_snapshot_rollover(self):
+        ledger = self.open_ledger(snapshot_every=3)
+        portfolio = ledger.recover()
+        for i in range(7):
+            portfolio[f"S{i}"] = i + 1
+            ledger.record_set(f"S{i}", i + 1)
+            if ledger.snapshot_due():
+                ledger.write_snapshot(portfolio)
+        ledger.record_set('S0', 0)
+        del portfolio['S0']
+        ledger.close()
+
+        # Only the newest snapshot and the segment after it survive compaction
+        self.assertEqual(self.files(SNAPSHOT_PREFIX), ['snapshot-000000000006.json'])
+        self.assertEqual(self.files(SEGMENT_PREFIX), ['ledger-000000000007.log'])
+        recovered = self.open_ledger().recover()
+        self.assertEqual(recovered, portfolio)
+
+    def test_torn_final_record(self):
+        ledger = self.open_ledger()
+        ledger.recover()
+        ledger.record_set('AAPL', 5)
+        ledger.record_set('MSFT', 2)
+        segment = ledger._segment.name
+        ledger.close()
+        with open(segment, 'ab') as logfile:
+            logfile.write(b'[3, "S", "TSLA", 1]')  # Crash before the newline made it to disk
+
+        ledger = self.open_ledger()
+        self.assertEqual(ledger.recover(), {'AAPL': 5, 'MSFT': 2})
+        ledger.record_set('TSLA', 4)
+        ledger.close()
+        self.assertEqual(self.open_ledger().recover(), {'AAPL': 5, 'MSFT': 2, 'TSLA': 4})
+
+    def test_partial_batch_is_synced_by_timer(self):
+        ledger = self.open_ledger(sync_every=100, sync_interval=0.05)
+        ledger.recover()
+        ledger.sync()  # Start a fresh interval so the record below is batched
+        ledger.record_set('AAPL', 5)
+        self.assertEqual(ledger._pending, 1)
+        time.sleep(0.3)
+        self.assertEqual(ledger._pending, 0)
+        with open(ledger._segment.name, encoding='utf-8') as logfile:
+            self.assertEqual(logfile.read(), '[1, "S", "AAPL", 5]\n')
+
+    def test_symbols_with_spaces(self):
+        ledger = self.open_ledger()
+        ledger.recover()
+        ledger.record_set('BRK B', 3)
+        ledger.record_set('AAPL', 1)
+        ledger.close()
+        self.assertEqual(self.open_ledger().recover(), {'BRK B': 3, 'AAPL': 1})
+
+    def test_corrupt_interior_record_raises(self):
+        ledger = self.open_ledger()
+        ledger.recover()
+        ledger.record_set('AAPL', 5)
+        ledger.record_set('MSFT', 2)
+        segment = ledger._segment.name
+        ledger.close()
+        with open(segment, 'r+b') as logfile:
+            logfile.write(b'[1, "S", "AAPL" 5]')
+
+        with self.assertRaises(ValueError):
+            self.open_ledger().recover()
+        with open(segment, 'rb') as logfile:
+            self.assertIn(b'MSFT', logfile.read())  # Nothing was cut off
+
+    def test_tracker_keeps_unpriced_positions_in_ledger(self):
+        ledger = self.open_ledger()
+        ledger.recover()
+        ledger.record_set('AAPL', 5)
+        ledger.record_set('XYZ', 2)
+        ledger.close()
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            tracker = StockPortfolioTracker(price_source=StaticPriceProvider({'AAPL': 10.0}),
+                                            ledger=self.open_ledger(snapshot_every=1))
+        self.assertEqual(tracker.portfolio, {'AAPL': 5})
+        self.assertIn('XYZ', output.getvalue())
+
+        tracker.add_position('AAPL', 1)  # Logs a record and writes a snapshot
+        tracker.ledger.close()
+        self.assertEqual(self.files(SEGMENT_PREFIX), [])
+        self.assertEqual(self.open_ledger().recover(), {'AAPL': 6, 'XYZ': 2})
+
+
+if __name__ == '__main__':
+    unittest.main()
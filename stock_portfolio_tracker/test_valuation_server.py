@@ -0,0 +1,89 @@
+"""Tests for the valuation service, its HTTP server and the load test client."""
+
+import argparse
+import asyncio
+import unittest
+
+from load_test import ServiceClient, run_load_test
+from valuation_server import RequestError, ValuationServer, ValuationService
+
+
+class ValuationServiceTest(unittest.TestCase):
+
+    def setUp(self):
+        self.service = ValuationService({'AAPL': 10.0, 'MSFT': 20.0})
+
+    def test_value_and_batch_valuation(self):
+        self.service.handle('POST', '/accounts/a/positions', {'symbol': 'aapl', 'quantity': 3})
+        self.service.handle('POST', '/accounts/b/positions', {'symbol': 'MSFT', 'quantity': 2})
+        self.assertEqual(self.service.handle('GET', '/accounts/a/value', None)['total'], 30.0)
+        result = self.service.handle('POST', '/valuations', {'accounts': ['a', 'b', 'c']})
+        self.assertEqual(result, {'price_version': 0, 'totals': {'a': 30.0, 'b': 40.0, 'c': None}})
+
+    def test_price_version_swap(self):
+        self.service.handle('POST', '/accounts/a/positions', {'symbol': 'AAPL', 'quantity': 3})
+        self.assertEqual(self.service.handle('POST', '/prices', {'AAPL': 12.5}), {'version': 1})
+        result = self.service.handle('GET', '/accounts/a/value', None)
+        self.assertEqual((result['price_version'], result['total']), (1, 37.5))
+
+    def test_bad_requests_are_rejected(self):
+        bad_requests = [
+            ('POST', '/accounts/a/positions', {'symbol': 'AAPL', 'quantity': float('inf')}),
+            ('POST', '/accounts/a/positions', {'symbol': 'AAPL', 'quantity': 2 ** 63}),
+            ('POST', '/accounts/a/positions', {'symbol': 'AAPL', 'quantity': -1}),
+            ('POST', '/accounts/a/positions', {'symbol': 'NOPE', 'quantity': 1}),
+            ('POST', '/accounts/a/positions', {'quantity': 1}),
+            ('POST', '/prices', {'AAPL': float('nan')}),
+            ('POST', '/prices', {'AAPL': float('inf')}),
+            ('POST', '/prices', {'AAPL': -1.0}),
+            ('POST', '/prices', {'AAPL': '12'}),
+        ]
+        for method, path, body in bad_requests:
+            with self.assertRaises(RequestError) as caught:
+                self.service.handle(method, path, body)
+            self.assertEqual(caught.exception.status, 400, body)
+        self.assertEqual(self.service.accounts, {})  # No empty accounts were left behind
+        self.assertEqual(self.service.price_table.version, 0)
+
+
+class ValuationServerTest(unittest.TestCase):
+
+    def run_with_server(self, client_code):
+        async def scenario():
+            server = ValuationServer(ValuationService(), port=0)
+            await server.start()
+            try:
+                return await client_code(server)
+            finally:
+                await server.stop()
+        return asyncio.run(scenario())
+
+    def test_overflowing_quantity_keeps_connection(self):
+        async def client_code(server):
+            client = ServiceClient(server.host, server.port)
+            await client.connect()
+            try:
+                body = b'{"symbol": "AAPL", "quantity": 1e400}'
+                client._writer.write(b'POST /accounts/a/positions HTTP/1.1\r\n'
+                                     b'Content-Length: %d\r\n\r\n%s' % (len(body), body))
+                # The first reply answers the raw request above, the second the GET
+                first = await client.request('GET', '/prices')
+                second = await client._reader.readline()
+            finally:
+                await client.close()
+            return first, second
+        (status, body), second = self.run_with_server(client_code)
+        self.assertEqual(status, 400)
+        self.assertIn('Quantity', body['error'])
+        self.assertEqual(second, b'HTTP/1.1 200 OK\r\n')
+
+    def test_load_test_run(self):
+        args = argparse.Namespace(clients=3, requests=20, accounts=5, positions=2, batch_size=3,
+                                  batch_rate=0.2, price_update_rate=0.1, seed=1)
+        stats = self.run_with_server(lambda server: run_load_test(server.host, server.port, args))
+        self.assertEqual(stats['requests'], 60)
+        self.assertEqual(stats['errors'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
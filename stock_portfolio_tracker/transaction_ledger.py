@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Transaction Ledger - Stock Portfolio Tracker
+============================================
+
+Durable portfolio history: an append-only log plus periodic compacted snapshots.
+
+Every change to the portfolio is appended to the current log segment as one line
+holding a JSON array, so any symbol (even one with spaces) is stored unambiguously:
+
+    [<seq>, "S", "<SYMBOL>", <QUANTITY>]   the position in SYMBOL is now QUANTITY (0 removes it)
+    [<seq>, "C"]                           the portfolio was cleared
+
+Records are flushed and fsync'ed in batches rather than one by one: a batch is
+synced once it holds sync_every records, or by a background timer sync_interval
+seconds after its first record, whichever comes first. That bounds how much a
+crash can lose even when no further changes arrive. Every
+snapshot_every records the whole portfolio is written to a snapshot file and a new
+log segment is started, so recovery loads the newest snapshot and replays only the
+records written after it. A last line without its newline is a torn write from a
+crash and is cut off; any other record that cannot be read is corruption, and
+recovery raises ValueError rather than silently dropping the records after it.
+
+Author: CodeAlpha Intern
+Date: September 2025
+"""
+
+import json
+import os
+import threading
+import time
+
+SEGMENT_PREFIX = 'ledger-'
+SEGMENT_SUFFIX = '.log'
+SNAPSHOT_PREFIX = 'snapshot-'
+SNAPSHOT_SUFFIX = '.json'
+
+
+def _parse_record(line):
+    """Return (sequence, change) for one log line; change is None for a clear."""
+    record = json.loads(line)
+    if not isinstance(record, list) or not record or type(record[0]) is not int:
+        raise ValueError("not a ledger record")
+    if record[1:] == ['C']:
+        return record[0], None
+    if (len(record) == 4 and record[1] == 'S' and isinstance(record[2], str)
+            and type(record[3]) is int):
+        return record[0], (record[2], record[3])
+    raise ValueError("not a ledger record")
+
+
+def _sequence_of(filename, prefix, suffix):
+    """Return the sequence number encoded in a ledger file name, or None."""
+    if not (filename.startswith(prefix) and filename.endswith(suffix)):
+        return None
+    try:
+        return int(filename[len(prefix):-len(suffix)])
+    except ValueError:
+        return None
+
+
+class TransactionLedger:
+    """Append-only, fsync-batched log of portfolio changes with snapshots."""
+    
+    def __init__(self, directory, sync_every=100, sync_interval=1.0, snapshot_every=10000):
+        """Open (or create) a ledger directory."""
+        self.directory = directory
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.snapshot_every = snapshot_every
+        os.makedirs(directory, exist_ok=True)
+        
+        self.sequence = 0
+        self._records_since_snapshot = 0
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        self._segment = None
+        self._timer = None
+        self._lock = threading.RLock()  # The sync timer runs on its own thread
+    
+    def _files(self, prefix, suffix):
+        """Return [(sequence, path)] of ledger files of one kind, oldest first."""
+        found = []
+        for filename in os.listdir(self.directory):
+            sequence = _sequence_of(filename, prefix, suffix)
+            if sequence is not None:
+                found.append((sequence, os.path.join(self.directory, filename)))
+        return sorted(found)
+    
+    def recover(self):
+        """Rebuild the portfolio from the newest snapshot plus the log records after it.
+        
+        Must be called once before recording; returns the recovered portfolio dict.
+        """
+        portfolio = {}
+        snapshot_sequence = 0
+        
+        for sequence, path in reversed(self._files(SNAPSHOT_PREFIX, SNAPSHOT_SUFFIX)):
+            try:
+                with open(path, encoding='utf-8') as snapfile:
+                    snapshot = json.load(snapfile)
+                portfolio = snapshot['portfolio']
+                snapshot_sequence = snapshot['sequence']
+                break
+            except (OSError, ValueError, KeyError):
+                continue  # Half-written snapshot; fall back to the one before
+        
+        self.sequence = snapshot_sequence
+        for _, path in self._files(SEGMENT_PREFIX, SEGMENT_SUFFIX):
+            self._replay_segment(path, snapshot_sequence, portfolio)
+        
+        self._open_segment()
+        return portfolio
+    
+    def _replay_segment(self, path, snapshot_sequence, portfolio):
+        """Apply the records of one segment newer than the snapshot to portfolio."""
+        with open(path, 'rb') as segment:
+            data = segment.read()
+        
+        good_length = 0
+        for number, line in enumerate(data.splitlines(keepends=True), 1):
+            if not line.endswith(b'\n'):
+                # Torn write from a crash: cut it off so new records start on a clean line
+                with open(path, 'r+b') as segment:
+                    segment.truncate(good_length)
+                return
+            
+            try:
+                sequence, change = _parse_record(line)
+            except ValueError as e:  # Includes JSON and UTF-8 decoding errors
+                raise ValueError(f"Corrupt ledger record at {path} line {number}: {e}") from None
+            
+            good_length += len(line)
+            if sequence <= snapshot_sequence:
+                continue
+            if change is None:
+                portfolio.clear()
+            elif change[1] > 0:
+                portfolio[change[0]] = change[1]
+            else:
+                portfolio.pop(change[0], None)
+            self.sequence = sequence
+            self._records_since_snapshot += 1
+    
+    def _open_segment(self):
+        """Start a new log segment for the records after the current sequence."""
+        with self._lock:
+            if self._segment is not None:
+                self.sync()
+                self._segment.close()
+            name = f"{SEGMENT_PREFIX}{self.sequence + 1:012d}{SEGMENT_SUFFIX}"
+            self._segment = open(os.path.join(self.directory, name), 'a', encoding='utf-8')
+    
+    def _append(self, *change):
+        """Append one record; sync if the batch is full or old enough, else arm the timer."""
+        with self._lock:
+            self.sequence += 1
+            self._segment.write(json.dumps([self.sequence, *change]) + "\n")
+            self._pending += 1
+            self._records_since_snapshot += 1
+            
+            if (self._pending >= self.sync_every
+                    or time.monotonic() - self._last_sync >= self.sync_interval):
+                self.sync()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.sync_interval, self._sync_on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+    
+    def _sync_on_timer(self):
+        """Sync a batch that has waited sync_interval seconds without filling up."""
+        with self._lock:
+            self._timer = None
+            self.sync()
+    
+    def record_set(self, symbol, quantity):
+        """Record that the position in symbol is now quantity."""
+        self._append('S', symbol, quantity)
+    
+    def record_reset(self, portfolio):
+        """Record that the portfolio was replaced wholesale (cleared, then refilled)."""
+        self._append('C')
+        for symbol, quantity in portfolio.items():
+            self._append('S', symbol, quantity)
+    
+    def snapshot_due(self):
+        """Check whether enough records have built up to take a snapshot."""
+        return self._records_since_snapshot >= self.snapshot_every
+    
+    def write_snapshot(self, portfolio):
+        """Write a compacted snapshot, start a new segment and drop what it replaces."""
+        self.sync()
+        name = f"{SNAPSHOT_PREFIX}{self.sequence:012d}{SNAPSHOT_SUFFIX}"
+        path = os.path.join(self.directory, name)
+        temp_path = path + '.tmp'
+        
+        with open(temp_path, 'w', encoding='utf-8') as snapfile:
+            json.dump({'sequence': self.sequence, 'portfolio': portfolio}, snapfile)
+            snapfile.flush()
+            os.fsync(snapfile.fileno())
+        os.replace(temp_path, path)
+        
+        self._open_segment()
+        self._records_since_snapshot = 0
+        
+        # The rename and the new segment must be on disk before the old files go
+        self._sync_directory()
+        
+        # Everything older than the new snapshot is now redundant
+        current_segment = self._segment.name
+        for _, old_path in self._files(SEGMENT_PREFIX, SEGMENT_SUFFIX):
+            if old_path != current_segment:
+                os.remove(old_path)
+        for _, old_path in self._files(SNAPSHOT_PREFIX, SNAPSHOT_SUFFIX):
+            if old_path != path:
+                os.remove(old_path)
+    
+    def _sync_directory(self):
+        """fsync the ledger directory so renames and new files in it survive a crash."""
+        if os.name == 'nt':
+            return  # Windows cannot open a directory; its renames are already durable
+        fd = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    
+    def sync(self):
+        """Flush buffered records and fsync them to disk."""
+        with self._lock:
+            if self._segment is not None and self._pending:
+                self._segment.flush()
+                os.fsync(self._segment.fileno())
+            self._pending = 0
+            self._last_sync = time.monotonic()
+    
+    def close(self):
+        """Sync outstanding records and close the current segment."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._segment is not None:
+                self.sync()
+                empty = self._segment.tell() == 0
+                self._segment.close()
+                if empty:
+                    os.remove(self._segment.name)  # Nothing was logged this session
+                self._segment = None
\ No newline at end of file
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Valuation Server - Stock Portfolio Tracker
+==========================================
+
+A small asyncio HTTP/JSON service that serves many portfolios at once.
+
+Each account is a StockPortfolioTracker. Prices live in an immutable, versioned
+PriceTable: an update builds a new table and swaps the reference, so readers never
+take a lock and always see one consistent version. Accounts catch up with the
+current version lazily, the next time they are read. Connections are kept alive
+between requests, and POST /valuations values many accounts in one round trip.
+
+Endpoints:
+
+    GET    /prices                          current price table and its version
+    POST   /prices                          {"AAPL": 190.5, ...} -> new version
+    GET    /accounts/<id>/positions         positions with prices and values
+    POST   /accounts/<id>/positions         {"symbol": "AAPL", "quantity": 10}
+    DELETE /accounts/<id>/positions/<sym>   optional {"quantity": 5}
+    GET    /accounts/<id>/value             total value
+    POST   /valuations                      {"accounts": ["a", "b"]} -> totals
+
+Author: CodeAlpha Intern
+Date: September 2025
+"""
+
+import argparse
+import asyncio
+import json
+from collections import namedtuple
+from http import HTTPStatus
+
+from position_store import INT64_MAX
+from price_sources import StaticPriceProvider
+from stock_tracker import (DEFAULT_COMPANY_NAMES, DEFAULT_STOCK_PRICES, StockPortfolioTracker,
+                           check_price)
+from symbol_universe import SymbolUniverse
+
+# Largest request body the server will read
+MAX_BODY_SIZE = 1024 * 1024
+
+PriceTable = namedtuple('PriceTable', ['version', 'prices'])
+
+
+class RequestError(Exception):
+    """An error that maps directly onto an HTTP error response."""
+    
+    def __init__(self, status, message):
+        """Store the HTTP status to answer with alongside the message."""
+        super().__init__(message)
+        self.status = status
+
+
+def _quantity(value):
+    """Return a request quantity, which must be a positive JSON integer that fits in int64."""
+    if type(value) is not int or not 0 < value <= INT64_MAX:
+        raise ValueError(f"Quantity must be a positive whole number, not {value!r}")
+    return value
+
+
+def _price(symbol, value):
+    """Return a request price, which must be a finite, non-negative JSON number."""
+    if type(value) not in (int, float):
+        raise ValueError(f"Price for {symbol} must be a number, not {value!r}")
+    check_price(symbol, float(value))
+    return float(value)
+
+
+class ValuationService:
+    """Portfolios for many accounts valued against one shared, versioned price table."""
+    
+    def __init__(self, stock_prices=None):
+        """Start with the given prices (the built-in table by default) as version 0."""
+        self.price_table = PriceTable(0, dict(stock_prices or DEFAULT_STOCK_PRICES))
+        self.universe = SymbolUniverse(DEFAULT_COMPANY_NAMES)
+        self.accounts = {}
+        self._synced_versions = {}
+    
+    def update_prices(self, changes):
+        """Publish a new price table version with the given price changes applied."""
+        prices = dict(self.price_table.prices)
+        prices.update(changes)
+        self.price_table = PriceTable(self.price_table.version + 1, prices)
+        return self.price_table.version
+    
+    def account(self, account_id, create=False):
+        """Return an account's tracker, brought up to the current price version."""
+        tracker = self.accounts.get(account_id)
+        if tracker is None:
+            if not create:
+                raise RequestError(404, f"Account '{account_id}' not found")
+            provider = StaticPriceProvider(self.price_table.prices)
+            tracker = StockPortfolioTracker(price_source=provider, quote_ttl=None,
+                                            universe=self.universe)
+            self.accounts[account_id] = tracker
+            self._synced_versions[account_id] = None
+        
+        # Trackers read the shared table itself, so catching up copies no prices
+        table = self.price_table
+        if self._synced_versions[account_id] != table.version:
+            tracker.use_price_table(table.prices)
+            self._synced_versions[account_id] = table.version
+        return tracker
+    
+    def positions(self, account_id):
+        """Return an account's positions and total."""
+        tracker = self.account(account_id)
+        positions, total_value = tracker.get_positions()
+        return {
+            'account': account_id,
+            'price_version': self.price_table.version,
+            'positions': [{'symbol': stock, 'quantity': quantity, 'price': price, 'value': value}
+                          for stock, quantity, price, value in positions],
+            'total': total_value
+        }
+    
+    def value(self, account_id):
+        """Return an account's total value."""
+        return {
+            'account': account_id,
+            'price_version': self.price_table.version,
+            'total': self.account(account_id).calculate_portfolio_value()
+        }
+    
+    def value_many(self, account_ids):
+        """Return totals for a batch of accounts, all against the same price version."""
+        version = self.price_table.version
+        totals = {}
+        for account_id in account_ids:
+            if account_id in self.accounts:
+                totals[account_id] = self.account(account_id).calculate_portfolio_value()
+            else:
+                totals[account_id] = None
+        return {'price_version': version, 'totals': totals}
+    
+    def handle(self, method, path, body):
+        """Route one request to the service and return the JSON-ready response."""
+        parts = [part for part in path.split('?')[0].split('/') if part]
+        
+        try:
+            if parts == ['prices'] and method == 'GET':
+                return {'version': self.price_table.version, 'prices': self.price_table.prices}
+            if parts == ['prices'] and method == 'POST':
+                changes = {symbol.upper(): _price(symbol, price) for symbol, price in body.items()}
+                return {'version': self.update_prices(changes)}
+            if parts == ['valuations'] and method == 'POST':
+                return self.value_many(body['accounts'])
+            
+            if len(parts) >= 3 and parts[0] == 'accounts':
+                account_id = parts[1]
+                if parts[2:] == ['value'] and method == 'GET':
+                    return self.value(account_id)
+                if parts[2:] == ['positions'] and method == 'GET':
+                    return self.positions(account_id)
+                if parts[2:] == ['positions'] and method == 'POST':
+                    # Validate first, so a bad request cannot leave an empty account behind
+                    symbol = body['symbol'].upper()
+                    quantity = _quantity(body['quantity'])
+                    if symbol not in self.price_table.prices:
+                        raise ValueError(f"Stock symbol '{symbol}' not found in our database")
+                    self.account(account_id, create=True).add_position(symbol, quantity)
+                    return self.value(account_id)
+                if len(parts) == 4 and parts[2] == 'positions' and method == 'DELETE':
+                    quantity = body.get('quantity') if body else None
+                    self.account(account_id).remove_position(
+                        parts[3], None if quantity is None else _quantity(quantity))
+                    return self.value(account_id)
+        except (KeyError, TypeError, AttributeError):
+            raise RequestError(400, "Malformed request body")
+        except (ValueError, OverflowError) as e:
+            raise RequestError(400, str(e))
+        
+        raise RequestError(404, f"No route for {method} {path}")
+
+
+async def _read_request(reader):
+    """Read one HTTP request; return (method, path, headers, body) or None at EOF."""
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    
+    method, path, _ = request_line.decode('latin-1').split(' ', 2)
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    
+    length = int(headers.get('content-length', 0))
+    if length > MAX_BODY_SIZE:
+        raise RequestError(413, "Request body too large")
+    body = await reader.readexactly(length) if length else b''
+    return method, path, headers, body
+
+
+def _response(status, payload, keep_alive):
+    """Encode a JSON HTTP response."""
+    body = json.dumps(payload).encode('utf-8')
+    connection = 'keep-alive' if keep_alive else 'close'
+    head = (f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+            f"Connection: {connection}\r\n\r\n")
+    return head.encode('ascii') + body
+
+
+class ValuationServer:
+    """Serve a ValuationService over HTTP/1.1 with keep-alive connections."""
+    
+    def __init__(self, service, host='127.0.0.1', port=8080):
+        """Wrap a service; a port of 0 picks a free port when started."""
+        self.service = service
+        self.host = host
+        self.port = port
+        self.requests = 0
+        self._server = None
+        self._connections = {}  # Handler task -> its writer
+    
+    async def start(self):
+        """Start listening; the bound port is stored in self.port."""
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+    
+    async def stop(self):
+        """Stop accepting connections, close open ones and wait for their handlers."""
+        self._server.close()
+        await self._server.wait_closed()
+        for writer in self._connections.values():
+            writer.close()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+    
+    async def _handle_connection(self, reader, writer):
+        """Answer requests on one connection until the client closes it."""
+        self._connections[asyncio.current_task()] = writer
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader)
+                    if request is None:
+                        break
+                    method, path, headers, body = request
+                    keep_alive = headers.get('connection', '').lower() != 'close'
+                    payload = json.loads(body.decode('utf-8')) if body else None
+                    status, result = 200, self.service.handle(method, path, payload)
+                except RequestError as e:
+                    status, result, keep_alive = e.status, {'error': str(e)}, e.status != 413
+                except ValueError:
+                    status, result, keep_alive = 400, {'error': "Invalid request"}, False
+                
+                self.requests += 1
+                writer.write(_response(status, result, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            del self._connections[asyncio.current_task()]
+            writer.close()
+
+
+async def serve(host, port, demo_accounts):
+    """Run the service until interrupted."""
+    service = ValuationService()
+    for i in range(demo_accounts):
+        tracker = service.account(f"demo{i}", create=True)
+        for symbol, quantity in (("AAPL", 10), ("TSLA", 5), ("GOOGL", 2)):
+            tracker.add_position(symbol, quantity)
+    
+    server = ValuationServer(service, host, port)
+    await server.start()
+    print(f"📡 Valuation service listening on http://{server.host}:{server.port}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main():
+    """Start the valuation service from the command line."""
+    parser = argparse.ArgumentParser(description="Serve portfolio valuations over HTTP/JSON.")
+    parser.add_argument('--host', default='127.0.0.1', help="address to listen on")
+    parser.add_argument('--port', type=int, default=8080, help="port to listen on")
+    parser.add_argument('--demo-accounts', type=int, default=0,
+                        help="preload this many accounts (demo0, demo1, ...) with demo positions")
+    args = parser.parse_args()
+    
+    try:
+        asyncio.run(serve(args.host, args.port, args.demo_accounts))
+    except KeyboardInterrupt:
+        print("\n👋 Valuation service stopped.")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file